@@ -0,0 +1,35 @@
+"""
+NEO-PI 문항 은행(questions.ts)을 미리 파싱해서 언어별 questions.json을 만듭니다.
+
+    python -m app.commands.build_question_bank
+    python -m app.commands.build_question_bank --language ko
+
+없어도 동작하지만(처음 사용할 때 questions.ts를 파싱), 이미지 빌드 시 만들어 두면
+worker마다 정규식 파싱을 건너뜁니다. questions.ts가 바뀌면 자동으로 무시됩니다.
+"""
+
+import argparse
+import logging
+
+from app.features.analysis.comprehensive_analysis.question_bank import (
+    LANGUAGES,
+    build_artifacts,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Prebuild NEO-PI question banks")
+    parser.add_argument(
+        "--language", action="append", choices=LANGUAGES, help="default: all"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    for path in build_artifacts(tuple(args.language or LANGUAGES)):
+        logging.info(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
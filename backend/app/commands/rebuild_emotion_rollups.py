@@ -0,0 +1,41 @@
+"""
+journal_emotions 전체로 emotion_daily_rollups(감정 일별 집계)를 다시 만듭니다.
+
+    python -m app.commands.rebuild_emotion_rollups
+    python -m app.commands.rebuild_emotion_rollups --batch-size 500
+
+rollup 테이블을 처음 만든 뒤(기존 journal backfill) 또는 집계가 어긋났을 때
+실행합니다. 실행 중 저장/삭제된 journal은 반영되지 않을 수 있으니 트래픽이
+적을 때 실행합니다.
+"""
+
+import argparse
+import logging
+import time
+
+from app.database.session import SessionLocal
+from app.features.statistics.repository import StatisticsRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rebuild daily emotion rollups from journal emotions"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help="rollup rows per INSERT"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    started = time.monotonic()
+    with SessionLocal() as session:
+        rebuilt = StatisticsRepository(session).rebuild_emotion_rollups(args.batch_size)
+    logging.info(
+        f"Rebuilt {rebuilt} emotion rollups in {time.monotonic() - started:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+journal_keywords 전체로 키워드 역색인(keywords, journal_keyword_postings)을 다시 만듭니다.
+
+    python -m app.commands.rebuild_keyword_index
+    python -m app.commands.rebuild_keyword_index --batch-size 500
+
+역색인 테이블을 처음 만든 뒤(기존 journal backfill) 또는 색인이 어긋났을 때
+실행합니다. 실행 중 저장된 키워드는 반영되지 않을 수 있으니 트래픽이 적을 때
+실행합니다.
+"""
+
+import argparse
+import logging
+import time
+
+from app.database.session import SessionLocal
+from app.features.journal.repository import JournalRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rebuild the keyword dictionary and postings from journal keywords"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help="keywords per INSERT"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    started = time.monotonic()
+    with SessionLocal() as session:
+        rebuilt = JournalRepository(session).rebuild_keyword_index(args.batch_size)
+    logging.info(
+        f"Rebuilt {rebuilt} keyword postings in {time.monotonic() - started:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+value_scores 전체로 value_maps의 score_i/count_i를 다시 계산합니다.
+
+    python -m app.commands.rebuild_value_maps
+    python -m app.commands.rebuild_value_maps --batch-size 500
+
+집계 방식이 바뀌었거나 value_map이 어긋났을 때 실행합니다. (comment는 유지)
+"""
+
+import argparse
+import logging
+import time
+
+from app.database.session import SessionLocal
+from app.features.selfaware.repository import ValueMapRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild value maps from value scores")
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help="value maps per UPDATE/INSERT"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    started = time.monotonic()
+    with SessionLocal() as session:
+        rebuilt = ValueMapRepository(session).rebuild_value_maps(args.batch_size)
+    logging.info(f"Rebuilt {rebuilt} value maps in {time.monotonic() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+저장된 NEO-PI 응답 벡터(analysis.neo_pi_answers)로 모든 사용자의
+neo_pi_score/user_type을 다시 계산합니다. LLM은 호출하지 않습니다.
+
+    python -m app.commands.rescore_analysis
+    python -m app.commands.rescore_analysis --chunk-size 5000
+
+규준(evaluator.NORMS)이나 classify_user_type 기준이 바뀌었을 때 실행합니다.
+neo_pi_answers가 없는(이전에 분석된) 사용자는 다음 분석 갱신 때부터 포함됩니다.
+"""
+
+import argparse
+import logging
+import time
+
+from app.database.session import SessionLocal
+from app.features.analysis.di import get_analysis_service
+from app.features.analysis.repository import AnalysisRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-score stored NEO-PI answers")
+    parser.add_argument(
+        "--chunk-size", type=int, default=1000, help="analyses per SELECT/UPDATE"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    started = time.monotonic()
+    with SessionLocal() as session:
+        total = AnalysisRepository(session).count_neo_pi_answers()
+        logging.info(f"Re-scoring {total} analyses")
+
+        def report(processed: int) -> None:
+            elapsed = time.monotonic() - started
+            logging.info(
+                f"{processed}/{total} analyses "
+                f"({processed / elapsed if elapsed else 0:.0f} rows/s)"
+            )
+
+        processed = get_analysis_service(session).rescore_all(
+            args.chunk_size, on_progress=report
+        )
+
+    elapsed = time.monotonic() - started
+    logging.info(f"Re-scored {processed} analyses in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
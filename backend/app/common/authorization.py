@@ -19,7 +19,7 @@ def get_current_user(
     payload = auth_service.validate_access_token(token)
     login_id: str = payload.get("sub")
 
-    user = user_service.get_user_by_login_id(login_id)
+    user = user_service.get_authenticated_user(login_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
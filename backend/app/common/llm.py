@@ -0,0 +1,59 @@
+"""
+OpenAI 클라이언트 접근 함수.
+
+langchain_openai/openai/httpx는 import 비용이 커서(수백 ms) 모듈 로드 시점이 아니라
+처음 클라이언트를 사용할 때 불러옵니다. 클라이언트는 프로세스 단위 registry
+(app.common.llm_clients)에서 공유하며, FastAPI lifespan 종료 시 연결 풀을 닫습니다.
+서비스 코드는 ChatOpenAI를 직접 만들지 않고 이 함수들을 사용합니다.
+
+    llm = chat_model("gpt-5-nano", cache=llm_cache("big_5_comment"))
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+    from openai import AsyncOpenAI
+
+    from app.common.llm_clients import LLMClientRegistry
+
+
+class LLMClients:
+    """registry를 처음 사용할 때 만들고, close 후 다시 사용하면 새로 만듭니다."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._registry: LLMClientRegistry | None = None
+
+    def get(self) -> LLMClientRegistry:
+        with self._lock:
+            if self._registry is None:
+                from app.common.llm_clients import LLMClientRegistry
+
+                self._registry = LLMClientRegistry.from_settings()
+            return self._registry
+
+    async def aclose(self) -> None:
+        with self._lock:
+            registry, self._registry = self._registry, None
+        if registry is not None:
+            await registry.aclose()
+
+    def stats(self) -> dict:
+        # 아직 사용하지 않았으면 registry를 만들지 않습니다.
+        registry = self._registry
+        return registry.stats() if registry is not None else {}
+
+
+llm_clients = LLMClients()
+
+
+def chat_model(model: str, **kwargs: Any) -> ChatOpenAI:
+    return llm_clients.get().chat_model(model, **kwargs)
+
+
+def async_openai_client() -> AsyncOpenAI:
+    return llm_clients.get().async_openai()
@@ -0,0 +1,273 @@
+import hashlib
+import logging
+import threading
+import time
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, Generation
+from pydantic import BaseModel
+from sqlalchemy import DateTime, String, Text, create_engine, delete, select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Mapped, mapped_column, sessionmaker
+
+from app.common.ttl_cache import InMemoryTTLCache
+from app.core.config import settings
+from app.database.base import Base
+from app.database.session import engine as default_engine
+
+logger = logging.getLogger(__name__)
+
+# 만료된 DB 캐시 행은 쓰기 시점에 이 주기로 정리합니다.
+DB_PURGE_INTERVAL_SECONDS = 3600
+
+# DB tier 행은 다른 프로세스도 쓸 수 있으므로 캐시에 저장하는 클래스만 역직렬화합니다.
+ALLOWED_CACHE_OBJECTS = (Generation, ChatGeneration, AIMessage)
+
+
+def utcnow() -> datetime:
+    # created_at/expires_at 컬럼은 timezone 없는 UTC 값으로 저장됩니다.
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class LLMCacheEntry(Base):
+    __tablename__ = "llm_cache"
+
+    # sha256(namespace + llm 설정 + 렌더링된 prompt)
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    namespace: Mapped[str] = mapped_column(String(50), nullable=False)
+    value: Mapped[str] = mapped_column(
+        Text().with_variant(mysql.MEDIUMTEXT(), "mysql"), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=utcnow
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+
+
+class LLMCacheStats:
+    """namespace(chain)별 hit/miss 카운터 (프로세스 단위)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[str, int]] = {}
+
+    def increment(self, namespace: str, name: str) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(
+                namespace,
+                {"memory_hits": 0, "db_hits": 0, "misses": 0, "writes": 0},
+            )
+            counters[name] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            result = {}
+            for namespace, counters in self._counters.items():
+                hits = counters["memory_hits"] + counters["db_hits"]
+                lookups = hits + counters["misses"]
+                result[namespace] = {
+                    **counters,
+                    "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                }
+            return result
+
+
+class DatabaseCacheTier:
+    """
+    영속 캐시 (llm_cache 테이블). 재시작/여러 worker 사이에서 공유됩니다.
+    DB 오류는 캐시 miss로 처리해서 LLM 호출 자체를 막지 않습니다.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self.session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+        self._last_purge = time.monotonic()
+
+    def get(self, key: str) -> str | None:
+        try:
+            with self.session_factory() as session:
+                return session.scalar(
+                    select(LLMCacheEntry.value).where(
+                        LLMCacheEntry.key == key, LLMCacheEntry.expires_at > utcnow()
+                    )
+                )
+        except SQLAlchemyError as e:
+            logger.warning(f"LLM cache lookup failed: {e}")
+            return None
+
+    def set(self, key: str, namespace: str, value: str, ttl_seconds: float) -> None:
+        now = utcnow()
+        try:
+            with self.session_factory() as session:
+                session.merge(
+                    LLMCacheEntry(
+                        key=key,
+                        namespace=namespace,
+                        value=value,
+                        created_at=now,
+                        expires_at=now + timedelta(seconds=ttl_seconds),
+                    )
+                )
+                if time.monotonic() - self._last_purge >= DB_PURGE_INTERVAL_SECONDS:
+                    self._last_purge = time.monotonic()
+                    session.execute(
+                        delete(LLMCacheEntry).where(LLMCacheEntry.expires_at <= now)
+                    )
+                session.commit()
+        except SQLAlchemyError as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def clear(self, namespace: str) -> None:
+        with self.session_factory() as session:
+            session.execute(
+                delete(LLMCacheEntry).where(LLMCacheEntry.namespace == namespace)
+            )
+            session.commit()
+
+
+def deserialize_generations(raw: str) -> list[Generation]:
+    return loads(raw, allowed_objects=ALLOWED_CACHE_OBJECTS, secrets_from_env=False)
+
+
+def serialize_generations(generations: Sequence[Generation]) -> str:
+    # structured output의 parsed(pydantic 객체)는 dict로 바꿔서 저장 (parser가 dict도 처리)
+    serializable = []
+    for generation in generations:
+        if isinstance(generation, ChatGeneration):
+            parsed = generation.message.additional_kwargs.get("parsed")
+            if isinstance(parsed, BaseModel):
+                message = generation.message.model_copy(deep=True)
+                message.additional_kwargs["parsed"] = parsed.model_dump()
+                generation = ChatGeneration(
+                    message=message, generation_info=generation.generation_info
+                )
+        serializable.append(generation)
+    return dumps(serializable)
+
+
+class LLMResultCache(BaseCache):
+    """
+    LangChain chat model용 2단계 캐시 (메모리 TTL LRU -> DB).
+    chain마다 namespace를 나눠 TTL과 hit rate를 따로 관리합니다.
+
+        chat_model("gpt-5-nano", cache=llm_cache("opposite_value"))
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl_seconds: float,
+        memory: InMemoryTTLCache,
+        database: DatabaseCacheTier | Callable[[], DatabaseCacheTier | None] | None,
+        stats: LLMCacheStats,
+        accept: Callable[[Sequence[Generation]], bool] | None = None,
+    ) -> None:
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.memory = memory
+        self._database = database
+        self.stats = stats
+        # False를 반환하는 결과(예: 개수가 틀린 응답)는 저장하지 않습니다.
+        self.accept = accept
+
+    @property
+    def database(self) -> DatabaseCacheTier | None:
+        # llm_cache()는 DB tier를 처음 쓸 때 만들도록 database_tier 함수를 넘깁니다.
+        if callable(self._database):
+            return self._database()
+        return self._database
+
+    def key(self, prompt: str, llm_string: str) -> str:
+        content = f"{self.namespace}\x00{llm_string}\x00{prompt}"
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        key = self.key(prompt, llm_string)
+        cached = self.memory.get(key)
+        if cached is not None:
+            self.stats.increment(self.namespace, "memory_hits")
+            return cached
+        database = self.database
+        if database is not None:
+            raw = database.get(key)
+            if raw is not None:
+                generations = deserialize_generations(raw)
+                self.memory.set(key, generations, self.ttl_seconds)
+                self.stats.increment(self.namespace, "db_hits")
+                return generations
+        self.stats.increment(self.namespace, "misses")
+        return None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        if self.accept is not None and not self.accept(return_val):
+            return
+        key = self.key(prompt, llm_string)
+        self.memory.set(key, return_val, self.ttl_seconds)
+        database = self.database
+        if database is not None:
+            database.set(
+                key, self.namespace, serialize_generations(return_val), self.ttl_seconds
+            )
+        self.stats.increment(self.namespace, "writes")
+
+    def clear(self, **kwargs: Any) -> None:
+        # 메모리 tier는 namespace 구분 없이 공유하므로 전체를 비웁니다.
+        self.memory.clear()
+        database = self.database
+        if database is not None:
+            database.clear(self.namespace)
+
+
+def _build_database_tier(engine: Engine = default_engine) -> DatabaseCacheTier | None:
+    """LLM_CACHE_DATABASE_URL이 없으면 engine(기본: 앱 DB)의 llm_cache 테이블 사용"""
+    if not settings.LLM_CACHE_DB_ENABLED:
+        return None
+    if settings.LLM_CACHE_DATABASE_URL:
+        # 별도 DB(로컬 SQLite 파일 등)는 테이블을 직접 만듭니다.
+        cache_engine = create_engine(settings.LLM_CACHE_DATABASE_URL)
+        LLMCacheEntry.__table__.create(cache_engine, checkfirst=True)
+        return DatabaseCacheTier(cache_engine)
+    return DatabaseCacheTier(engine)
+
+
+llm_cache_stats = LLMCacheStats()
+_memory_tier = InMemoryTTLCache(settings.LLM_CACHE_MEMORY_MAX_SIZE)
+_database_tier: DatabaseCacheTier | None = None
+_database_tier_ready = False
+_database_tier_lock = threading.Lock()
+
+
+def database_tier() -> DatabaseCacheTier | None:
+    """
+    DB tier는 처음 조회/저장할 때 만듭니다.
+    (import 시점에 별도 캐시 DB 엔진/테이블을 만들지 않도록)
+    """
+    global _database_tier, _database_tier_ready
+    if not _database_tier_ready:
+        with _database_tier_lock:
+            if not _database_tier_ready:
+                _database_tier = _build_database_tier()
+                _database_tier_ready = True
+    return _database_tier
+
+
+def llm_cache(
+    namespace: str,
+    accept: Callable[[Sequence[Generation]], bool] | None = None,
+) -> LLMResultCache | None:
+    """
+    chat model의 cache 인자로 넘길 캐시를 반환합니다.
+    TTL이 0이거나 설정되지 않은 chain(매번 다른 결과가 필요한 질문 생성 등)은 None(캐시 안 함)입니다.
+    """
+    ttl_seconds = settings.LLM_CACHE_TTL_SECONDS.get(namespace, 0)
+    if not settings.LLM_CACHE_ENABLED or ttl_seconds <= 0:
+        return None
+    return LLMResultCache(
+        namespace, ttl_seconds, _memory_tier, database_tier, llm_cache_stats, accept
+    )
@@ -0,0 +1,205 @@
+"""
+앱 단위로 공유하는 OpenAI 클라이언트 registry.
+
+모든 ChatOpenAI/AsyncOpenAI가 하나의 httpx 연결 풀(sync/async 각각)을 공유하고,
+요청 body의 model 값으로 모델별 동시 요청 수를 제한합니다.
+생성/종료는 app.common.llm에서 관리합니다. (FastAPI lifespan 종료 시 close)
+"""
+
+import asyncio
+import json
+import threading
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any
+
+import httpx
+from langchain_core.caches import BaseCache
+from langchain_openai import ChatOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient
+
+from app.core.config import settings
+
+# model을 알 수 없는 요청(multipart 업로드 등)은 이 키의 제한을 따릅니다.
+DEFAULT_MODEL_KEY = "*"
+
+
+def request_model(request: httpx.Request) -> str:
+    try:
+        body = json.loads(request.content)
+    except (httpx.RequestNotRead, ValueError):
+        return DEFAULT_MODEL_KEY
+    model = body.get("model") if isinstance(body, dict) else None
+    return model if isinstance(model, str) else DEFAULT_MODEL_KEY
+
+
+class ModelConcurrencyLimiter:
+    """
+    모델별 동시 요청 수 제한. 스레드(sync client)와 이벤트 루프(async client)는
+    각각 별도의 semaphore로 제한합니다.
+    """
+
+    def __init__(self, limits: dict[str, int], default_limit: int) -> None:
+        self.limits = dict(limits)
+        self.default_limit = default_limit
+        self._lock = threading.Lock()
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._async_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._in_flight: dict[str, int] = {}
+
+    def limit_for(self, model: str) -> int:
+        return self.limits.get(model, self.default_limit)
+
+    def _semaphore(self, model: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if model not in self._semaphores:
+                self._semaphores[model] = threading.BoundedSemaphore(
+                    self.limit_for(model)
+                )
+            return self._semaphores[model]
+
+    def _async_semaphore(self, model: str) -> asyncio.Semaphore:
+        with self._lock:
+            if model not in self._async_semaphores:
+                self._async_semaphores[model] = asyncio.Semaphore(self.limit_for(model))
+            return self._async_semaphores[model]
+
+    def _track(self, model: str, delta: int) -> None:
+        with self._lock:
+            self._in_flight[model] = self._in_flight.get(model, 0) + delta
+
+    @contextmanager
+    def hold(self, model: str) -> Iterator[None]:
+        semaphore = self._semaphore(model)
+        with semaphore:
+            self._track(model, 1)
+            try:
+                yield
+            finally:
+                self._track(model, -1)
+
+    @asynccontextmanager
+    async def hold_async(self, model: str) -> AsyncIterator[None]:
+        async with self._async_semaphore(model):
+            self._track(model, 1)
+            try:
+                yield
+            finally:
+                self._track(model, -1)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                model: {"limit": self.limit_for(model), "in_flight": in_flight}
+                for model, in_flight in self._in_flight.items()
+            }
+
+
+class ConcurrencyLimitedTransport(httpx.BaseTransport):
+    # 응답 헤더를 받을 때까지 slot을 잡습니다. (non-streaming 응답은 생성이 끝난 뒤 옴)
+    def __init__(
+        self, transport: httpx.BaseTransport, limiter: ModelConcurrencyLimiter
+    ) -> None:
+        self.transport = transport
+        self.limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self.limiter.hold(request_model(request)):
+            return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncConcurrencyLimitedTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, limiter: ModelConcurrencyLimiter
+    ) -> None:
+        self.transport = transport
+        self.limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async with self.limiter.hold_async(request_model(request)):
+            return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class LLMClientRegistry:
+    """
+    ChatOpenAI는 (model, 캐시 namespace, 옵션)별로 한 번만 만들어 재사용하고,
+    AsyncOpenAI는 하나를 공유합니다. 모두 같은 연결 풀과 동시 요청 제한을 사용합니다.
+    """
+
+    def __init__(
+        self,
+        limiter: ModelConcurrencyLimiter,
+        max_connections: int,
+        max_keepalive_connections: int,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        pool_limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self.limiter = limiter
+        self.http_client = DefaultHttpxClient(
+            transport=ConcurrencyLimitedTransport(
+                transport or httpx.HTTPTransport(limits=pool_limits), limiter
+            )
+        )
+        self.async_http_client = DefaultAsyncHttpxClient(
+            transport=AsyncConcurrencyLimitedTransport(
+                async_transport or httpx.AsyncHTTPTransport(limits=pool_limits),
+                limiter,
+            )
+        )
+        self._lock = threading.Lock()
+        self._chat_models: dict[tuple, ChatOpenAI] = {}
+        self._async_openai: AsyncOpenAI | None = None
+
+    @classmethod
+    def from_settings(cls) -> "LLMClientRegistry":
+        return cls(
+            ModelConcurrencyLimiter(
+                settings.LLM_MODEL_CONCURRENCY, settings.LLM_DEFAULT_CONCURRENCY
+            ),
+            settings.LLM_HTTP_MAX_CONNECTIONS,
+            settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        )
+
+    def chat_model(
+        self, model: str, cache: BaseCache | None = None, **kwargs: Any
+    ) -> ChatOpenAI:
+        # llm_cache(namespace)는 호출마다 새 객체지만 같은 namespace면 동작이 같습니다.
+        key = (model, getattr(cache, "namespace", None), tuple(sorted(kwargs.items())))
+        with self._lock:
+            llm = self._chat_models.get(key)
+            if llm is None:
+                # 기본 클라이언트일 때처럼 stream_usage를 켜서 캐시 키(llm_string)를 유지합니다.
+                llm = ChatOpenAI(
+                    model=model,
+                    cache=cache,
+                    http_client=self.http_client,
+                    http_async_client=self.async_http_client,
+                    **({"stream_usage": True} | kwargs),
+                )
+                self._chat_models[key] = llm
+            return llm
+
+    def async_openai(self) -> AsyncOpenAI:
+        with self._lock:
+            if self._async_openai is None:
+                self._async_openai = AsyncOpenAI(http_client=self.async_http_client)
+            return self._async_openai
+
+    def stats(self) -> dict:
+        with self._lock:
+            chat_models = len(self._chat_models)
+        return {"chat_models": chat_models, "models": self.limiter.snapshot()}
+
+    async def aclose(self) -> None:
+        await self.async_http_client.aclose()
+        self.http_client.close()
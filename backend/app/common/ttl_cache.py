@@ -0,0 +1,57 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class InMemoryTTLCache:
+    """
+    프로세스 내부 TTL LRU. 항목마다 TTL을 따로 지정할 수 있습니다.
+    worker마다 따로 존재하므로 다른 worker의 삭제는 TTL이 지나야 반영됩니다.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                # 가득 차면 만료된 항목부터 비우고, 그래도 넘치면 LRU 순서로 제거
+                self._purge_expired()
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        expired = [
+            k for k, (expires_at, _) in self._entries.items() if expires_at <= now
+        ]
+        for key in expired:
+            del self._entries[key]
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
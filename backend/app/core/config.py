@@ -1,3 +1,4 @@
+import logging
 import os
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -27,10 +28,88 @@ class Settings(BaseSettings):
 
     DATABASE_URL: str
 
+    # Connection pool (engine 하나당, 즉 uvicorn worker 하나당 적용)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 3600
+    # True: checkout마다 ping (끊긴 커넥션 즉시 감지, 대신 왕복 1회 추가)
+    # False: pool_recycle에만 의존 (MySQL wait_timeout보다 짧게 유지할 것)
+    DB_POOL_PRE_PING: bool = True
+
+    # /internal/* 엔드포인트 접근 토큰 (미설정 시 비활성화)
+    INTERNAL_METRICS_TOKEN: str | None = None
+
+    # 인증 사용자 캐시 (get_current_user). TTL 0이면 비활성화
+    # REDIS_URL을 지정하면 worker 간 공유 캐시를 사용 (redis 선택 의존성 필요)
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 1024
+    USER_CACHE_REDIS_URL: str | None = None
+
+    # 차단된 refresh token 인덱스 (bloom filter) 및 만료 토큰 정리
+    BLOCKED_TOKEN_INDEX_ENABLED: bool = True
+    BLOCKED_TOKEN_INDEX_CAPACITY: int = 100_000
+    BLOCKED_TOKEN_INDEX_ERROR_RATE: float = 0.001
+    # 다른 worker에서 차단한 토큰이 이 worker에 반영되기까지의 최대 지연.
+    # 의도한 trade-off: 이 시간 동안은 다른 worker에서 로그아웃한 refresh token이
+    # 이 worker에서 아직 통과할 수 있습니다. (filter에 없으면 DB를 조회하지 않으므로)
+    # 즉시 차단이 필요하면 값을 줄이거나 BLOCKED_TOKEN_INDEX_ENABLED=false로 항상 DB 조회
+    BLOCKED_TOKEN_SYNC_SECONDS: float = 5.0
+    BLOCKED_TOKEN_SWEEP_SECONDS: int = 3600
+    BLOCKED_TOKEN_SWEEP_BATCH_SIZE: int = 1000
+
+    # DB job queue (python -m app.worker)
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETRY_BASE_SECONDS: float = 30.0
+    JOB_RETRY_MAX_SECONDS: float = 600.0
+    # running 상태로 이 시간이 지나면 worker가 죽은 것으로 보고 다시 queued 처리
+    JOB_LOCK_TIMEOUT_SECONDS: int = 1800
+    JOB_POLL_INTERVAL_SECONDS: float = 2.0
+
+    # LLM 결과 캐시: 메모리 LRU -> llm_cache 테이블
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_MEMORY_MAX_SIZE: int = 2048
+    LLM_CACHE_DB_ENABLED: bool = True
+    # 미설정 시 DATABASE_URL의 llm_cache 테이블 사용 (예: sqlite:///./llm_cache.db)
+    LLM_CACHE_DATABASE_URL: str | None = None
+    # chain(namespace)별 TTL. 0 또는 미등록이면 캐시하지 않음
+    LLM_CACHE_TTL_SECONDS: dict[str, int] = {
+        "journal_summary": 60 * 60 * 24,
+        "question_category": 60 * 60 * 24,
+        "question_generation": 0,  # 같은 카테고리라도 매번 새 질문이 필요
+        "value_score": 60 * 60 * 24 * 7,
+        "opposite_value": 60 * 60 * 24 * 30,
+        "value_map_comment": 60 * 60 * 24,
+        "neo_pi": 60 * 60 * 24 * 7,
+        "big_5_comment": 60 * 60 * 24 * 7,
+        "personalized_advice": 0,  # 하루 단위로 새로 생성
+        "journal_keywords": 60 * 60 * 24 * 7,
+    }
+
+    # OpenAI 클라이언트 공유 연결 풀 / 모델별 동시 요청 수 (worker 프로세스 단위)
+    LLM_HTTP_MAX_CONNECTIONS: int = 100
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    LLM_MODEL_CONCURRENCY: dict[str, int] = {
+        "gpt-5-nano": 32,
+        "gpt-5-mini": 16,
+        "dall-e-3": 4,
+    }
+    # 미등록 모델 및 model을 알 수 없는 요청
+    LLM_DEFAULT_CONCURRENCY: int = 16
+
     AWS_ACCESS_KEY_ID: str
     AWS_SECRET_ACCESS_KEY: str
     AWS_REGION: str = "ap-northeast-2"
     AWS_S3_BUCKET_NAME: str = "mindlog-s3"
+    # 프로세스 공유 S3 client의 HTTP 연결 수 (botocore 기본값 10)
+    S3_MAX_POOL_CONNECTIONS: int = 50
+    # boto3(threadpool) | aiobotocore(async, poetry install -E s3-async 필요)
+    S3_BACKEND: str = "boto3"
+    # presigned URL 유효 시간(초). GET URL은 만료 margin초 전까지 s3_key별로 캐시
+    S3_UPLOAD_URL_EXPIRES_IN: int = 3600
+    S3_DOWNLOAD_URL_EXPIRES_IN: int = 3600
+    S3_DOWNLOAD_URL_CACHE_MARGIN: int = 300
+    S3_DOWNLOAD_URL_CACHE_MAX_SIZE: int = 10000
 
     IMAGE_GENERATION_URL_BASE: str = (
         "http://ec2-15-164-239-56.ap-northeast-2.compute.amazonaws.com:3001"
@@ -42,4 +121,5 @@ class Settings(BaseSettings):
 
 
 settings = Settings()
-print(f"Loaded settings for {ENV} environment. Database URL: {settings.DATABASE_URL}")
+# DATABASE_URL에는 비밀번호가 들어 있으므로 출력하지 않습니다.
+logging.getLogger(__name__).debug(f"Loaded settings for {ENV} environment")
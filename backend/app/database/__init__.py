@@ -2,4 +2,5 @@ import app.features.analysis.models
 import app.features.auth.models
 import app.features.journal.models
 import app.features.selfaware.models
+import app.features.statistics.models
 import app.features.user.models  # noqa: F401
@@ -0,0 +1,36 @@
+"""create emotion_daily_rollups table
+
+Revision ID: a6c2e8f41d93
+Revises: f3a9c7d2e815
+Create Date: 2025-12-03 10:41:52.183406
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6c2e8f41d93'
+down_revision: Union[str, Sequence[str], None] = 'f3a9c7d2e815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 데이터는 python -m app.commands.rebuild_emotion_rollups로 채웁니다.
+    op.create_table('emotion_daily_rollups',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('emotion', sa.String(length=50), nullable=False),
+    sa.Column('intensity_sum', sa.Integer(), nullable=False),
+    sa.Column('journal_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'day', 'emotion')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('emotion_daily_rollups')
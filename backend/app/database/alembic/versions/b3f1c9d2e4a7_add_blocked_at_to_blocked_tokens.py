@@ -0,0 +1,44 @@
+"""add blocked_at and indexes to blocked_tokens
+
+Revision ID: b3f1c9d2e4a7
+Revises: 70bd5df1cb72
+Create Date: 2025-11-28 10:12:41.503217
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f1c9d2e4a7'
+down_revision: Union[str, Sequence[str], None] = '70bd5df1cb72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 행은 마이그레이션 시각으로 채웁니다. (이후 값은 애플리케이션에서 UTC로 기록)
+    op.add_column(
+        'blocked_tokens',
+        sa.Column(
+            'blocked_at',
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index(
+        op.f('ix_blocked_tokens_blocked_at'), 'blocked_tokens', ['blocked_at'], unique=False
+    )
+    op.create_index(
+        op.f('ix_blocked_tokens_expired_at'), 'blocked_tokens', ['expired_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_blocked_tokens_expired_at'), table_name='blocked_tokens')
+    op.drop_index(op.f('ix_blocked_tokens_blocked_at'), table_name='blocked_tokens')
+    op.drop_column('blocked_tokens', 'blocked_at')
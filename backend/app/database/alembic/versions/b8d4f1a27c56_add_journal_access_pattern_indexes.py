@@ -0,0 +1,44 @@
+"""add journal access pattern indexes
+
+Revision ID: b8d4f1a27c56
+Revises: a6c2e8f41d93
+Create Date: 2025-12-03 15:12:40.927361
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d4f1a27c56'
+down_revision: Union[str, Sequence[str], None] = 'a6c2e8f41d93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_journals_user_id_id', 'journals', ['user_id', 'id'], unique=False)
+    op.create_index('ix_journals_user_id_created_at', 'journals', ['user_id', 'created_at'], unique=False)
+    op.create_index('ix_journal_images_journal_id', 'journal_images', ['journal_id'], unique=False)
+    op.create_index('ix_journal_emotions_journal_id_emotion', 'journal_emotions', ['journal_id', 'emotion'], unique=False)
+    op.create_index('ix_journal_keywords_journal_id', 'journal_keywords', ['journal_id'], unique=False)
+    op.create_index('ix_journal_keywords_keyword_journal_id', 'journal_keywords', ['keyword', 'journal_id'], unique=False)
+    # (keyword, journal_id)의 prefix라 중복
+    op.drop_index(op.f('ix_journal_keywords_keyword'), table_name='journal_keywords')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # MySQL은 FK 컬럼마다 인덱스가 하나는 남아 있어야 합니다. 복합 인덱스가
+    # journals.user_id / journal_emotions.journal_id FK의 유일한 인덱스이므로
+    # 지우기 전에 FK용 단일 컬럼 인덱스를 되살립니다. (없으면 error 1553)
+    # (journal_images/journal_keywords의 journal_id 인덱스는 FK 인덱스로 유지)
+    op.create_index('ix_journals_user_id', 'journals', ['user_id'], unique=False)
+    op.create_index('ix_journal_emotions_journal_id', 'journal_emotions', ['journal_id'], unique=False)
+    # upgrade에서 지운 인덱스
+    op.create_index(op.f('ix_journal_keywords_keyword'), 'journal_keywords', ['keyword'], unique=False)
+    op.drop_index('ix_journal_keywords_keyword_journal_id', table_name='journal_keywords')
+    op.drop_index('ix_journal_emotions_journal_id_emotion', table_name='journal_emotions')
+    op.drop_index('ix_journals_user_id_created_at', table_name='journals')
+    op.drop_index('ix_journals_user_id_id', table_name='journals')
@@ -0,0 +1,47 @@
+"""add journal full text index
+
+Revision ID: c5e1a9d3f472
+Revises: b8d4f1a27c56
+Create Date: 2025-12-04 11:26:08.514277
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.features.journal.models import JOURNALS_FTS_SQLITE_DDL
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e1a9d3f472'
+down_revision: Union[str, Sequence[str], None] = 'b8d4f1a27c56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_context().dialect.name == 'sqlite':
+        for statement in JOURNALS_FTS_SQLITE_DDL:
+            op.execute(statement)
+        # 기존 journals로 색인 채우기
+        op.execute("INSERT INTO journals_fts(journals_fts) VALUES('rebuild')")
+        return
+    # 한국어는 띄어쓰기 단위로 조사가 붙으므로 기본 파서 대신 ngram 파서 사용
+    op.create_index(
+        'ft_journals_title_content_gratitude',
+        'journals',
+        ['title', 'content', 'gratitude'],
+        unique=False,
+        mysql_prefix='FULLTEXT',
+        mysql_with_parser='ngram',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name == 'sqlite':
+        for trigger in ('journals_fts_ai', 'journals_fts_ad', 'journals_fts_au'):
+            op.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+        op.execute('DROP TABLE IF EXISTS journals_fts')
+        return
+    op.drop_index('ft_journals_title_content_gratitude', table_name='journals')
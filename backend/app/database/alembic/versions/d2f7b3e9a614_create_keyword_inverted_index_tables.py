@@ -0,0 +1,47 @@
+"""create keyword inverted index tables
+
+Revision ID: d2f7b3e9a614
+Revises: c5e1a9d3f472
+Create Date: 2025-12-04 16:03:27.731952
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f7b3e9a614'
+down_revision: Union[str, Sequence[str], None] = 'c5e1a9d3f472'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 데이터는 python -m app.commands.rebuild_keyword_index로 채웁니다.
+    op.create_table('keywords',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.create_table('journal_keyword_postings',
+    sa.Column('keyword_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('journal_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['journal_id'], ['journals.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['keyword_id'], ['keywords.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('keyword_id', 'user_id', 'journal_id')
+    )
+    op.create_index('ix_journal_keyword_postings_journal_id', 'journal_keyword_postings', ['journal_id'], unique=False)
+    op.create_index('ix_journal_keyword_postings_user_id_keyword_id', 'journal_keyword_postings', ['user_id', 'keyword_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_journal_keyword_postings_user_id_keyword_id', table_name='journal_keyword_postings')
+    op.drop_index('ix_journal_keyword_postings_journal_id', table_name='journal_keyword_postings')
+    op.drop_table('journal_keyword_postings')
+    op.drop_table('keywords')
@@ -0,0 +1,30 @@
+"""add opposite_value to value_scores
+
+Revision ID: e1f6a4c93b27
+Revises: d7e3b5a1c208
+Create Date: 2025-12-01 09:41:53.274810
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1f6a4c93b27'
+down_revision: Union[str, Sequence[str], None] = 'd7e3b5a1c208'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 행은 NULL로 두고, /top-value-scores 조회 시 한 번 계산해서 채웁니다.
+    op.add_column(
+        'value_scores', sa.Column('opposite_value', sa.String(length=80), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('value_scores', 'opposite_value')
@@ -0,0 +1,37 @@
+"""create keyword_emotion_daily_rollups table
+
+Revision ID: e8a4c6f2b915
+Revises: d2f7b3e9a614
+Create Date: 2025-12-05 10:18:44.602193
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8a4c6f2b915'
+down_revision: Union[str, Sequence[str], None] = 'd2f7b3e9a614'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 데이터는 python -m app.commands.rebuild_keyword_rollups로 채웁니다.
+    op.create_table('keyword_emotion_daily_rollups',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('keyword', sa.String(length=100), nullable=False),
+    sa.Column('emotion', sa.String(length=50), nullable=False),
+    sa.Column('weight_sum', sa.Float(), nullable=False),
+    sa.Column('journal_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'day', 'keyword', 'emotion')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('keyword_emotion_daily_rollups')
@@ -0,0 +1,27 @@
+"""add neo_pi_answers to analysis
+
+Revision ID: f3a9c7d2e815
+Revises: e1f6a4c93b27
+Create Date: 2025-12-02 16:08:37.519204
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9c7d2e815'
+down_revision: Union[str, Sequence[str], None] = 'e1f6a4c93b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('analysis', sa.Column('neo_pi_answers', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('analysis', 'neo_pi_answers')
@@ -0,0 +1,107 @@
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool
+
+
+class PoolMetrics:
+    """
+    커넥션 풀 사용량 카운터 (프로세스 단위).
+    uvicorn worker 수에 맞춰 pool_size/max_overflow를 조정할 때 참고합니다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.total_wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def attach(self, engine: Engine) -> None:
+        """engine의 풀 이벤트에 카운터를 연결합니다."""
+
+        @event.listens_for(engine, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            self._increment("connects")
+
+        @event.listens_for(engine, "checkout")
+        def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+            self._increment("checkouts")
+
+        @event.listens_for(engine, "checkin")
+        def _on_checkin(dbapi_connection, connection_record):
+            self._increment("checkins")
+
+        @event.listens_for(engine, "invalidate")
+        def _on_invalidate(dbapi_connection, connection_record, exception):
+            self._increment("invalidations")
+
+    def snapshot(self, pool: Pool) -> dict:
+        with self._lock:
+            checkouts = self.checkouts
+            data = {
+                "connects": self.connects,
+                "checkouts": checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "total_wait_ms": round(self.total_wait_seconds * 1000, 3),
+                "avg_wait_ms": (
+                    round(self.total_wait_seconds * 1000 / checkouts, 3)
+                    if checkouts
+                    else 0.0
+                ),
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+            }
+        data.update(pool_status(pool))
+        return data
+
+    def _increment(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+
+def pool_status(pool: Pool) -> dict:
+    """QueuePool 계열이면 현재 점유/overflow 상태를 함께 반환합니다."""
+    status: dict = {"pool_class": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        getter = getattr(pool, name, None)
+        if callable(getter):
+            status[name] = getter()
+    timeout = getattr(pool, "timeout", None)
+    if callable(timeout):
+        status["timeout"] = timeout()
+    return status
+
+
+def instrumented_pool_class(base: type[Pool], metrics: PoolMetrics) -> type[Pool]:
+    """
+    커넥션을 얻기까지 기다린 시간을 metrics에 기록하는 풀 클래스를 만듭니다.
+    pool.recreate()가 같은 클래스를 사용하므로 dispose 이후에도 유지됩니다.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return base._do_get(self)
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            metrics.record_wait(time.perf_counter() - started, timed_out)
+
+    return type(f"Instrumented{base.__name__}", (base,), {"_do_get": _do_get})
@@ -1,18 +1,84 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import URL, create_engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
 
 from app.core.config import settings
+from app.database.metrics import PoolMetrics, instrumented_pool_class
 
+# 동기 드라이버 -> async 드라이버 매핑 (mysql+pymysql -> mysql+aiomysql 등)
+ASYNC_DRIVERS = {
+    "mysql": "aiomysql",
+    "sqlite": "aiosqlite",
+}
+
+pool_metrics = PoolMetrics()
+async_pool_metrics = PoolMetrics()
+
+
+def to_async_url(database_url: str) -> URL:
+    """동기 DATABASE_URL을 같은 DB를 가리키는 async 드라이버 URL로 변환합니다."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database '{backend}'")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+
+
+def pool_options(url: URL, queue_pool: type[Pool], metrics: PoolMetrics) -> dict:
+    """Settings의 풀 설정을 create_engine 인자로 변환합니다."""
+    options = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    if url.get_backend_name() == "sqlite":
+        # SQLite는 dialect 기본 풀(SingletonThreadPool/StaticPool 등)을 그대로 사용
+        return options
+    options.update(
+        poolclass=instrumented_pool_class(queue_pool, metrics),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+    )
+    return options
+
+
+database_url = make_url(settings.DATABASE_URL)
 engine = create_engine(
-    settings.DATABASE_URL, pool_pre_ping=True, pool_recycle=3600, future=True
+    database_url, future=True, **pool_options(database_url, QueuePool, pool_metrics)
 )
+pool_metrics.attach(engine)
 SessionLocal = sessionmaker(
     bind=engine, autoflush=False, expire_on_commit=False, future=True
 )
 
+async_database_url = to_async_url(settings.DATABASE_URL)
+async_engine = create_async_engine(
+    async_database_url,
+    **pool_options(async_database_url, AsyncAdaptedQueuePool, async_pool_metrics),
+)
+async_pool_metrics.attach(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+def get_pool_metrics() -> dict:
+    return {
+        "sync": pool_metrics.snapshot(engine.pool),
+        "async": async_pool_metrics.snapshot(async_engine.sync_engine.pool),
+        "config": {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        },
+    }
+
 
 def get_db_session() -> Generator[Session, Any, None]:
     session = SessionLocal()
@@ -24,3 +90,16 @@ def get_db_session() -> Generator[Session, Any, None]:
         raise e
     finally:
         session.close()
+
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """async 라우트용 세션. 쿼리마다 threadpool을 거치지 않고 이벤트 루프에서 실행됩니다."""
+    session = AsyncSessionLocal()
+    try:
+        yield session
+        await session.commit()
+    except Exception as e:
+        await session.rollback()
+        raise e
+    finally:
+        await session.close()
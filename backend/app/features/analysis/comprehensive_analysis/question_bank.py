@@ -0,0 +1,130 @@
+"""
+NEO-PI 문항 은행 로더 (data/<language>/questions.ts).
+
+처음 요청될 때 한 번만 읽고 언어별로 캐시합니다. 경로는 이 패키지 기준이라
+실행 디렉터리와 무관합니다. build_artifacts()로 만든 questions.json이 있고
+원본 questions.ts와 해시가 같으면 정규식 파싱 대신 그 파일을 읽습니다.
+
+    questions = question_prompts("ko")  # ["나는 걱정이 많은 편이다. (keyed: plus)", ...]
+"""
+
+import hashlib
+import json
+import logging
+import re
+from dataclasses import asdict, dataclass
+from functools import cache
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent / "data"
+LANGUAGES = ("ko", "en")
+SOURCE_NAME = "questions.ts"
+ARTIFACT_NAME = "questions.json"
+
+# { id: '...', text: '...' 또는 "...", keyed: 'plus', domain: 'N', facet: 1 }
+QUESTION_PATTERN = re.compile(
+    r"\{\s*id\s*:\s*['\"]([^'\"]+)['\"]\s*,"
+    r"\s*text\s*:\s*(?:'([^'\n]*)'|\"([^\"\n]*)\")\s*,"
+    r"\s*keyed\s*:\s*['\"](\w+)['\"]\s*,"
+    r"\s*domain\s*:\s*['\"](\w)['\"]\s*,"
+    r"\s*facet\s*:\s*(\d+)\s*,?\s*\}",
+)
+TEXT_FIELD_PATTERN = re.compile(r"text\s*:")
+
+
+@dataclass(frozen=True)
+class Question:
+    id: str
+    text: str
+    keyed: str  # plus / minus
+    domain: str  # N, E, O, A, C
+    facet: int
+
+    def prompt_line(self) -> str:
+        return f"{self.text} (keyed: {self.keyed})"
+
+
+def parse_questions(source: str) -> list[Question]:
+    """questions.ts 내용에서 문항 객체를 순서대로 추출합니다."""
+    questions = [
+        Question(
+            id=id_,
+            text=single_quoted or double_quoted,
+            keyed=keyed,
+            domain=domain,
+            facet=int(facet),
+        )
+        for id_, single_quoted, double_quoted, keyed, domain, facet in (
+            QUESTION_PATTERN.findall(source)
+        )
+    ]
+    declared = len(TEXT_FIELD_PATTERN.findall(source))
+    if len(questions) != declared:
+        raise ValueError(
+            f"Parsed {len(questions)} of {declared} questions; check questions.ts format."
+        )
+    return questions
+
+
+def source_path(language: str) -> Path:
+    if language not in LANGUAGES:
+        raise ValueError(f"Unknown question bank language: {language}")
+    return DATA_DIR / language / SOURCE_NAME
+
+
+def artifact_path(language: str) -> Path:
+    return source_path(language).with_name(ARTIFACT_NAME)
+
+
+def _digest(source: bytes) -> str:
+    return hashlib.sha256(source).hexdigest()
+
+
+def _load_artifact(language: str, digest: str) -> list[Question] | None:
+    try:
+        with open(artifact_path(language), encoding="utf-8") as f:
+            artifact = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if artifact.get("source_sha256") != digest:
+        # questions.ts가 바뀐 뒤 다시 빌드하지 않은 경우
+        logger.warning(f"Stale {language} question bank artifact; parsing source")
+        return None
+    return [Question(**question) for question in artifact["questions"]]
+
+
+@cache
+def load_question_bank(language: str = "ko") -> tuple[Question, ...]:
+    source = source_path(language).read_bytes()
+    questions = _load_artifact(language, _digest(source))
+    if questions is None:
+        questions = parse_questions(source.decode("utf-8"))
+    logger.info(f"Loaded {len(questions)} {language} NEO-PI questions")
+    return tuple(questions)
+
+
+@cache
+def question_prompts(language: str = "ko") -> tuple[str, ...]:
+    """LLM prompt에 넣는 "문항 (keyed: plus/minus)" 목록"""
+    return tuple(question.prompt_line() for question in load_question_bank(language))
+
+
+def build_artifacts(languages: tuple[str, ...] = LANGUAGES) -> list[Path]:
+    """언어별 questions.ts를 파싱해서 옆에 questions.json을 만듭니다."""
+    paths = []
+    for language in languages:
+        source = source_path(language).read_bytes()
+        artifact = {
+            "source_sha256": _digest(source),
+            "questions": [
+                asdict(question) for question in parse_questions(source.decode("utf-8"))
+            ],
+        }
+        path = artifact_path(language)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(artifact, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        paths.append(path)
+    return paths
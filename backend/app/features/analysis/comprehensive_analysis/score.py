@@ -1,9 +1,11 @@
-import re
-
 from dotenv import load_dotenv
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
 
+from app.features.analysis.comprehensive_analysis.question_bank import (
+    parse_questions,
+)
+
 load_dotenv()
 # -------------------------------
 # 1️⃣ 파일 로드
@@ -13,26 +15,11 @@ load_dotenv()
 def load_questions_with_keyed(path: str) -> list[str]:
     """
     questions.ts 파일에서 각 문항의 text와 keyed를 추출.
-    text가 큰따옴표, 작은따옴표, 줄바꿈 포함해도 동작함.
+    (문항 은행은 question_bank.question_prompts로 캐시해서 사용합니다)
     """
     with open(path, encoding="utf-8") as f:
-        text = f.read()
-
-    # text: "..." or text: '...' (줄바꿈 포함 허용)
-    texts = re.findall(r'text\s*:\s*[\'"]([^\'"]+)[\'"]', text)
-    # keyed: 'plus' or "minus"
-    keyeds = re.findall(r'keyed\s*:\s*[\'"](\w+)[\'"]', text)
-
-    if len(texts) != len(keyeds):
-        print(f"text({len(texts)})와 keyed({len(keyeds)}) 개수가 다릅니다!")
+        return [question.prompt_line() for question in parse_questions(f.read())]
 
-    results = [f"{t} (keyed: {k})" for t, k in zip(texts, keyeds, strict=False)]
-    return results
-
-
-questions = load_questions_with_keyed(
-    "app/features/analysis/comprehensive_analysis/data/ko/questions.ts"
-)
 
 choices = """
 각 문항에 대해 1부터 5까지의 5점 척도로 응답합니다.
@@ -58,8 +45,6 @@ keyed: minus
 'minus' 문항은 점수가 높을수록 해당 특성이 약하다는 뜻입니다.
 """
 
-print(f"Loaded {len(questions)} questions, choices")
-
 # -------------------------------
 # 2️⃣ LLM & Prompt 구성
 # -------------------------------
@@ -0,0 +1,11 @@
+from sqlalchemy.orm import Session
+
+from app.features.analysis.di import get_analysis_service
+from app.features.user.models import User
+
+
+def run_analysis_update(session: Session, user_id: int, payload: dict) -> None:
+    user = session.get(User, user_id)
+    if user is None:
+        return  # 탈퇴한 사용자
+    get_analysis_service(session).refresh_analysis(user.id, user.age, user.gender)
@@ -27,6 +27,10 @@ class Analysis(Base):
     )  # 목표성취형
 
     neo_pi_score: Mapped[dict | None] = mapped_column(JSON, nullable=True)  # 확인 필요
+    # neo_pi_score 계산에 사용한 121문항 응답 (0번 미사용). 규준 변경 시 재채점용
+    neo_pi_answers: Mapped[list[int] | None] = mapped_column(
+        JSON(none_as_null=True), nullable=True
+    )
 
     conscientiousness: Mapped[str | None] = mapped_column(Text, nullable=True)
     neuroticism: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -1,11 +1,13 @@
 from typing import Annotated
 
 from fastapi import Depends
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 
 from app.common.utilities import get_korea_time
 from app.database.session import get_db_session
 from app.features.analysis.models import Analysis
+from app.features.user.models import User
 
 
 # -------------------------------
@@ -37,6 +39,7 @@ class AnalysisRepository:
         user_id: int,
         user_type: str | None = None,
         neo_pi_score: dict | None = None,
+        neo_pi_answers: list[int] | None = None,
         conscientiousness: str | None = None,
         neuroticism: str | None = None,
         extraversion: str | None = None,
@@ -53,6 +56,8 @@ class AnalysisRepository:
             analysis.user_type = user_type
         if neo_pi_score is not None:
             analysis.neo_pi_score = neo_pi_score
+        if neo_pi_answers is not None:
+            analysis.neo_pi_answers = neo_pi_answers
         if conscientiousness is not None:
             analysis.conscientiousness = conscientiousness
         if neuroticism is not None:
@@ -72,3 +77,30 @@ class AnalysisRepository:
 
         self.session.flush()
         self.session.commit()  # background에서 진행 예정
+
+    def count_neo_pi_answers(self) -> int:
+        return self.session.scalar(
+            select(func.count())
+            .select_from(Analysis)
+            .where(Analysis.neo_pi_answers.is_not(None))
+        )
+
+    def list_neo_pi_answers(self, after_id: int, limit: int):
+        """재채점용 (id, neo_pi_answers, gender, birthdate)를 id 순서로 limit개씩 조회"""
+        return self.session.execute(
+            select(Analysis.id, Analysis.neo_pi_answers, User.gender, User.birthdate)
+            .join(User, User.id == Analysis.user_id)
+            .where(Analysis.id > after_id, Analysis.neo_pi_answers.is_not(None))
+            .order_by(Analysis.id)
+            .limit(limit)
+        ).all()
+
+    def bulk_update_scores(self, rows: list[dict]) -> None:
+        """[{id, neo_pi_score, user_type}, ...]를 executemany UPDATE 한 번으로 저장"""
+        if not rows:
+            return
+        now = get_korea_time()
+        self.session.execute(
+            update(Analysis), [{**row, "updated_at": now} for row in rows]
+        )
+        self.session.commit()
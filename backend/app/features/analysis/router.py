@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Depends, status
+from fastapi import APIRouter, Depends, status
 from fastapi.security import HTTPBearer
 
 from app.common.authorization import get_current_user
@@ -12,6 +12,7 @@ from app.features.analysis.schemas.responses import (
     UserTypeResponse,
 )
 from app.features.analysis.service import AnalysisService
+from app.features.jobs.service import JobService
 from app.features.selfaware.di import get_answer_service
 from app.features.selfaware.service import AnswerService
 from app.features.user.models import User
@@ -22,30 +23,6 @@ security = HTTPBearer()
 router = APIRouter(prefix="/analysis", tags=["analysis"])
 
 
-# -----------------------------
-# 🔧 백그라운드 작업 함수
-# -----------------------------
-def update_analysis_table(
-    user_id: int,
-    user_age: int,
-    user_gender: str,
-    analysis_service: AnalysisService,
-):
-    try:
-        print("Start updating neo_pi_score")
-        analysis_service.update_neo_pi_score(user_id, user_age, user_gender)
-        print("Start updating user_id")
-        analysis_service.update_user_type(user_id)
-        print("Start updating comprehensive_analysis")
-        analysis_service.update_comprehensive_analysis(user_id, user_age, user_gender)
-        print("Start updating personalized_advice")
-        analysis_service.update_personalized_advice(user_id, user_age, user_gender)
-        print("Analysis updated")
-    except Exception as e:
-        print(f"Error processing updating analysis table for user {user_id}: {e}")
-        # 로깅을 위해 에러를 출력하지만 예외를 다시 발생시키지 않음
-
-
 # -----------------------------
 # Analysis 관련 엔드포인트
 # -----------------------------
@@ -108,17 +85,15 @@ def update_or_get_personalized_advice(
     summary="Update a analysis (get new neo-pi score, user_type, comprehensive-analysis)",
 )
 def update_analysis(
-    background_tasks: BackgroundTasks,
     answer_service: Annotated[AnswerService, Depends(get_answer_service)],
-    analysis_service: Annotated[AnalysisService, Depends(get_analysis_service)],
+    job_service: Annotated[JobService, Depends()],
     user: User = Depends(get_current_user),
 ) -> str:
     answers = answer_service.get_answer_by_user(user_id=user.id)
     if len(answers) < 10:
         raise Exception("You should write more self-analysis QAs")
     if len(answers) % 10 == 0:
-        background_tasks.add_task(
-            update_analysis_table, user.id, user.age, user.gender, analysis_service
-        )
+        # 진행 상황은 GET /jobs?kind=analysis.update 로 확인
+        job_service.enqueue_analysis_update(user.id)
         return "Update Started"
     return "Update Soon"
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import json
+import logging
 import random
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import date
 
 from dotenv import load_dotenv
 from langchain_core.output_parsers import PydanticOutputParser, StrOutputParser
-from langchain_openai import ChatOpenAI
+from langchain_core.outputs import ChatGeneration
 
+from app.common.llm import chat_model
+from app.common.llm_cache import llm_cache
 from app.features.analysis.comprehensive_analysis.data.en.prompts import (
     agreeableness_explanations,
     big_5_prompt,
@@ -15,12 +21,17 @@ from app.features.analysis.comprehensive_analysis.data.en.prompts import (
     neuroticism_explanations,
     openness_explanations,
 )
-from app.features.analysis.comprehensive_analysis.evaluator import evaluate
+from app.features.analysis.comprehensive_analysis.evaluator import (
+    evaluate,
+    score_batch,
+)
+from app.features.analysis.comprehensive_analysis.question_bank import (
+    question_prompts,
+)
 from app.features.analysis.comprehensive_analysis.score import (
     NeoPiAnswers,
     choices,
     prompt,
-    questions,
 )
 from app.features.analysis.prompt import (
     AdviceGenerationResponse,
@@ -28,9 +39,71 @@ from app.features.analysis.prompt import (
 )
 from app.features.analysis.repository import AnalysisRepository
 from app.features.selfaware.repository import AnswerRepository
+from app.features.user.models import calculate_age
 
 load_dotenv()
 
+# NEO-PI 120문항을 20문항씩 6번 나눠서 예측
+NEO_PI_CHUNK_SIZE = 20
+NEO_PI_MAX_CONCURRENCY = 6
+NEO_PI_MAX_ATTEMPTS = 3
+
+# get_comment_from_big_5_score 반환 순서 (A, C, E, N, O)
+BIG_5_EXPLANATIONS = {
+    "agreeableness": agreeableness_explanations,
+    "conscientiousness": conscientiousness_explanations,
+    "extraversion": extraversion_explanations,
+    "neuroticism": neuroticism_explanations,
+    "openness": openness_explanations,
+}
+BIG_5_COMMENT_TIMEOUT_SECONDS = 90.0
+
+logger = logging.getLogger(__name__)
+
+
+def _is_complete_neo_pi_chunk(generations) -> bool:
+    # 응답 개수가 틀린 청크는 재시도 대상이므로 캐시에 남기지 않습니다.
+    if not generations or not isinstance(generations[0], ChatGeneration):
+        return False
+    parsed = generations[0].message.additional_kwargs.get("parsed")
+    if isinstance(parsed, NeoPiAnswers):
+        parsed = parsed.model_dump()
+    return (
+        isinstance(parsed, dict) and len(parsed.get("answers", [])) == NEO_PI_CHUNK_SIZE
+    )
+
+
+def classify_user_type(score: dict) -> str:
+    """neo_pi_score(백분위)로 사용자 유형을 결정합니다."""
+    C, N, E, O, A = (  # noqa: E741, N806
+        score["CONSCIENTIOUSNESS"],
+        score["NEUROTICISM"],
+        score["EXTRAVERSION"],
+        score["OPENNESS"],
+        score["AGREEABLENESS"],
+    )
+    if C >= 65 and N <= 45:
+        return "Goal oriented"
+    if O >= 60 and E >= 60:
+        return "Adventurer"
+    if E >= 60 and A >= 60:
+        return "Connector"
+    if C >= 60 and A >= 60:
+        return "Supportive achiever"
+    if O >= 60 and E <= 45:
+        return "Explorer"
+    if E >= 60 and A <= 45:
+        return "Challenger"
+    if N <= 40 and C >= 50:
+        return "Stability seeker"
+    if N >= 60 and O >= 60:
+        return "Sensitive creator"
+    if C >= 65 and O <= 45:
+        return "Analyst"
+    if O >= 65 and C <= 45:
+        return "Change seeker"
+    return "Balanced"
+
 
 class AnalysisService:
     def __init__(
@@ -47,9 +120,14 @@ class AnalysisService:
     def get_analysis_by_user(self, user_id: int):
         return self.analysis_repository.get_analysis_by_user_id(user_id=user_id)
 
-    def extract_neo_pi_from_answer(self, user_id: int):
-        llm = ChatOpenAI(model="gpt-5-nano").with_structured_output(NeoPiAnswers)
+    def _neo_pi_chain(self):
+        llm = chat_model(
+            "gpt-5-nano",
+            cache=llm_cache("neo_pi", accept=_is_complete_neo_pi_chunk),
+        ).with_structured_output(NeoPiAnswers)
+        return prompt | llm
 
+    def extract_neo_pi_from_answer(self, user_id: int):
         answers = self.answer_repository.get_by_user(user_id)
 
         if not answers:
@@ -57,38 +135,50 @@ class AnalysisService:
 
         answers_text = [answer.text for answer in answers]
 
-        neo_pi_questions = questions
-        neo_pi_choices = choices
-        neo_pi_prompt = prompt
-
-        neo_pi_chain = neo_pi_prompt | llm
+        neo_pi_chain = self._neo_pi_chain()
+        questions = question_prompts("ko")
+        chunk_inputs = [
+            {
+                "choices": choices,
+                # prompt에는 list 형태로 렌더링됩니다. (캐시 키 유지)
+                "questions": list(questions[start : start + NEO_PI_CHUNK_SIZE]),
+                "conversation": answers_text,
+            }
+            for start in range(0, len(questions), NEO_PI_CHUNK_SIZE)
+        ]
 
-        responses = [
-            neo_pi_chain.invoke(
-                {
-                    "choices": neo_pi_choices,
-                    "questions": neo_pi_questions[20 * i : 20 * (i + 1)],
-                    "conversation": answers_text,
-                }
+        # 청크(20문항)별 호출을 동시에 보내고, 응답 개수가 틀렸거나 실패한 청크만 다시 요청
+        chunk_answers: list[list[int] | None] = [None] * len(chunk_inputs)
+        last_error: Exception | None = None
+        for _ in range(NEO_PI_MAX_ATTEMPTS):
+            pending = [i for i, result in enumerate(chunk_answers) if result is None]
+            if not pending:
+                break
+            responses = neo_pi_chain.batch(
+                [chunk_inputs[i] for i in pending],
+                config={"max_concurrency": NEO_PI_MAX_CONCURRENCY},
+                return_exceptions=True,
             )
-            for i in range(6)
-        ]
+            for i, response in zip(pending, responses, strict=True):
+                if (
+                    isinstance(response, NeoPiAnswers)
+                    and len(response.answers) == NEO_PI_CHUNK_SIZE
+                ):
+                    chunk_answers[i] = response.answers
+                elif isinstance(response, Exception):
+                    last_error = response
 
-        for response in responses:
-            assert isinstance(response, NeoPiAnswers)
-            if len(response.answers) != 20:
-                raise ValueError("Each NEO PI answer set must contain 20 answers.")
-
-        total_response = (
-            [0]
-            + responses[0].answers
-            + responses[1].answers
-            + responses[2].answers
-            + responses[3].answers
-            + responses[4].answers
-            + responses[5].answers
-        )
-        print("valid big 5 score generated")
+        failed = [i for i, result in enumerate(chunk_answers) if result is None]
+        if failed:
+            raise ValueError(
+                f"Each NEO PI answer set must contain {NEO_PI_CHUNK_SIZE} answers. "
+                f"(failed chunks: {failed})"
+            ) from last_error
+
+        total_response = [0]
+        for result in chunk_answers:
+            total_response += result
+        logger.info(f"Valid big 5 score generated for user {user_id}")
         return total_response
 
     def evaluate_big_5_score(self, user_id, age, gender, flag=False):
@@ -96,9 +186,11 @@ class AnalysisService:
         return evaluate(neo_pi, gender, age, flag)
 
     def update_neo_pi_score(self, user_id: int, age: int = 23, gender: str = "Male"):
-        neo_pi_score = self.evaluate_big_5_score(user_id, age, gender, flag=False)
+        # 응답 벡터도 함께 저장해서 규준이 바뀌면 LLM 호출 없이 재채점할 수 있게 합니다.
+        neo_pi = self.extract_neo_pi_from_answer(user_id)
+        neo_pi_score = evaluate(neo_pi, gender, age, flag=False)
         self.analysis_repository.update_analysis(
-            user_id=user_id, neo_pi_score=neo_pi_score
+            user_id=user_id, neo_pi_score=neo_pi_score, neo_pi_answers=neo_pi
         )
 
     def evaluate_user_type(self, user_id):
@@ -108,69 +200,94 @@ class AnalysisService:
         score = analysis.neo_pi_score
         if score is None:
             raise ValueError("NEO PI score not found for user.")
-        C, N, E, O, A = (  # noqa: E741, N806
-            score["CONSCIENTIOUSNESS"],
-            score["NEUROTICISM"],
-            score["EXTRAVERSION"],
-            score["OPENNESS"],
-            score["AGREEABLENESS"],
-        )
-        if C >= 65 and N <= 45:
-            return "Goal oriented"
-        if O >= 60 and E >= 60:
-            return "Adventurer"
-        if E >= 60 and A >= 60:
-            return "Connector"
-        if C >= 60 and A >= 60:
-            return "Supportive achiever"
-        if O >= 60 and E <= 45:
-            return "Explorer"
-        if E >= 60 and A <= 45:
-            return "Challenger"
-        if N <= 40 and C >= 50:
-            return "Stability seeker"
-        if N >= 60 and O >= 60:
-            return "Sensitive creator"
-        if C >= 65 and O <= 45:
-            return "Analyst"
-        if O >= 65 and C <= 45:
-            return "Change seeker"
-        return "Balanced"
+        return classify_user_type(score)
 
     def update_user_type(self, user_id: int):
         user_type = self.evaluate_user_type(user_id)
         self.analysis_repository.update_analysis(user_id=user_id, user_type=user_type)
 
-    def get_comment_from_big_5_score(self, user_id, age, gender):
+    def rescore_all(
+        self,
+        chunk_size: int = 1000,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> int:
+        """
+        저장된 neo_pi_answers로 모든 사용자의 neo_pi_score/user_type을 다시 계산합니다.
+        (LLM 호출 없음) chunk_size명씩 score_batch로 채점하고 UPDATE 한 번으로 저장합니다.
+        """
+        today = date.today()
+        processed = 0
+        last_id = 0
+        while rows := self.analysis_repository.list_neo_pi_answers(
+            after_id=last_id, limit=chunk_size
+        ):
+            scores = score_batch(
+                [row.neo_pi_answers for row in rows],
+                [row.gender for row in rows],
+                [calculate_age(row.birthdate, today) for row in rows],
+            )
+            updates = []
+            for index, row in enumerate(rows):
+                neo_pi_score = scores.to_dict(index)
+                updates.append(
+                    {
+                        "id": row.id,
+                        "neo_pi_score": neo_pi_score,
+                        "user_type": classify_user_type(neo_pi_score),
+                    }
+                )
+            self.analysis_repository.bulk_update_scores(updates)
+
+            processed += len(rows)
+            last_id = rows[-1].id
+            if on_progress is not None:
+                on_progress(processed)
+        return processed
+
+    def _big_5_chain(self):
+        llm = chat_model("gpt-5-nano", cache=llm_cache("big_5_comment"))
+        return big_5_prompt | llm | StrOutputParser()
+
+    def get_comment_from_big_5_score(
+        self, user_id, age, gender, timeout=BIG_5_COMMENT_TIMEOUT_SECONDS
+    ):
+        """
+        5개 영역 코멘트를 동시에 생성합니다. (A, C, E, N, O 순서로 반환)
+        timeout 안에 끝나지 않았거나 실패한 영역은 None입니다.
+        """
         analysis = self.get_analysis_by_user(user_id)
         if analysis is None or analysis.neo_pi_score is None:
             raise ValueError("NEO PI score not found for user.")
         score_json = json.dumps(analysis.neo_pi_score, indent=4)
-        parser = StrOutputParser()
-        llm = ChatOpenAI(model="gpt-5-nano")
-        big_5_chain = big_5_prompt | llm | parser
-        a_response = big_5_chain.invoke(
-            {
-                "big_5_explanations": agreeableness_explanations,
-                "big_5_score": score_json,
-            }
-        )
-        c_response = big_5_chain.invoke(
-            {
-                "big_5_explanations": conscientiousness_explanations,
-                "big_5_score": score_json,
-            }
-        )
-        e_response = big_5_chain.invoke(
-            {"big_5_explanations": extraversion_explanations, "big_5_score": score_json}
-        )
-        n_response = big_5_chain.invoke(
-            {"big_5_explanations": neuroticism_explanations, "big_5_score": score_json}
-        )
-        o_response = big_5_chain.invoke(
-            {"big_5_explanations": openness_explanations, "big_5_score": score_json}
-        )
-        return a_response, c_response, e_response, n_response, o_response
+        big_5_chain = self._big_5_chain()
+
+        executor = ThreadPoolExecutor(max_workers=len(BIG_5_EXPLANATIONS))
+        futures = {
+            domain: executor.submit(
+                big_5_chain.invoke,
+                {"big_5_explanations": explanations, "big_5_score": score_json},
+            )
+            for domain, explanations in BIG_5_EXPLANATIONS.items()
+        }
+        # 다섯 호출이 하나의 timeout 예산을 공유합니다.
+        done, _ = wait(futures.values(), timeout=timeout)
+        # 늦은 호출은 기다리지 않고 결과만 버립니다.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        comments = []
+        for domain, future in futures.items():
+            if future not in done:
+                logger.warning(f"Big 5 comment for {domain} timed out (user {user_id})")
+                comments.append(None)
+            elif future.exception() is not None:
+                logger.error(
+                    f"Big 5 comment for {domain} failed (user {user_id}): "
+                    f"{future.exception()}"
+                )
+                comments.append(None)
+            else:
+                comments.append(future.result())
+        return tuple(comments)
 
     def update_comprehensive_analysis(
         self, user_id: int, age: int = 23, gender: str = "Male"
@@ -178,6 +295,12 @@ class AnalysisService:
         a_response, c_response, e_response, n_response, o_response = (
             self.get_comment_from_big_5_score(user_id, age, gender)
         )
+        if all(
+            response is None
+            for response in (a_response, c_response, e_response, n_response, o_response)
+        ):
+            raise ValueError("No Big 5 comment was generated.")
+        # 생성된 영역만 갱신하고, 실패한 영역은 기존 코멘트를 유지합니다.
         self.analysis_repository.update_analysis(
             user_id=user_id,
             conscientiousness=c_response,
@@ -195,7 +318,7 @@ class AnalysisService:
         if score is None:
             raise ValueError("NEO PI score not found for user.")
 
-        llm = ChatOpenAI(model="gpt-5-nano")
+        llm = chat_model("gpt-5-nano", cache=llm_cache("personalized_advice"))
         output_parser = PydanticOutputParser(pydantic_object=AdviceGenerationResponse)
         personalized_advice_chain = personalized_advice_prompt | llm | output_parser
 
@@ -207,6 +330,21 @@ class AnalysisService:
 
         return response
 
+    def refresh_analysis(self, user_id: int, age: int, gender: str):
+        """analysis 전체 갱신 (job worker에서 실행). 실패하면 예외를 그대로 올립니다."""
+        if self.get_analysis_by_user(user_id) is None:
+            self.create_analysis(user_id)
+            logger.info(f"Analysis table for user {user_id} created")
+        logger.info(f"Updating neo_pi_score for user {user_id}")
+        self.update_neo_pi_score(user_id, age, gender)
+        logger.info(f"Updating user_type for user {user_id}")
+        self.update_user_type(user_id)
+        logger.info(f"Updating comprehensive_analysis for user {user_id}")
+        self.update_comprehensive_analysis(user_id, age, gender)
+        logger.info(f"Updating personalized_advice for user {user_id}")
+        self.update_personalized_advice(user_id, age, gender)
+        logger.info(f"Analysis updated for user {user_id}")
+
     def update_personalized_advice(
         self, user_id: int, age: int = 23, gender: str = "Male"
     ):
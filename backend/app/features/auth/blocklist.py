@@ -0,0 +1,127 @@
+import hashlib
+import math
+import threading
+from collections.abc import Iterable
+from datetime import datetime
+
+from app.core.config import settings
+
+
+class BloomFilter:
+    """bytearray 비트셋 기반 bloom filter. 삭제는 지원하지 않으므로 주기적으로 다시 만듭니다."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        capacity = max(capacity, 1)
+        self.capacity = capacity
+        self.num_bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> Iterable[int]:
+        # double hashing: h1 + i * h2 로 k개의 위치를 만듭니다.
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+class BlockedTokenIndex:
+    """
+    blocked_tokens의 프로세스 내부 인덱스.
+    filter에 없으면 차단되지 않은 토큰이므로 DB 조회를 생략하고,
+    있으면(오탐 포함) 기존 EXISTS 쿼리로 확인합니다.
+
+    다른 worker에서 차단한 토큰은 다음 sync(BLOCKED_TOKEN_SYNC_SECONDS)까지 보이지 않습니다.
+    warm 전(ready=False)에는 항상 DB를 조회합니다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+        self._filter = BloomFilter(capacity, error_rate)
+        # 마지막 rebuild 이후 이 프로세스에서 추가한 토큰 (rebuild 중 누락 방지)
+        self._local_adds: set[str] = set()
+        self.ready = False
+        self.synced_until: datetime | None = None
+        self.skipped_lookups = 0
+        self.db_lookups = 0
+
+    def might_contain(self, token_id: str) -> bool:
+        with self._lock:
+            if self.ready and token_id not in self._filter:
+                self.skipped_lookups += 1
+                return False
+            self.db_lookups += 1
+            return True
+
+    def add(self, token_id: str) -> None:
+        with self._lock:
+            self._filter.add(token_id)
+            self._local_adds.add(token_id)
+
+    def rebuild(self, token_ids: list[str], synced_until: datetime) -> None:
+        """DB 전체 목록으로 filter를 새로 만듭니다. (warm, 만료 토큰 정리 후)"""
+        with self._lock:
+            local_adds = self._local_adds
+            self._local_adds = set()
+        bloom = BloomFilter(
+            max(self.capacity, 2 * (len(token_ids) + len(local_adds))),
+            self.error_rate,
+        )
+        for token_id in token_ids:
+            bloom.add(token_id)
+        with self._lock:
+            for token_id in local_adds | self._local_adds:
+                bloom.add(token_id)
+            self._filter = bloom
+            self.synced_until = synced_until
+            self.ready = True
+
+    def merge(self, token_ids: Iterable[str], synced_until: datetime) -> None:
+        """sync로 가져온 (다른 worker가 추가한) 토큰을 반영합니다."""
+        with self._lock:
+            for token_id in token_ids:
+                self._filter.add(token_id)
+            self.synced_until = synced_until
+
+    def reset(self) -> None:
+        with self._lock:
+            self._filter = BloomFilter(self.capacity, self.error_rate)
+            self._local_adds = set()
+            self.ready = False
+            self.synced_until = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "ready": self.ready,
+                "size": self._filter.count,
+                "capacity": self._filter.capacity,
+                "num_bits": self._filter.num_bits,
+                "num_hashes": self._filter.num_hashes,
+                "skipped_lookups": self.skipped_lookups,
+                "db_lookups": self.db_lookups,
+                "synced_until": (
+                    self.synced_until.isoformat() if self.synced_until else None
+                ),
+            }
+
+
+blocked_token_index = BlockedTokenIndex(
+    settings.BLOCKED_TOKEN_INDEX_CAPACITY, settings.BLOCKED_TOKEN_INDEX_ERROR_RATE
+)
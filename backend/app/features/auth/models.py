@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import UTC, datetime
 
 from sqlalchemy import DateTime, String
 from sqlalchemy.orm import Mapped, mapped_column
@@ -10,4 +10,8 @@ class BlockedToken(Base):
     __tablename__ = "blocked_tokens"
 
     token_id: Mapped[str] = mapped_column(String(255), primary_key=True)
-    expired_at: Mapped[datetime] = mapped_column(DateTime)
+    expired_at: Mapped[datetime] = mapped_column(DateTime, index=True)
+    # worker 간 인덱스 증분 sync 기준 (UTC)
+    blocked_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(UTC), index=True
+    )
@@ -2,11 +2,12 @@ from datetime import datetime
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy import exists, select
+from sqlalchemy import delete, exists, select
 from sqlalchemy.orm import Session
 
 from app.database.session import get_db_session
 
+from .blocklist import blocked_token_index
 from .models import BlockedToken
 
 
@@ -17,8 +18,35 @@ class BlockedTokenRepository:
     def add_blocked_token(self, token_id: str, expired_at: datetime) -> BlockedToken:
         blocked_token = BlockedToken(token_id=token_id, expired_at=expired_at)
         self.session.add(blocked_token)
+        blocked_token_index.add(token_id)
         return blocked_token
 
     def is_token_blocked(self, token_id: str) -> bool:
+        if not blocked_token_index.might_contain(token_id):
+            return False
         statement = select(exists().where(BlockedToken.token_id == token_id))
         return self.session.scalar(statement)
+
+    def list_blocked_tokens(
+        self, since: datetime | None = None
+    ) -> list[tuple[str, datetime]]:
+        """(token_id, blocked_at) 목록. since가 있으면 그 이후 차단된 토큰만 반환합니다."""
+        statement = select(BlockedToken.token_id, BlockedToken.blocked_at)
+        if since is not None:
+            statement = statement.where(BlockedToken.blocked_at >= since)
+        return [tuple(row) for row in self.session.execute(statement)]
+
+    def delete_expired_tokens(self, now: datetime, limit: int) -> int:
+        """만료된 토큰을 최대 limit개 삭제하고 삭제한 개수를 반환합니다."""
+        # MySQL은 같은 테이블을 서브쿼리로 참조하는 DELETE ... LIMIT을 허용하지 않으므로 두 단계로 나눕니다.
+        token_ids = self.session.scalars(
+            select(BlockedToken.token_id)
+            .where(BlockedToken.expired_at < now)
+            .limit(limit)
+        ).all()
+        if not token_ids:
+            return 0
+        self.session.execute(
+            delete(BlockedToken).where(BlockedToken.token_id.in_(token_ids))
+        )
+        return len(token_ids)
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import time
+from datetime import UTC, datetime, timedelta
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.database.session import SessionLocal
+
+from .blocklist import blocked_token_index
+from .repository import BlockedTokenRepository
+
+logger = logging.getLogger(__name__)
+
+# 커밋이 늦게 끝난 행을 놓치지 않도록 sync 구간을 이만큼 겹쳐서 조회합니다.
+SYNC_OVERLAP = timedelta(seconds=60)
+
+
+def utc_now() -> datetime:
+    # blocked_at/expired_at 컬럼은 timezone 없는 UTC 값으로 저장됩니다.
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def warm_blocked_token_index() -> int:
+    """blocked_tokens 전체로 인덱스를 다시 만듭니다."""
+    started_at = utc_now()
+    with SessionLocal() as session:
+        rows = BlockedTokenRepository(session).list_blocked_tokens()
+    blocked_token_index.rebuild([token_id for token_id, _ in rows], started_at)
+    return len(rows)
+
+
+def sync_blocked_token_index() -> int:
+    """마지막 sync 이후 (다른 worker 포함) 차단된 토큰을 인덱스에 반영합니다."""
+    started_at = utc_now()
+    since = blocked_token_index.synced_until - SYNC_OVERLAP
+    with SessionLocal() as session:
+        rows = BlockedTokenRepository(session).list_blocked_tokens(since=since)
+    blocked_token_index.merge((token_id for token_id, _ in rows), started_at)
+    return len(rows)
+
+
+def sweep_expired_blocked_tokens(batch_size: int) -> int:
+    """만료된 토큰을 batch_size씩 나눠 삭제합니다. (배치마다 커밋해서 락을 짧게 유지)"""
+    deleted = 0
+    now = utc_now()
+    with SessionLocal() as session:
+        repository = BlockedTokenRepository(session)
+        while True:
+            count = repository.delete_expired_tokens(now, batch_size)
+            session.commit()
+            deleted += count
+            if count < batch_size:
+                return deleted
+
+
+async def run_blocked_token_maintenance() -> None:
+    """
+    lifespan 동안 도는 백그라운드 루프.
+    - 시작 시 인덱스 warm
+    - BLOCKED_TOKEN_SYNC_SECONDS마다 증분 sync
+    - BLOCKED_TOKEN_SWEEP_SECONDS마다 만료 토큰 삭제 후 인덱스 재생성
+    """
+    last_sweep = time.monotonic()
+    while True:
+        try:
+            if not blocked_token_index.ready:
+                count = await run_in_threadpool(warm_blocked_token_index)
+                logger.info(f"Blocked token index warmed with {count} tokens")
+            elif time.monotonic() - last_sweep >= settings.BLOCKED_TOKEN_SWEEP_SECONDS:
+                last_sweep = time.monotonic()
+                deleted = await run_in_threadpool(
+                    sweep_expired_blocked_tokens,
+                    settings.BLOCKED_TOKEN_SWEEP_BATCH_SIZE,
+                )
+                logger.info(f"Deleted {deleted} expired blocked tokens")
+                await run_in_threadpool(warm_blocked_token_index)
+            else:
+                await run_in_threadpool(sync_blocked_token_index)
+        except Exception as e:
+            # sync가 밀린 인덱스는 믿을 수 없으므로 DB 조회로 되돌리고 다음 주기에 다시 warm 합니다.
+            blocked_token_index.reset()
+            logger.error(f"Blocked token maintenance failed: {e}", exc_info=True)
+        await asyncio.sleep(settings.BLOCKED_TOKEN_SYNC_SECONDS)
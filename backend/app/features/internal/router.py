@@ -0,0 +1,51 @@
+import hmac
+import os
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+
+from app.common.errors import PermissionDeniedError
+from app.common.llm import llm_clients
+from app.common.llm_cache import llm_cache_stats
+from app.core.config import settings
+from app.database.session import get_pool_metrics
+from app.features.auth.blocklist import blocked_token_index
+from app.features.user.cache import user_cache
+
+
+def verify_internal_token(
+    x_internal_token: Annotated[str | None, Header()] = None,
+) -> None:
+    # 토큰이 설정되지 않은 환경에서는 엔드포인트 자체를 숨깁니다.
+    if not settings.INTERNAL_METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    # 비교 시간으로 토큰이 드러나지 않도록 상수 시간 비교
+    if x_internal_token is None or not hmac.compare_digest(
+        x_internal_token.encode(), settings.INTERNAL_METRICS_TOKEN.encode()
+    ):
+        raise PermissionDeniedError()
+
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["internal"],
+    include_in_schema=False,
+    dependencies=[Depends(verify_internal_token)],
+)
+
+
+@router.get(
+    "/metrics",
+    status_code=status.HTTP_200_OK,
+    summary="Process-local runtime metrics (DB pool, caches, LLM clients)",
+)
+def get_metrics() -> dict:
+    # 카운터는 worker(프로세스) 단위이므로 pid를 함께 반환합니다.
+    return {
+        "pid": os.getpid(),
+        "db_pool": get_pool_metrics(),
+        "user_cache": user_cache.stats(),
+        "blocked_token_index": blocked_token_index.stats(),
+        "llm_cache": llm_cache_stats.snapshot(),
+        "llm_clients": llm_clients.stats(),
+    }
@@ -0,0 +1,13 @@
+from fastapi import HTTPException
+
+
+class JobNotFoundError(HTTPException):
+    def __init__(self, job_id: int) -> None:
+        super().__init__(status_code=404, detail=f"Job with ID {job_id} not found")
+
+
+class JobAccessDeniedError(HTTPException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=403, detail="You do not have permission to access this job"
+        )
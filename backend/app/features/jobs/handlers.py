@@ -0,0 +1,9 @@
+from app.features.analysis.jobs import run_analysis_update
+from app.features.jobs.models import JobKind
+from app.features.jobs.worker import JobHandler
+from app.features.selfaware.jobs import run_value_score_extraction
+
+JOB_HANDLERS: dict[str, JobHandler] = {
+    JobKind.ANALYSIS_UPDATE: run_analysis_update,
+    JobKind.VALUE_SCORE_EXTRACTION: run_value_score_extraction,
+}
@@ -0,0 +1,170 @@
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.database.session import get_db_session
+
+from .models import Job, JobStatus
+
+
+class JobRepository:
+    def __init__(self, session: Annotated[Session, Depends(get_db_session)]) -> None:
+        self.session = session
+
+    def add_job(
+        self,
+        kind: str,
+        user_id: int,
+        payload: dict,
+        dedup_key: str | None,
+        max_attempts: int,
+    ) -> Job:
+        job = Job(
+            kind=kind,
+            user_id=user_id,
+            payload=payload,
+            dedup_key=dedup_key,
+            max_attempts=max_attempts,
+        )
+        self.session.add(job)
+        self.session.flush()
+        return job
+
+    def get_job_by_id(self, job_id: int) -> Job | None:
+        return self.session.get(Job, job_id)
+
+    def get_queued_job_by_dedup_key(self, dedup_key: str) -> Job | None:
+        return self.session.scalar(
+            select(Job)
+            .where(Job.dedup_key == dedup_key, Job.status == JobStatus.QUEUED)
+            .order_by(Job.id)
+            .limit(1)
+        )
+
+    def list_jobs_by_user(
+        self, user_id: int, kind: str | None = None, limit: int = 10
+    ) -> list[Job]:
+        statement = select(Job).where(Job.user_id == user_id)
+        if kind is not None:
+            statement = statement.where(Job.kind == kind)
+        return list(
+            self.session.scalars(statement.order_by(Job.id.desc()).limit(limit))
+        )
+
+    def list_runnable_job_ids(self, now: datetime, limit: int) -> list[int]:
+        return list(
+            self.session.scalars(
+                select(Job.id)
+                .where(Job.status == JobStatus.QUEUED, Job.run_after <= now)
+                .order_by(Job.id)
+                .limit(limit)
+            )
+        )
+
+    def claim_job(self, job_id: int, worker_id: str, now: datetime) -> bool:
+        """
+        queued 상태일 때만 running으로 바꿉니다. (조건부 UPDATE라 worker가 여럿이어도 한 곳만 성공)
+        """
+        result = self.session.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == JobStatus.QUEUED)
+            .values(
+                status=JobStatus.RUNNING,
+                attempts=Job.attempts + 1,
+                locked_by=worker_id,
+                locked_at=now,
+                updated_at=now,
+            )
+        )
+        return result.rowcount == 1
+
+    def skip_duplicate_jobs(self, job: Job, now: datetime) -> int:
+        """
+        실행을 시작한 job과 dedup_key가 같은 대기 job을 skipped로 정리합니다.
+        job 실행 시점의 DB 상태를 읽으므로 먼저 쌓인 요청까지 함께 반영됩니다.
+        """
+        if job.dedup_key is None:
+            return 0
+        result = self.session.execute(
+            update(Job)
+            .where(
+                Job.dedup_key == job.dedup_key,
+                Job.status == JobStatus.QUEUED,
+                Job.id != job.id,
+                Job.run_after <= now,
+            )
+            .values(status=JobStatus.SKIPPED, finished_at=now, updated_at=now)
+        )
+        return result.rowcount
+
+    def mark_succeeded(self, job_id: int, now: datetime) -> None:
+        self._finish(job_id, JobStatus.SUCCEEDED, now, error=None)
+
+    def mark_failed(self, job_id: int, error: str, now: datetime) -> None:
+        self._finish(job_id, JobStatus.FAILED, now, error=error)
+
+    def mark_retry(
+        self, job_id: int, error: str, run_after: datetime, now: datetime
+    ) -> None:
+        self.session.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(
+                status=JobStatus.QUEUED,
+                run_after=run_after,
+                locked_by=None,
+                locked_at=None,
+                last_error=error,
+                updated_at=now,
+            )
+        )
+
+    def requeue_stale_jobs(self, locked_before: datetime, now: datetime) -> int:
+        """
+        worker가 죽어서 running으로 남은 job을 되살립니다.
+        시도 횟수가 남았으면 다시 queued, 아니면 failed 처리합니다.
+        """
+        stale = (
+            Job.status == JobStatus.RUNNING,
+            Job.locked_at < locked_before,
+        )
+        requeued = self.session.execute(
+            update(Job)
+            .where(*stale, Job.attempts < Job.max_attempts)
+            .values(
+                status=JobStatus.QUEUED,
+                run_after=now,
+                locked_by=None,
+                locked_at=None,
+                last_error="worker lock expired",
+                updated_at=now,
+            )
+        ).rowcount
+        self.session.execute(
+            update(Job)
+            .where(*stale)
+            .values(
+                status=JobStatus.FAILED,
+                last_error="worker lock expired",
+                finished_at=now,
+                updated_at=now,
+            )
+        )
+        return requeued
+
+    def _finish(self, job_id: int, status: str, now: datetime, error: str | None):
+        self.session.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(
+                status=status,
+                locked_by=None,
+                locked_at=None,
+                last_error=error,
+                finished_at=now,
+                updated_at=now,
+            )
+        )
@@ -0,0 +1,41 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, status
+
+from app.common.authorization import get_current_user
+from app.features.jobs.schemas.responses import JobListResponse, JobResponse
+from app.features.jobs.service import JobService
+from app.features.user.models import User
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get(
+    "",
+    response_model=JobListResponse,
+    status_code=status.HTTP_200_OK,
+    summary="List my recent background jobs",
+)
+def list_jobs(
+    job_service: Annotated[JobService, Depends()],
+    kind: str | None = Query(
+        None, description="analysis.update | selfaware.value_score"
+    ),
+    limit: int = Query(default=10, le=50, description="Number of jobs to retrieve"),
+    user: User = Depends(get_current_user),
+) -> JobListResponse:
+    return JobListResponse.from_jobs(job_service.list_jobs(user.id, kind, limit))
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get background job status",
+)
+def get_job(
+    job_id: int,
+    job_service: Annotated[JobService, Depends()],
+    user: User = Depends(get_current_user),
+) -> JobResponse:
+    return JobResponse.from_job(job_service.get_owned_job(job_id, user.id))
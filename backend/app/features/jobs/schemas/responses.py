@@ -0,0 +1,39 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from app.features.jobs.models import Job
+
+
+class JobResponse(BaseModel):
+    id: int
+    kind: str
+    status: str  # queued | running | succeeded | failed | skipped
+    attempts: int
+    max_attempts: int
+    run_after: datetime
+    created_at: datetime
+    updated_at: datetime
+    finished_at: datetime | None = None
+
+    @staticmethod
+    def from_job(job: Job) -> "JobResponse":
+        return JobResponse(
+            id=job.id,
+            kind=job.kind,
+            status=job.status,
+            attempts=job.attempts,
+            max_attempts=job.max_attempts,
+            run_after=job.run_after,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+            finished_at=job.finished_at,
+        )
+
+
+class JobListResponse(BaseModel):
+    data: list[JobResponse]
+
+    @staticmethod
+    def from_jobs(jobs: list[Job]) -> "JobListResponse":
+        return JobListResponse(data=[JobResponse.from_job(job) for job in jobs])
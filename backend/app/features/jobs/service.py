@@ -0,0 +1,68 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from app.core.config import settings
+from app.features.jobs.errors import JobAccessDeniedError, JobNotFoundError
+from app.features.jobs.models import Job, JobKind
+from app.features.jobs.repository import JobRepository
+
+
+class JobService:
+    def __init__(
+        self,
+        job_repository: Annotated[JobRepository, Depends()],
+    ) -> None:
+        self.job_repository = job_repository
+
+    def enqueue(
+        self,
+        kind: str,
+        user_id: int,
+        payload: dict | None = None,
+        dedup_key: str | None = None,
+    ) -> Job:
+        """
+        요청 트랜잭션 안에서 job을 추가합니다. (요청이 롤백되면 job도 생기지 않음)
+        같은 dedup_key로 아직 시작하지 않은 job이 있으면 그 job을 반환합니다.
+        """
+        if dedup_key is not None:
+            queued = self.job_repository.get_queued_job_by_dedup_key(dedup_key)
+            if queued is not None:
+                return queued
+        return self.job_repository.add_job(
+            kind=kind,
+            user_id=user_id,
+            payload=payload or {},
+            dedup_key=dedup_key,
+            max_attempts=settings.JOB_MAX_ATTEMPTS,
+        )
+
+    def enqueue_analysis_update(self, user_id: int) -> Job:
+        # 분석은 사용자 단위로 최신 답변 전체를 다시 읽으므로 사용자당 하나면 충분
+        return self.enqueue(
+            JobKind.ANALYSIS_UPDATE,
+            user_id,
+            dedup_key=f"{JobKind.ANALYSIS_UPDATE}:{user_id}",
+        )
+
+    def enqueue_value_score_extraction(
+        self, user_id: int, question_id: int, answer_id: int
+    ) -> Job:
+        return self.enqueue(
+            JobKind.VALUE_SCORE_EXTRACTION,
+            user_id,
+            payload={"question_id": question_id, "answer_id": answer_id},
+            dedup_key=f"{JobKind.VALUE_SCORE_EXTRACTION}:{answer_id}",
+        )
+
+    def get_owned_job(self, job_id: int, user_id: int) -> Job:
+        job = self.job_repository.get_job_by_id(job_id)
+        if job is None:
+            raise JobNotFoundError(job_id)
+        if job.user_id != user_id:
+            raise JobAccessDeniedError()
+        return job
+
+    def list_jobs(self, user_id: int, kind: str | None, limit: int) -> list[Job]:
+        return self.job_repository.list_jobs_by_user(user_id, kind, limit)
@@ -0,0 +1,116 @@
+import logging
+import os
+import socket
+import threading
+from collections.abc import Callable
+from datetime import timedelta
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.database.session import SessionLocal
+from app.features.jobs.models import Job, utcnow
+from app.features.jobs.repository import JobRepository
+
+logger = logging.getLogger(__name__)
+
+# handler(session, user_id, payload). 예외를 던지면 backoff 후 재시도합니다.
+JobHandler = Callable[[Session, int, dict], None]
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """지수 backoff: base * 2^(attempts-1), 최대 JOB_RETRY_MAX_SECONDS"""
+    seconds = settings.JOB_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, settings.JOB_RETRY_MAX_SECONDS))
+
+
+class JobWorker:
+    """
+    jobs 테이블을 polling 하며 job을 하나씩 실행합니다.
+    job 상태 변경과 handler 실행은 서로 다른 세션/트랜잭션에서 처리합니다.
+    """
+
+    def __init__(
+        self,
+        handlers: dict[str, JobHandler],
+        session_factory: sessionmaker = SessionLocal,
+        worker_id: str | None = None,
+    ) -> None:
+        self.handlers = handlers
+        self.session_factory = session_factory
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+
+    def run_forever(self, poll_interval: float, stop: threading.Event) -> None:
+        logger.info(f"Job worker {self.worker_id} started")
+        while not stop.is_set():
+            try:
+                ran = self.run_once()
+            except Exception as e:
+                # DB 연결 문제 등: 잠시 쉬었다가 다시 시도
+                logger.error(f"Job worker loop failed: {e}", exc_info=True)
+                ran = False
+            if not ran:
+                stop.wait(poll_interval)
+        logger.info(f"Job worker {self.worker_id} stopped")
+
+    def run_until_empty(self) -> int:
+        """실행 가능한 job이 없을 때까지 처리하고 처리한 개수를 반환합니다."""
+        count = 0
+        while self.run_once():
+            count += 1
+        return count
+
+    def run_once(self) -> bool:
+        job = self._claim_next_job()
+        if job is None:
+            return False
+        self._execute(job)
+        return True
+
+    def _claim_next_job(self) -> Job | None:
+        now = utcnow()
+        with self.session_factory() as session:
+            repository = JobRepository(session)
+            stale_before = now - timedelta(seconds=settings.JOB_LOCK_TIMEOUT_SECONDS)
+            requeued = repository.requeue_stale_jobs(stale_before, now)
+            if requeued:
+                logger.warning(f"Requeued {requeued} stale jobs")
+            for job_id in repository.list_runnable_job_ids(now, limit=10):
+                if not repository.claim_job(job_id, self.worker_id, now):
+                    continue  # 다른 worker가 먼저 가져감
+                job = repository.get_job_by_id(job_id)
+                repository.skip_duplicate_jobs(job, now)
+                session.commit()
+                session.refresh(job)
+                session.expunge(job)
+                return job
+            session.commit()
+        return None
+
+    def _execute(self, job: Job) -> None:
+        handler = self.handlers.get(job.kind)
+        error: str | None = None
+        if handler is None:
+            error = f"No handler for job kind '{job.kind}'"
+        else:
+            logger.info(f"Running job {job.id} ({job.kind}) attempt {job.attempts}")
+            try:
+                with self.session_factory() as session:
+                    handler(session, job.user_id, job.payload)
+                    session.commit()
+            except Exception as e:
+                logger.error(f"Job {job.id} ({job.kind}) failed: {e}", exc_info=True)
+                error = f"{type(e).__name__}: {e}"
+
+        now = utcnow()
+        with self.session_factory() as session:
+            repository = JobRepository(session)
+            if error is None:
+                repository.mark_succeeded(job.id, now)
+            elif handler is not None and job.attempts < job.max_attempts:
+                repository.mark_retry(
+                    job.id, error, now + retry_delay(job.attempts), now
+                )
+            else:
+                repository.mark_failed(job.id, error, now)
+            session.commit()
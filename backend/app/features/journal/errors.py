@@ -8,6 +8,13 @@ class JournalNotFoundError(HTTPException):
         )
 
 
+class JournalImageNotFoundError(HTTPException):
+    def __init__(self, journal_id: int) -> None:
+        super().__init__(
+            status_code=404, detail=f"Journal with ID {journal_id} has no image"
+        )
+
+
 class UnauthorizedAccessError(HTTPException):
     def __init__(self) -> None:
         super().__init__(
@@ -1,15 +1,22 @@
 import os
 import uuid
-from functools import partial
 from typing import Annotated
 
 from fastapi import Depends
-from fastapi.concurrency import run_in_threadpool
 
 from app.features.journal.errors import ImageUploadError, JournalNotFoundError
 from app.features.journal.models import JournalImage
-from app.features.journal.repository import JournalRepository, S3Repository
-from app.features.journal.schemas.responses import PresignedUrlResponse
+from app.features.journal.repository import (
+    AsyncJournalRepository,
+    S3Repository,
+    get_s3_repository,
+)
+from app.features.journal.schemas.requests import ImageUploadBatchItem
+from app.features.journal.schemas.responses import (
+    ImageUrlResponse,
+    PresignedUrlBatchItem,
+    PresignedUrlResponse,
+)
 
 
 class JournalImageFacade:
@@ -20,8 +27,8 @@ class JournalImageFacade:
 
     def __init__(
         self,
-        journal_repository: Annotated[JournalRepository, Depends()],
-        s3_repository: Annotated[S3Repository, Depends()],
+        journal_repository: Annotated[AsyncJournalRepository, Depends()],
+        s3_repository: Annotated[S3Repository, Depends(get_s3_repository)],
     ) -> None:
         self.journal_repository = journal_repository
         self.s3_repository = s3_repository
@@ -29,33 +36,49 @@ class JournalImageFacade:
     async def initiate_image_upload(
         self, journal_id: int, filename: str, content_type: str
     ) -> PresignedUrlResponse:
-        """Upload initiation: generate UUID filename and presigned URL."""
-        find_journal_task = partial(
-            self.journal_repository.get_journal_by_id, journal_id=journal_id
-        )
-        journal = await run_in_threadpool(find_journal_task)
+        """
+        Upload initiation: generate UUID filename and presigned URL.
+        Journal ownership must be checked by the caller (router).
+        """
+        s3_key = self._new_image_key(journal_id, filename)
+        url_data = await self.s3_repository.generate_upload_url(s3_key, content_type)
+        return PresignedUrlResponse(**url_data, s3_key=s3_key)
 
-        if not journal:
-            raise JournalNotFoundError(journal_id)
+    async def initiate_image_uploads(
+        self, uploads: list[ImageUploadBatchItem]
+    ) -> list[PresignedUrlBatchItem]:
+        """여러 업로드의 presigned URL을 한 번에 발급 (로컬 서명이라 순서대로 처리)"""
+        items = []
+        for upload in uploads:
+            presigned = await self.initiate_image_upload(
+                upload.journal_id, upload.filename, upload.content_type
+            )
+            items.append(
+                PresignedUrlBatchItem(
+                    journal_id=upload.journal_id, **presigned.model_dump()
+                )
+            )
+        return items
+
+    def get_image_url(self, journal_image: JournalImage) -> ImageUrlResponse:
+        """이미지 조회용 presigned GET URL (만료 전까지 s3_key별 캐시)"""
+        url_data = self.s3_repository.generate_download_url(journal_image.s3_key)
+        return ImageUrlResponse(
+            journal_id=journal_image.journal_id,
+            s3_key=journal_image.s3_key,
+            **url_data,
+        )
 
+    @staticmethod
+    def _new_image_key(journal_id: int, filename: str) -> str:
         # Create unique file key
         _, file_extension = os.path.splitext(filename)
         unique_filename = f"{uuid.uuid4()}{file_extension}"
-        s3_key = f"images/journals/{journal_id}/{unique_filename}"
-
-        # Build S3 upload URL
-        url_data = await self.s3_repository.generate_upload_url(s3_key, content_type)
-        if not url_data:
-            raise ImageUploadError("Could not generate S3 presigned URL.")
-
-        return PresignedUrlResponse(**url_data, s3_key=s3_key)
+        return f"images/journals/{journal_id}/{unique_filename}"
 
     async def finalize_image_upload(self, journal_id: int, s3_key: str) -> JournalImage:
         """업로드 완료: S3 확인 및 DB 갱신"""
-        find_journal_task = partial(
-            self.journal_repository.get_journal_by_id, journal_id=journal_id
-        )
-        journal = await run_in_threadpool(find_journal_task)
+        journal = await self.journal_repository.get_journal_by_id(journal_id)
         if not journal:
             raise JournalNotFoundError(journal_id)
 
@@ -63,17 +86,12 @@ class JournalImageFacade:
         if not file_exists:
             raise ImageUploadError("Uploaded image not found in S3.")
 
-        existing = await run_in_threadpool(
-            self.journal_repository.get_image_by_journal_id, journal_id
-        )
-
-        replace_task = partial(
-            self.journal_repository.replace_journal_image,
+        existing = await self.journal_repository.get_image_by_journal_id(journal_id)
+        journal_image = await self.journal_repository.replace_journal_image(
             journal_id=journal_id,
             existing_image=existing,
             s3_key=s3_key,
         )
-        journal_image = await run_in_threadpool(replace_task)
 
         if existing and existing.s3_key:
             await self.s3_repository.delete_object(existing.s3_key)
@@ -0,0 +1,180 @@
+"""
+키워드 역색인(keywords + journal_keyword_postings)용 SQL.
+
+journal의 키워드를 저장할 때 같은 트랜잭션에서 사전에 없는 키워드를 추가하고
+(INSERT IGNORE / ON CONFLICT DO NOTHING) 해당 journal의 posting을 교체합니다.
+검색은 posting의 (keyword_id, user_id, journal_id) primary key 범위만 읽으므로
+journal마다 키워드를 확인(EXISTS)하던 방식과 달리 키워드가 나온 journal만 봅니다.
+키워드 하나를 정확히 검색하면 정렬 없이 primary key 순서로 limit개만 읽습니다.
+"""
+
+import unicodedata
+
+from sqlalchemy import (
+    Delete,
+    Executable,
+    Insert,
+    Integer,
+    Select,
+    and_,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+)
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.orm import aliased
+
+from app.features.journal.models import (
+    Journal,
+    JournalKeyword,
+    JournalKeywordPosting,
+    Keyword,
+)
+
+# 한 번에 검색할 수 있는 키워드 수
+MAX_QUERY_KEYWORDS = 10
+
+
+def normalize_keyword(keyword: str) -> str:
+    return unicodedata.normalize("NFC", keyword.strip()).lower()
+
+
+def insert_keywords(dialect_name: str) -> Insert:
+    """사전에 없는 키워드만 추가 (executemany로 {"name": ...} 목록 전달)"""
+    if dialect_name == "mysql":
+        return mysql.insert(Keyword).prefix_with("IGNORE")
+    # SQLite(로컬/테스트)
+    return sqlite.insert(Keyword).on_conflict_do_nothing(index_elements=[Keyword.name])
+
+
+def delete_postings(journal_id: int) -> Delete:
+    return delete(JournalKeywordPosting).where(
+        JournalKeywordPosting.journal_id == journal_id
+    )
+
+
+def insert_postings(journal_id: int, names: list[str]) -> Insert:
+    """journal의 키워드 posting (user_id는 journals에서 가져옴)"""
+    user_id = select(Journal.user_id).where(Journal.id == journal_id)
+    return insert(JournalKeywordPosting).from_select(
+        ["keyword_id", "user_id", "journal_id"],
+        select(
+            Keyword.id, user_id.scalar_subquery(), literal(journal_id, Integer)
+        ).where(Keyword.name.in_(names)),
+    )
+
+
+def replace_postings(
+    dialect_name: str, journal_id: int, keywords: list[str]
+) -> list[tuple[Executable, list[dict] | None]]:
+    """journal의 posting을 교체하는 문장 (사전에 없는 키워드는 추가)"""
+    names = list(dict.fromkeys(normalize_keyword(keyword) for keyword in keywords))
+    statements: list[tuple[Executable, list[dict] | None]] = [
+        (delete_postings(journal_id), None)
+    ]
+    if names:
+        statements.append(
+            (insert_keywords(dialect_name), [{"name": name} for name in names])
+        )
+        statements.append((insert_postings(journal_id, names), None))
+    return statements
+
+
+def rebuild_source_rows() -> Select:
+    """posting을 다시 만들 (keyword, user_id, journal_id) 원본 행"""
+    return select(
+        JournalKeyword.keyword, Journal.user_id, JournalKeyword.journal_id
+    ).join(Journal, Journal.id == JournalKeyword.journal_id)
+
+
+def rebuild_posting_rows(rows, keyword_ids: dict[str, int]) -> list[dict]:
+    """
+    원본 행을 posting 파라미터로 바꿉니다. 키워드를 저장할 때와 같은 키가 되도록
+    SQL(lower/trim)이 아니라 normalize_keyword로 정규화합니다.
+    """
+    postings = dict.fromkeys(
+        (keyword_ids[normalize_keyword(keyword)], user_id, journal_id)
+        for keyword, user_id, journal_id in rows
+    )
+    return [
+        {"keyword_id": keyword_id, "user_id": user_id, "journal_id": journal_id}
+        for keyword_id, user_id, journal_id in postings
+    ]
+
+
+def _starts_with(keyword: str, dialect_name: str):
+    if dialect_name == "sqlite":
+        # SQLite LIKE는 대소문자를 무시해서 인덱스를 못 쓰므로 BINARY 순서 범위로 검색
+        upper = keyword[:-1] + chr(ord(keyword[-1]) + 1)
+        return and_(Keyword.name >= keyword, Keyword.name < upper)
+    # 상수 패턴('abc%')이어야 MySQL이 name unique 인덱스를 범위로 읽음
+    pattern = keyword.replace("/", "//").replace("%", "/%").replace("_", "/_")
+    return Keyword.name.like(pattern + "%", escape="/")
+
+
+def _matches_keywords(keyword_id, keywords: list[str], prefix: bool, dialect_name: str):
+    """posting의 keyword_id가 키워드 중 하나와 일치하는 조건"""
+    if not prefix:
+        if len(keywords) == 1:
+            # '=' 조건이어야 posting을 primary key 순서(journal_id)로 읽음
+            return keyword_id == (
+                select(Keyword.id).where(Keyword.name == keywords[0]).scalar_subquery()
+            )
+        return keyword_id.in_(select(Keyword.id).where(Keyword.name.in_(keywords)))
+    return keyword_id.in_(
+        select(Keyword.id).where(
+            or_(*(_starts_with(keyword, dialect_name) for keyword in keywords))
+        )
+    )
+
+
+def matching_journal_ids(
+    dialect_name: str,
+    user_id: int,
+    keywords: list[str],
+    match_all: bool = True,
+    prefix: bool = False,
+    limit: int = 10,
+    cursor: int | None = None,
+) -> Select:
+    """
+    키워드를 모두(match_all) 또는 하나라도 가진 사용자의 journal_id (최신 순, limit개).
+    prefix=True면 각 키워드로 시작하는 키워드도 일치로 봅니다.
+    """
+    first = aliased(JournalKeywordPosting)
+    groups = [[keyword] for keyword in keywords] if match_all else [keywords]
+    stmt = select(first.journal_id).where(
+        first.user_id == user_id,
+        _matches_keywords(first.keyword_id, groups[0], prefix, dialect_name),
+    )
+    # AND: 나머지 키워드의 posting을 (keyword_id, user_id, journal_id) PK로 확인
+    for group in groups[1:]:
+        other = aliased(JournalKeywordPosting)
+        stmt = stmt.join(
+            other,
+            (other.user_id == first.user_id)
+            & (other.journal_id == first.journal_id)
+            & _matches_keywords(other.keyword_id, group, prefix, dialect_name),
+        )
+    if cursor is not None:
+        stmt = stmt.where(first.journal_id < cursor)
+    if prefix or len(groups[0]) > 1:
+        # 키워드 id가 여러 개면 한 journal이 여러 번 나올 수 있음
+        stmt = stmt.distinct()
+    return stmt.order_by(first.journal_id.desc()).limit(limit)
+
+
+def top_keywords(user_id: int, limit: int) -> Select:
+    """사용자의 journal에 많이 나온 키워드 (keyword, journal 수)"""
+    journal_count = func.count().label("journal_count")
+    return (
+        select(Keyword.name.label("keyword"), journal_count)
+        .join(JournalKeywordPosting, JournalKeywordPosting.keyword_id == Keyword.id)
+        .where(JournalKeywordPosting.user_id == user_id)
+        .group_by(Keyword.id, Keyword.name)
+        .order_by(journal_count.desc(), Keyword.name)
+        .limit(limit)
+    )
@@ -3,7 +3,17 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.common.utilities import get_korea_time
@@ -16,6 +26,20 @@ if TYPE_CHECKING:
 
 class Journal(Base):
     __tablename__ = "journals"
+    __table_args__ = (
+        # 목록/키워드 검색(user_id + id DESC 커서), 기간 검색(user_id + created_at)
+        Index("ix_journals_user_id_id", "user_id", "id"),
+        Index("ix_journals_user_id_created_at", "user_id", "created_at"),
+        # 전문 검색 (한국어는 띄어쓰기 단위가 아니라 2글자 ngram으로 색인)
+        Index(
+            "ft_journals_title_content_gratitude",
+            "title",
+            "content",
+            "gratitude",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ).ddl_if(dialect="mysql"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(
@@ -45,8 +69,42 @@ class Journal(Base):
     )
 
 
+# SQLite(로컬/테스트)는 FULLTEXT 대신 journals를 external content로 쓰는 FTS5(trigram)
+# 테이블을 trigger로 동기화합니다. (app.features.journal.search 참고)
+JOURNALS_FTS_SQLITE_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS journals_fts USING fts5("
+    "title, content, gratitude, content='journals', content_rowid='id', "
+    "tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS journals_fts_ai AFTER INSERT ON journals BEGIN "
+    "INSERT INTO journals_fts(rowid, title, content, gratitude) "
+    "VALUES (new.id, new.title, new.content, new.gratitude); END",
+    "CREATE TRIGGER IF NOT EXISTS journals_fts_ad AFTER DELETE ON journals BEGIN "
+    "INSERT INTO journals_fts(journals_fts, rowid, title, content, gratitude) "
+    "VALUES ('delete', old.id, old.title, old.content, old.gratitude); END",
+    "CREATE TRIGGER IF NOT EXISTS journals_fts_au "
+    "AFTER UPDATE OF title, content, gratitude ON journals BEGIN "
+    "INSERT INTO journals_fts(journals_fts, rowid, title, content, gratitude) "
+    "VALUES ('delete', old.id, old.title, old.content, old.gratitude); "
+    "INSERT INTO journals_fts(rowid, title, content, gratitude) "
+    "VALUES (new.id, new.title, new.content, new.gratitude); END",
+)
+
+for _statement in JOURNALS_FTS_SQLITE_DDL:
+    event.listen(
+        Journal.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="sqlite"),
+    )
+event.listen(
+    Journal.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS journals_fts").execute_if(dialect="sqlite"),
+)
+
+
 class JournalImage(Base):
     __tablename__ = "journal_images"
+    __table_args__ = (Index("ix_journal_images_journal_id", "journal_id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     journal_id: Mapped[int] = mapped_column(
@@ -69,6 +127,9 @@ class JournalImage(Base):
 
 class JournalEmotion(Base):
     __tablename__ = "journal_emotions"
+    __table_args__ = (
+        Index("ix_journal_emotions_journal_id_emotion", "journal_id", "emotion"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     journal_id: Mapped[int] = mapped_column(
@@ -85,13 +146,18 @@ class JournalEmotion(Base):
 
 class JournalKeyword(Base):
     __tablename__ = "journal_keywords"
+    __table_args__ = (
+        Index("ix_journal_keywords_journal_id", "journal_id"),
+        # 키워드 검색(keyword -> journal_id). keyword 단독 조회도 이 인덱스를 사용
+        Index("ix_journal_keywords_keyword_journal_id", "keyword", "journal_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     journal_id: Mapped[int] = mapped_column(
         ForeignKey("journals.id", ondelete="CASCADE"), nullable=False
     )
 
-    keyword: Mapped[str] = mapped_column(String(100), index=True, nullable=False)
+    keyword: Mapped[str] = mapped_column(String(100), nullable=False)
     emotion: Mapped[str] = mapped_column(String(50), nullable=False)
     summary: Mapped[str] = mapped_column(String(100), nullable=False)
     weight: Mapped[float] = mapped_column(Float, nullable=False)
@@ -101,6 +167,44 @@ class JournalKeyword(Base):
     journal: Mapped[Journal] = relationship(back_populates="keywords")
 
 
+class Keyword(Base):
+    """
+    키워드 사전. name은 journal_keywords의 keyword를 normalize_keyword로
+    정규화(공백 제거, NFC, 소문자)한 값입니다.
+    """
+
+    __tablename__ = "keywords"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
+
+
+class JournalKeywordPosting(Base):
+    """
+    키워드 역색인: keyword_id -> (user_id, journal_id).
+    키워드를 저장할 때 journal_keywords와 함께 갱신합니다. (app.features.journal.keyword_index)
+    """
+
+    __tablename__ = "journal_keyword_postings"
+    __table_args__ = (
+        # 사용자별 키워드 집계 (top keywords)
+        Index(
+            "ix_journal_keyword_postings_user_id_keyword_id", "user_id", "keyword_id"
+        ),
+        Index("ix_journal_keyword_postings_journal_id", "journal_id"),
+    )
+
+    keyword_id: Mapped[int] = mapped_column(
+        ForeignKey("keywords.id", ondelete="CASCADE"), primary_key=True
+    )
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    journal_id: Mapped[int] = mapped_column(
+        ForeignKey("journals.id", ondelete="CASCADE"), primary_key=True
+    )
+
+
 # class JournalCausality(Base):
 #     __tablename__ = "journal_causalities"
 
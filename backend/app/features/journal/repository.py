@@ -1,18 +1,90 @@
 from datetime import date, datetime, timedelta
-from typing import IO, Annotated
+from typing import IO, Annotated, Any
 
-import boto3
 from botocore.exceptions import ClientError
 from fastapi import Depends
 from fastapi.concurrency import run_in_threadpool
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.sql import Select
 
+from app.common.utilities import get_korea_time
 from app.core.config import settings
-from app.database.session import get_db_session
+from app.database.session import get_async_db_session, get_db_session
+from app.features.journal.keyword_index import (
+    delete_postings,
+    insert_keywords,
+    matching_journal_ids,
+    normalize_keyword,
+    rebuild_posting_rows,
+    rebuild_source_rows,
+    replace_postings,
+    top_keywords,
+)
+from app.features.journal.presign import S3Presigner, presigned_get_urls
 from app.features.journal.schemas.responses import KeywordEmotionAssociationItem
-
-from .models import Journal, JournalEmotion, JournalImage, JournalKeyword
+from app.features.journal.search import after_cursor, text_score_query
+from app.features.journal.storage import s3_clients
+from app.features.statistics.rollup import (
+    Statements,
+    emotion_rollup_statements,
+    keyword_rollup_statements,
+    stored_keywords_query,
+)
+
+from .models import (
+    Journal,
+    JournalEmotion,
+    JournalImage,
+    JournalKeyword,
+    JournalKeywordPosting,
+    Keyword,
+)
+
+# 목록 조회 시 응답에 필요한 자식 테이블(emotions/keywords/image)을
+# 페이지 단위로 한 번에 가져오는 로더 전략 (N+1 방지: 1 + 3 쿼리로 고정)
+JOURNAL_LIST_LOADER_OPTIONS = (
+    selectinload(Journal.emotions),
+    selectinload(Journal.keywords),
+    selectinload(Journal.image),
+)
+
+
+def _delete_journal_statements(
+    dialect_name: str, journal: Journal, stored_keywords: list
+) -> Statements:
+    """journal 삭제 전에 감정/키워드 rollup에서 빼고 posting을 지우는 문장"""
+    statements = emotion_rollup_statements(dialect_name, journal, -1)
+    if stored_keywords:
+        statements += keyword_rollup_statements(
+            dialect_name,
+            journal.user_id,
+            journal.created_at.date(),
+            stored_keywords,
+            [],
+        )
+    statements.append((delete_postings(journal.id), None))
+    return statements
+
+
+def _replace_keywords_statements(
+    dialect_name: str,
+    journal_id: int,
+    owner: tuple[int, datetime] | None,
+    stored_keywords: list,
+    associations: list[KeywordEmotionAssociationItem],
+) -> Statements:
+    """키워드 교체 후 posting을 바꾸고 키워드 rollup에 변경분을 반영하는 문장"""
+    statements = replace_postings(
+        dialect_name, journal_id, [entry.keyword for entry in associations]
+    )
+    if owner is not None:
+        user_id, created_at = owner
+        statements += keyword_rollup_statements(
+            dialect_name, user_id, created_at.date(), stored_keywords, associations
+        )
+    return statements
 
 
 class JournalRepository:
@@ -31,6 +103,7 @@ class JournalRepository:
             user_id=user_id,
             title=title,
             content=content,
+            created_at=get_korea_time(),
         )
 
         for emotion_name, intensity_value in emotions.items():
@@ -44,20 +117,42 @@ class JournalRepository:
 
         self.session.add(journal)
         self.session.flush()
+        self._execute_all(emotion_rollup_statements(self._dialect_name, journal, 1))
         return journal
 
     def get_journal_by_id(self, journal_id: int) -> Journal | None:
         return self.session.get(Journal, journal_id)
 
+    def get_journal_owners(self, journal_ids: list[int]) -> dict[int, int]:
+        """journal_id -> user_id (없는 journal은 포함되지 않음)"""
+        rows = self.session.execute(
+            select(Journal.id, Journal.user_id).where(Journal.id.in_(journal_ids))
+        )
+        return {journal_id: user_id for journal_id, user_id in rows}
+
     def delete_journal(self, journal: Journal) -> None:
+        stored_keywords = list(self.session.execute(stored_keywords_query(journal.id)))
+        self._execute_all(
+            _delete_journal_statements(self._dialect_name, journal, stored_keywords)
+        )
         self.session.delete(journal)
 
+    @property
+    def _dialect_name(self) -> str:
+        return self.session.get_bind().dialect.name
+
+    def _execute_all(self, statements: Statements) -> None:
+        """rollup/역색인 유지 문장을 같은 트랜잭션에서 순서대로 실행"""
+        for statement, parameters in statements:
+            self.session.execute(statement, parameters)
+
     def list_journals_by_user(
         self, user_id: int, limit: int = 10, cursor: int | None = None
     ) -> list[Journal]:
         # cursor가 None이면 최신 글부터, cursor가 주어지면 해당 ID보다 작은 글부터
         query = (
             self.session.query(Journal)
+            .options(*JOURNAL_LIST_LOADER_OPTIONS)
             .filter(Journal.user_id == user_id)
             .order_by(Journal.id.desc())
         )
@@ -91,7 +186,11 @@ class JournalRepository:
         limit: int = 10,
         cursor: int | None = None,
     ) -> list[Journal]:
-        query = self.session.query(Journal).filter(Journal.user_id == user_id)
+        query = (
+            self.session.query(Journal)
+            .options(*JOURNAL_LIST_LOADER_OPTIONS)
+            .filter(Journal.user_id == user_id)
+        )
 
         if title:
             query = query.filter(Journal.title.ilike(f"%{title}%"))
@@ -112,6 +211,26 @@ class JournalRepository:
 
         return query.limit(limit).all()
 
+    def full_text_search(
+        self,
+        user_id: int,
+        terms: list[str],
+        limit: int = 10,
+        cursor: tuple[float, int] | None = None,
+    ) -> list[tuple[Journal, float]]:
+        """title/content/gratitude 전문 검색. 관련도(score) 높은 순, 같으면 최신 순"""
+        dialect_name = self.session.get_bind().dialect.name
+        scored = text_score_query(dialect_name, user_id, terms).subquery()
+        stmt = (
+            select(Journal, scored.c.score)
+            .join(scored, scored.c.id == Journal.id)
+            .options(*JOURNAL_LIST_LOADER_OPTIONS)
+        )
+        if cursor is not None:
+            stmt = stmt.where(after_cursor(scored, cursor))
+        stmt = stmt.order_by(scored.c.score.desc(), scored.c.id.desc()).limit(limit)
+        return [(journal, score) for journal, score in self.session.execute(stmt)]
+
     def add_keywords_emotion_associations(
         self,
         journal_id: int,
@@ -119,7 +238,11 @@ class JournalRepository:
     ) -> list[JournalKeyword]:
         # delete the existing keywords list
         journal = self.get_journal_by_id(journal_id)
+        stored_keywords = []
         if journal:
+            stored_keywords = list(
+                self.session.execute(stored_keywords_query(journal_id))
+            )
             self.drop_journal_keywords(journal_id)
         journal_keyword_list = []
         for entry in keyword_emotion_associations:
@@ -133,6 +256,15 @@ class JournalRepository:
             self.session.add(journal_keyword)
             journal_keyword_list.append(journal_keyword)
         self.session.flush()
+        self._execute_all(
+            _replace_keywords_statements(
+                self._dialect_name,
+                journal_id,
+                (journal.user_id, journal.created_at) if journal else None,
+                stored_keywords,
+                keyword_emotion_associations,
+            )
+        )
         return journal_keyword_list
 
     def get_journals_by_keyword(
@@ -142,15 +274,64 @@ class JournalRepository:
         limit: int = 10,
         cursor: int | None = None,
     ) -> list[Journal]:
-        stmt = select(Journal).where(
-            Journal.user_id == user_id,
-            Journal.keywords.any(JournalKeyword.keyword == keyword),
+        return self.get_journals_by_keywords(
+            user_id, [keyword], limit=limit, cursor=cursor
+        )
+
+    def get_journals_by_keywords(
+        self,
+        user_id: int,
+        keywords: list[str],
+        match_all: bool = True,
+        prefix: bool = False,
+        limit: int = 10,
+        cursor: int | None = None,
+    ) -> list[Journal]:
+        """키워드 역색인으로 검색 (match_all: AND / OR, prefix: 접두어 일치)"""
+        journal_ids = matching_journal_ids(
+            self.session.get_bind().dialect.name,
+            user_id,
+            [normalize_keyword(keyword) for keyword in keywords],
+            match_all=match_all,
+            prefix=prefix,
+            limit=limit,
+            cursor=cursor,
+        ).subquery()
+        stmt = (
+            select(Journal)
+            .options(*JOURNAL_LIST_LOADER_OPTIONS)
+            .join(journal_ids, journal_ids.c.journal_id == Journal.id)
+            .order_by(Journal.id.desc())
         )
-        if cursor is not None:
-            stmt = stmt.where(Journal.id < cursor)
-        stmt = stmt.order_by(Journal.id.desc()).limit(limit)
         return self.session.execute(stmt).scalars().all()
 
+    def get_top_keywords(self, user_id: int, limit: int = 10) -> list:
+        """(keyword, journal_count) 목록, 많이 나온 순"""
+        return self.session.execute(top_keywords(user_id, limit)).all()
+
+    def rebuild_keyword_index(self, batch_size: int = 1000) -> int:
+        """
+        journal_keywords 전체로 키워드 사전과 posting을 다시 만듭니다.
+        (역색인 도입 전 데이터 backfill, 또는 색인이 어긋났을 때)
+        """
+        rows = self.session.execute(rebuild_source_rows()).all()
+        names = list(dict.fromkeys(normalize_keyword(row.keyword) for row in rows))
+        dialect_name = self.session.get_bind().dialect.name
+        for start in range(0, len(names), batch_size):
+            self.session.execute(
+                insert_keywords(dialect_name),
+                [{"name": name} for name in names[start : start + batch_size]],
+            )
+        keyword_ids = dict(self.session.execute(select(Keyword.name, Keyword.id)).all())
+        postings = rebuild_posting_rows(rows, keyword_ids)
+        self.session.execute(delete(JournalKeywordPosting))
+        for start in range(0, len(postings), batch_size):
+            self.session.execute(
+                insert(JournalKeywordPosting), postings[start : start + batch_size]
+            )
+        self.session.commit()
+        return len(postings)
+
     def drop_journal_keywords(
         self,
         journal_id: int,
@@ -197,33 +378,273 @@ class JournalRepository:
         return new_image
 
 
-class S3Repository:
-    def __init__(self):
-        self.s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_REGION,
+class AsyncJournalRepository:
+    """
+    JournalRepository의 AsyncSession 버전.
+    async 라우트에서 쿼리마다 run_in_threadpool을 거치지 않도록 사용합니다.
+    async 세션에서는 lazy load가 불가하므로 자식 테이블은 항상 eager load 합니다.
+    """
+
+    def __init__(
+        self, session: Annotated[AsyncSession, Depends(get_async_db_session)]
+    ) -> None:
+        self.session = session
+
+    async def add_journal(
+        self,
+        user_id: int,
+        title: str,
+        content: str,
+        emotions: dict[str, int],
+        gratitude: str | None = None,
+    ) -> Journal:
+        journal = Journal(
+            user_id=user_id,
+            title=title,
+            content=content,
+            gratitude=gratitude or None,
+            created_at=get_korea_time(),
+            emotions=[
+                JournalEmotion(emotion=emotion_name, intensity=intensity_value)
+                for emotion_name, intensity_value in emotions.items()
+            ],
+            keywords=[],
+            image=None,
         )
-        self.bucket_name = settings.AWS_S3_BUCKET_NAME
+        self.session.add(journal)
+        await self.session.flush()
+        await self._execute_all(
+            emotion_rollup_statements(self._dialect_name, journal, 1)
+        )
+        return journal
 
-    async def generate_upload_url(self, s3_key: str, content_type: str) -> dict | None:
-        try:
-            presigned_url = await run_in_threadpool(
-                self.s3_client.generate_presigned_url,
-                ClientMethod="put_object",
-                Params={
-                    "Bucket": self.bucket_name,
-                    "Key": s3_key,
-                    "ContentType": content_type,
-                },
-                ExpiresIn=3600,
+    async def get_journal_by_id(self, journal_id: int) -> Journal | None:
+        return await self.session.get(
+            Journal, journal_id, options=JOURNAL_LIST_LOADER_OPTIONS
+        )
+
+    async def get_journal_owners(self, journal_ids: list[int]) -> dict[int, int]:
+        """journal_id -> user_id (없는 journal은 포함되지 않음)"""
+        rows = await self.session.execute(
+            select(Journal.id, Journal.user_id).where(Journal.id.in_(journal_ids))
+        )
+        return {journal_id: user_id for journal_id, user_id in rows}
+
+    async def delete_journal(self, journal: Journal) -> None:
+        stored_keywords = (
+            await self.session.execute(stored_keywords_query(journal.id))
+        ).all()
+        await self._execute_all(
+            _delete_journal_statements(self._dialect_name, journal, stored_keywords)
+        )
+        await self.session.delete(journal)
+
+    @property
+    def _dialect_name(self) -> str:
+        return self.session.get_bind().dialect.name
+
+    async def _execute_all(self, statements: Statements) -> None:
+        for statement, parameters in statements:
+            await self.session.execute(statement, parameters)
+
+    async def list_journals_by_user(
+        self, user_id: int, limit: int = 10, cursor: int | None = None
+    ) -> list[Journal]:
+        stmt = select(Journal).where(Journal.user_id == user_id)
+        if cursor is not None:
+            stmt = stmt.where(Journal.id < cursor)
+        return await self._fetch_page(stmt, limit)
+
+    async def update_journal(
+        self,
+        journal: Journal,
+        title: str | None = None,
+        content: str | None = None,
+        gratitude: str | None = None,
+    ) -> None:
+        if title is not None:
+            journal.title = title
+        if content is not None:
+            journal.content = content
+        if gratitude is not None:
+            journal.gratitude = gratitude
+        await self.session.flush()
+
+    async def search_journals(
+        self,
+        user_id: int,
+        title: str | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        limit: int = 10,
+        cursor: int | None = None,
+    ) -> list[Journal]:
+        stmt = select(Journal).where(Journal.user_id == user_id)
+
+        if title:
+            stmt = stmt.where(Journal.title.ilike(f"%{title}%"))
+        if start_date:
+            stmt = stmt.where(
+                Journal.created_at >= datetime.combine(start_date, datetime.min.time())
+            )
+        if end_date:
+            stmt = stmt.where(
+                Journal.created_at
+                < datetime.combine(end_date + timedelta(days=1), datetime.min.time())
             )
+        if cursor is not None:
+            stmt = stmt.where(Journal.id < cursor)
+        return await self._fetch_page(stmt, limit)
 
-            final_file_url = f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{s3_key}"
-            return {"presigned_url": presigned_url, "file_url": final_file_url}
-        except ClientError:
-            return None
+    async def add_keywords_emotion_associations(
+        self,
+        journal_id: int,
+        keyword_emotion_associations: list[KeywordEmotionAssociationItem],
+    ) -> list[JournalKeyword]:
+        journal = (
+            await self.session.execute(
+                select(Journal.user_id, Journal.created_at).where(
+                    Journal.id == journal_id
+                )
+            )
+        ).one_or_none()
+        stored_keywords = (
+            await self.session.execute(stored_keywords_query(journal_id))
+        ).all()
+        # delete the existing keywords list
+        await self.drop_journal_keywords(journal_id)
+        journal_keyword_list = [
+            JournalKeyword(
+                journal_id=journal_id,
+                keyword=entry.keyword,
+                emotion=entry.emotion,
+                summary=entry.summary,
+                weight=entry.weight,
+            )
+            for entry in keyword_emotion_associations
+        ]
+        self.session.add_all(journal_keyword_list)
+        await self.session.flush()
+        await self._execute_all(
+            _replace_keywords_statements(
+                self._dialect_name,
+                journal_id,
+                tuple(journal) if journal else None,
+                stored_keywords,
+                keyword_emotion_associations,
+            )
+        )
+        return journal_keyword_list
+
+    async def get_journals_by_keyword(
+        self,
+        user_id: int,
+        keyword: str,
+        limit: int = 10,
+        cursor: int | None = None,
+    ) -> list[Journal]:
+        return await self.get_journals_by_keywords(
+            user_id, [keyword], limit=limit, cursor=cursor
+        )
+
+    async def get_journals_by_keywords(
+        self,
+        user_id: int,
+        keywords: list[str],
+        match_all: bool = True,
+        prefix: bool = False,
+        limit: int = 10,
+        cursor: int | None = None,
+    ) -> list[Journal]:
+        journal_ids = matching_journal_ids(
+            self.session.get_bind().dialect.name,
+            user_id,
+            [normalize_keyword(keyword) for keyword in keywords],
+            match_all=match_all,
+            prefix=prefix,
+            limit=limit,
+            cursor=cursor,
+        ).subquery()
+        stmt = select(Journal).join(journal_ids, journal_ids.c.journal_id == Journal.id)
+        return await self._fetch_page(stmt, limit)
+
+    async def get_top_keywords(self, user_id: int, limit: int = 10) -> list:
+        return (await self.session.execute(top_keywords(user_id, limit))).all()
+
+    async def drop_journal_keywords(self, journal_id: int) -> None:
+        await self.session.execute(
+            delete(JournalKeyword).where(JournalKeyword.journal_id == journal_id)
+        )
+
+    async def get_image_by_journal_id(self, journal_id: int) -> JournalImage | None:
+        return await self.session.scalar(
+            select(JournalImage).where(JournalImage.journal_id == journal_id).limit(1)
+        )
+
+    async def delete_journal_image(self, journal_image: JournalImage) -> None:
+        if journal_image:
+            await self.session.delete(journal_image)
+            await self.session.flush()
+
+    async def replace_journal_image(
+        self,
+        journal_id: int,
+        existing_image: JournalImage | None = None,
+        s3_key: str | None = None,
+    ) -> JournalImage:
+        """
+        같은 journal_id의 기존 이미지를 삭제하고 새 레코드 생성.
+        기존 이미지가 없다면 신규 이미지 레코드 생성.
+        반환값은 새로 생성된 JournalImage 객체.
+        """
+        if existing_image:
+            await self.session.delete(existing_image)
+            await self.session.flush()
+
+        new_image = JournalImage(journal_id=journal_id, s3_key=s3_key)
+        self.session.add(new_image)
+        await self.session.flush()
+        return new_image
+
+    async def _fetch_page(self, stmt: Select, limit: int) -> list[Journal]:
+        stmt = (
+            stmt.options(*JOURNAL_LIST_LOADER_OPTIONS)
+            .order_by(Journal.id.desc())
+            .limit(limit)
+        )
+        result = await self.session.scalars(stmt)
+        return list(result.all())
+
+
+class S3Repository:
+    """
+    boto3 S3 client(프로세스 공유)를 threadpool에서 호출합니다.
+    presigned URL은 네트워크 호출이 없는 로컬 서명이라 client/threadpool 없이 만듭니다.
+    """
+
+    def __init__(self, s3_client: Any = None):
+        self.s3_client = s3_client if s3_client is not None else s3_clients.get()
+        self.bucket_name = settings.AWS_S3_BUCKET_NAME
+        self.presigner = S3Presigner.from_settings()
+
+    def _file_url(self, s3_key: str) -> str:
+        return self.presigner.object_url(s3_key)
+
+    async def generate_upload_url(self, s3_key: str, content_type: str) -> dict:
+        presigned_url = self.presigner.presign(
+            "PUT", s3_key, settings.S3_UPLOAD_URL_EXPIRES_IN, content_type
+        )
+        return {"presigned_url": presigned_url, "file_url": self._file_url(s3_key)}
+
+    def generate_download_url(self, s3_key: str) -> dict:
+        """이미지 조회용 presigned GET URL (s3_key별 캐시)"""
+        url, expires_at = presigned_get_urls.get_or_sign(
+            self.presigner,
+            s3_key,
+            settings.S3_DOWNLOAD_URL_EXPIRES_IN,
+            settings.S3_DOWNLOAD_URL_CACHE_MARGIN,
+        )
+        return {"url": url, "expires_at": expires_at}
 
     async def check_file_exists(self, s3_key: str) -> bool:
         try:
@@ -249,12 +670,12 @@ class S3Repository:
                 Key=s3_key,
                 ExtraArgs={"ContentType": content_type},
             )
-            file_url = f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{s3_key}"
-            return {"file_url": file_url, "s3_key": s3_key}
+            return {"file_url": self._file_url(s3_key), "s3_key": s3_key}
         except ClientError:
             return None
 
     async def delete_object(self, s3_key: str) -> bool:
+        presigned_get_urls.invalidate(self.presigner, s3_key)
         try:
             await run_in_threadpool(
                 self.s3_client.delete_object, Bucket=self.bucket_name, Key=s3_key
@@ -262,3 +683,61 @@ class S3Repository:
             return True
         except ClientError:
             return False
+
+
+class AioS3Repository(S3Repository):
+    """
+    aiobotocore client(프로세스 공유)를 이벤트 루프에서 바로 호출합니다.
+    S3_BACKEND=aiobotocore일 때 사용합니다. (threadpool hop 없음)
+    """
+
+    def __init__(self, s3_client: Any = None):
+        self._s3_client = s3_client
+        self.bucket_name = settings.AWS_S3_BUCKET_NAME
+        self.presigner = S3Presigner.from_settings()
+
+    async def _client(self) -> Any:
+        if self._s3_client is None:
+            self._s3_client = await s3_clients.get_async()
+        return self._s3_client
+
+    async def check_file_exists(self, s3_key: str) -> bool:
+        client = await self._client()
+        try:
+            await client.head_object(Bucket=self.bucket_name, Key=s3_key)
+            return True
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "404":
+                return False
+            raise
+
+    async def upload_file_object(
+        self, file_obj: IO[bytes], s3_key: str, content_type: str
+    ) -> dict | None:
+        # aiobotocore에는 upload_fileobj(s3transfer)가 없어 put_object로 올립니다.
+        client = await self._client()
+        try:
+            await client.put_object(
+                Body=file_obj.read(),
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                ContentType=content_type,
+            )
+            return {"file_url": self._file_url(s3_key), "s3_key": s3_key}
+        except ClientError:
+            return None
+
+    async def delete_object(self, s3_key: str) -> bool:
+        presigned_get_urls.invalidate(self.presigner, s3_key)
+        client = await self._client()
+        try:
+            await client.delete_object(Bucket=self.bucket_name, Key=s3_key)
+            return True
+        except ClientError:
+            return False
+
+
+def get_s3_repository() -> S3Repository:
+    if settings.S3_BACKEND == "aiobotocore":
+        return AioS3Repository()
+    return S3Repository()
@@ -1,5 +1,5 @@
 from datetime import date
-from typing import Annotated
+from typing import Annotated, Literal
 
 from fastapi import APIRouter, Depends, Query, status
 from fastapi.security import HTTPBearer
@@ -9,19 +9,28 @@ from app.features.journal.errors import JournalBadRequestError
 from app.features.journal.schemas.requests import (
     ImageCompletionRequest,
     ImageGenerateRequest,
+    ImageUploadBatchRequest,
     ImageUploadRequest,
     JournalCreateRequest,
     JournalUpdateRequest,
 )
 from app.features.journal.schemas.responses import (
     ImageGenerateResponse,
+    ImageUrlResponse,
     JournalCursorResponse,
     JournalImageResponse,
     JournalKeywordsListResponse,
     JournalResponse,
+    JournalSearchResponse,
+    PresignedUrlBatchResponse,
     PresignedUrlResponse,
+    TopKeywordsResponse,
+)
+from app.features.journal.service import (
+    AsyncJournalService,
+    JournalOpenAIService,
+    JournalService,
 )
-from app.features.journal.service import JournalOpenAIService, JournalService
 from app.features.user.models import User
 
 router = APIRouter(prefix="/journal", tags=["journal"])
@@ -104,24 +113,65 @@ def search_journals(
     "/search-keyword",
     response_model=JournalCursorResponse,
     status_code=status.HTTP_200_OK,
-    summary="Search journals by keyword",
-    description="Return journals containing the specified keyword.",
+    summary="Search journals by keywords",
+    description="Return journals containing all (match=all) or any (match=any) of the given keywords. Repeat the keyword parameter to search several keywords. With prefix=true, keywords starting with each value also match.",
 )
 def search_journals_by_keyword(
     journal_service: Annotated[JournalService, Depends()],
-    keyword: str = Query(..., description="Keyword to search for"),
+    keyword: list[str] = Query(..., description="Keywords to search for"),
+    match: Literal["all", "any"] = Query("all", description="all: AND, any: OR"),
+    prefix: bool = Query(False, description="Match keywords by prefix"),
     limit: int = Query(default=10, le=50),
     cursor: int | None = Query(
         None, description="ID of the last journal for cursor pagination"
     ),
     user: User = Depends(get_current_user),
 ) -> JournalCursorResponse:
-    if not keyword.strip():
-        raise JournalBadRequestError("keyword must not be blank")
-    journals = journal_service.get_journals_by_keyword(user.id, keyword, limit, cursor)
+    journals = journal_service.get_journals_by_keywords(
+        user.id,
+        keyword,
+        match_all=match == "all",
+        prefix=prefix,
+        limit=limit,
+        cursor=cursor,
+    )
     return JournalCursorResponse.from_journals(journals, limit)
 
 
+@router.get(
+    "/keywords/top",
+    response_model=TopKeywordsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Most frequent keywords of logged in user",
+    description="Return keywords ordered by the number of the user's journals they appear in.",
+)
+def get_top_keywords(
+    journal_service: Annotated[JournalService, Depends()],
+    limit: int = Query(default=10, ge=1, le=100),
+    user: User = Depends(get_current_user),
+) -> TopKeywordsResponse:
+    rows = journal_service.get_top_keywords(user.id, limit)
+    return TopKeywordsResponse.from_rows(rows)
+
+
+@router.get(
+    "/search-text",
+    response_model=JournalSearchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Full-text search over title, content and gratitude",
+    description="Every space-separated word (2+ characters) must appear. Results are ordered by relevance; pass next_cursor back as cursor for the next page.",
+)
+def search_journals_full_text(
+    journal_service: Annotated[JournalService, Depends()],
+    q: str = Query(..., description="Search words"),
+    limit: int = Query(default=10, le=50),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    user: User = Depends(get_current_user),
+) -> JournalSearchResponse:
+    results = journal_service.full_text_search(user.id, q, limit, cursor)
+    return JournalSearchResponse.from_results(results, limit)
+
+
 @router.get(
     "/{journal_id}",
     response_model=JournalResponse,
@@ -182,16 +232,49 @@ def delete_journal_entry(
 )
 async def generate_image_upload_url(
     journal_id: int,
-    journal_service: Annotated[JournalService, Depends()],
+    journal_service: Annotated[AsyncJournalService, Depends()],
     payload: ImageUploadRequest,
     user: User = Depends(get_current_user),
 ) -> PresignedUrlResponse:
-    journal_service.get_owned_journal(journal_id, user.id)
+    await journal_service.get_owned_journal(journal_id, user.id)
     return await journal_service.create_image_presigned_url(
         journal_id=journal_id, payload=payload
     )
 
 
+@router.post(
+    "/image/batch",
+    response_model=PresignedUrlBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Generate presigned URLs for several image uploads at once",
+    description="Presigned URLs are signed locally, so a batch costs one ownership query and no S3 calls.",
+)
+async def generate_image_upload_urls(
+    journal_service: Annotated[AsyncJournalService, Depends()],
+    payload: ImageUploadBatchRequest,
+    user: User = Depends(get_current_user),
+) -> PresignedUrlBatchResponse:
+    return await journal_service.create_image_presigned_urls(
+        user_id=user.id, payload=payload
+    )
+
+
+@router.get(
+    "/{journal_id}/image/url",
+    response_model=ImageUrlResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get a presigned URL for viewing the journal image",
+    description="The URL is cached per image until shortly before it expires.",
+)
+async def get_image_url(
+    journal_id: int,
+    journal_service: Annotated[AsyncJournalService, Depends()],
+    user: User = Depends(get_current_user),
+) -> ImageUrlResponse:
+    journal = await journal_service.get_owned_journal(journal_id, user.id)
+    return await journal_service.get_image_url(journal)
+
+
 @router.post(
     "/{journal_id}/image/complete",
     response_model=JournalImageResponse,
@@ -201,11 +284,11 @@ async def generate_image_upload_url(
 )
 async def complete_image_upload(
     journal_id: int,
-    journal_service: Annotated[JournalService, Depends()],
+    journal_service: Annotated[AsyncJournalService, Depends()],
     payload: ImageCompletionRequest,
     user: User = Depends(get_current_user),
 ) -> JournalImageResponse:
-    journal_service.get_owned_journal(journal_id, user.id)
+    await journal_service.get_owned_journal(journal_id, user.id)
     journal_image = await journal_service.complete_image_upload(
         journal_id=journal_id, payload=payload
     )
@@ -240,10 +323,10 @@ async def request_journal_image_generation(
 async def analyze_journal(
     journal_id: int,
     journal_openai_service: Annotated[JournalOpenAIService, Depends()],
-    journal_service: Annotated[JournalService, Depends()],
+    journal_service: Annotated[AsyncJournalService, Depends()],
     user: User = Depends(get_current_user),
 ) -> JournalKeywordsListResponse:
-    journal_service.get_owned_journal(journal_id, user.id)
+    await journal_service.get_owned_journal(journal_id, user.id)
     created_keywords_list = (
         await journal_openai_service.extract_keywords_with_emotion_associations(
             journal_id=journal_id
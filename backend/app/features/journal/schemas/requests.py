@@ -1,7 +1,7 @@
 import re
 from typing import Annotated
 
-from pydantic import AfterValidator, BaseModel
+from pydantic import AfterValidator, BaseModel, Field
 
 from app.common.errors import InvalidFieldFormatError
 
@@ -16,6 +16,9 @@ ALLOWED_IMAGE_TYPES = {
     "image/webp",
 }
 
+# 한 번에 발급할 수 있는 presigned 업로드 URL 수
+MAX_IMAGE_UPLOAD_BATCH = 20
+
 ALLOWED_EMOTIONS = {
     "happy",
     "sad",
@@ -125,6 +128,19 @@ class ImageUploadRequest(BaseModel):
     content_type: Annotated[str, AfterValidator(validate_content_type)]
 
 
+class ImageUploadBatchItem(ImageUploadRequest):
+    journal_id: int
+
+
+class ImageUploadBatchRequest(BaseModel):
+    """여러 이미지의 업로드 URL을 한 번에 요청할 때 보내는 데이터"""
+
+    uploads: Annotated[
+        list[ImageUploadBatchItem],
+        Field(min_length=1, max_length=MAX_IMAGE_UPLOAD_BATCH),
+    ]
+
+
 class ImageCompletionRequest(BaseModel):
     """ "클라이언트가 이미지 업로드 완료를 알릴 때 보내는 데이터"""
 
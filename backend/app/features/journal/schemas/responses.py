@@ -3,6 +3,7 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 
 from app.features.journal.models import Journal, JournalImage, JournalKeyword
+from app.features.journal.search import encode_cursor
 
 
 class KeywordEmotionAssociationItem(BaseModel):
@@ -38,6 +39,24 @@ class JournalKeywordsListResponse(BaseModel):
         )
 
 
+class TopKeywordItem(BaseModel):
+    keyword: str
+    journal_count: int = Field(..., description="키워드가 나온 journal 수")
+
+
+class TopKeywordsResponse(BaseModel):
+    data: list[TopKeywordItem]
+
+    @staticmethod
+    def from_rows(rows: list) -> "TopKeywordsResponse":
+        return TopKeywordsResponse(
+            data=[
+                TopKeywordItem(keyword=row.keyword, journal_count=row.journal_count)
+                for row in rows
+            ]
+        )
+
+
 class JournalEmotionResponse(BaseModel):
     emotion: str
     intensity: int
@@ -90,6 +109,32 @@ class JournalCursorResponse(BaseModel):
         return JournalCursorResponse(items=items, next_cursor=next_cursor)
 
 
+class JournalSearchItem(JournalResponse):
+    score: float = Field(..., description="검색 관련도 (클수록 관련도가 높음)")
+
+
+class JournalSearchResponse(BaseModel):
+    items: list[JournalSearchItem]
+    next_cursor: str | None = Field(
+        None, description="다음 페이지를 요청할 때 그대로 전달할 커서"
+    )
+
+    @staticmethod
+    def from_results(
+        results: list[tuple[Journal, float]], limit: int
+    ) -> "JournalSearchResponse":
+        items = [
+            JournalSearchItem(
+                **JournalResponse.from_journal(journal).model_dump(), score=score
+            )
+            for journal, score in results
+        ]
+        next_cursor = None
+        if items and len(items) == limit:
+            next_cursor = encode_cursor(items[-1].score, items[-1].id)
+        return JournalSearchResponse(items=items, next_cursor=next_cursor)
+
+
 class JournalListResponse(BaseModel):
     data: list[JournalResponse]
 
@@ -105,6 +150,23 @@ class PresignedUrlResponse(BaseModel):
     s3_key: str
 
 
+class PresignedUrlBatchItem(PresignedUrlResponse):
+    journal_id: int
+
+
+class PresignedUrlBatchResponse(BaseModel):
+    items: list[PresignedUrlBatchItem]
+
+
+class ImageUrlResponse(BaseModel):
+    """이미지 조회용 presigned URL (expires_at: UTC)"""
+
+    journal_id: int
+    s3_key: str
+    url: str
+    expires_at: datetime
+
+
 class JournalImageResponse(BaseModel):
     id: int
     journal_id: int
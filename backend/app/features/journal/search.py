@@ -0,0 +1,96 @@
+"""
+journal 전문 검색 (title, content, gratitude).
+
+- MySQL: FULLTEXT(ngram) 인덱스에 BOOLEAN MODE로 검색합니다. 검색어는 띄어쓰기
+  단위로 나눠 각각 구(phrase)로 AND 검색하고, MATCH 점수로 정렬합니다.
+- SQLite(로컬/테스트): FTS5(trigram) 테이블 journals_fts에 같은 방식으로 검색하고
+  bm25 점수로 정렬합니다. trigram은 3글자 미만 검색어를 찾지 못하므로 짧은 검색어는
+  LIKE 조건으로 거릅니다.
+
+결과는 (점수 DESC, id DESC) 순서이고, 커서는 마지막 항목의 "점수:id" 문자열입니다.
+"""
+
+from sqlalchemy import and_, column, func, literal, literal_column, or_, select, table
+from sqlalchemy.dialects import mysql
+from sqlalchemy.sql import Select
+
+from app.features.journal.models import Journal
+
+# MySQL ngram_token_size 기본값. 이보다 짧은 검색어는 무시합니다.
+MIN_TERM_LENGTH = 2
+MAX_TERMS = 8
+# SQLite trigram tokenizer로 찾을 수 있는 최소 길이
+TRIGRAM_LENGTH = 3
+
+journals_fts = table("journals_fts", column("rowid"))
+
+
+def search_terms(query: str) -> list[str]:
+    """띄어쓰기로 나눈 검색어 (따옴표 제거, 중복/짧은 단어 제외)"""
+    terms: list[str] = []
+    for term in query.replace('"', " ").split():
+        if len(term) >= MIN_TERM_LENGTH and term not in terms:
+            terms.append(term)
+    return terms[:MAX_TERMS]
+
+
+def encode_cursor(score: float, journal_id: int) -> str:
+    return f"{score!r}:{journal_id}"
+
+
+def decode_cursor(cursor: str) -> tuple[float, int]:
+    """잘못된 커서는 ValueError"""
+    score, journal_id = cursor.rsplit(":", 1)
+    return float(score), int(journal_id)
+
+
+def text_score_query(dialect_name: str, user_id: int, terms: list[str]) -> Select:
+    """사용자의 journal 중 모든 검색어를 포함하는 (id, score) 목록"""
+    if dialect_name == "mysql":
+        score = mysql.match(
+            Journal.title,
+            Journal.content,
+            Journal.gratitude,
+            against=" ".join(f'+"{term}"' for term in terms),
+        ).in_boolean_mode()
+        return select(Journal.id.label("id"), score.label("score")).where(
+            Journal.user_id == user_id, score > 0
+        )
+
+    indexed = [term for term in terms if len(term) >= TRIGRAM_LENGTH]
+    if indexed:
+        fts_column = literal_column("journals_fts")
+        # bm25는 작을수록 관련도가 높으므로 부호를 바꿔 MySQL과 같은 방향으로 맞춥니다.
+        stmt = (
+            select(
+                Journal.id.label("id"),
+                (-func.bm25(fts_column)).label("score"),
+            )
+            .join(journals_fts, journals_fts.c.rowid == Journal.id)
+            .where(
+                fts_column.op("MATCH")(" ".join(f'"{term}"' for term in indexed)),
+                Journal.user_id == user_id,
+            )
+        )
+    else:
+        stmt = select(Journal.id.label("id"), literal(0.0).label("score")).where(
+            Journal.user_id == user_id
+        )
+    for term in terms:
+        if len(term) < TRIGRAM_LENGTH:
+            stmt = stmt.where(
+                or_(
+                    Journal.title.contains(term, autoescape=True),
+                    Journal.content.contains(term, autoescape=True),
+                    Journal.gratitude.contains(term, autoescape=True),
+                )
+            )
+    return stmt
+
+
+def after_cursor(scored, cursor: tuple[float, int]):
+    score, journal_id = cursor
+    return or_(
+        scored.c.score < score,
+        and_(scored.c.score == score, scored.c.id < journal_id),
+    )
@@ -1,35 +1,45 @@
 import json
 import logging
-import unicodedata
 from datetime import date
-from functools import partial
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
-from fastapi.concurrency import run_in_threadpool
 from langchain_core.prompts import PromptTemplate
-from langchain_openai import ChatOpenAI
-from openai import AsyncOpenAI
 
 from app.common.errors import PermissionDeniedError
+from app.common.llm import async_openai_client, chat_model
+from app.common.llm_cache import llm_cache
 from app.features.journal.errors import (
     ImageGenerationError,
     JournalBadRequestError,
+    JournalImageNotFoundError,
     JournalNotFoundError,
     JournalUpdateError,
 )
 from app.features.journal.facade import JournalImageFacade
+from app.features.journal.keyword_index import MAX_QUERY_KEYWORDS, normalize_keyword
 from app.features.journal.models import Journal, JournalImage, JournalKeyword
-from app.features.journal.repository import JournalRepository
+from app.features.journal.repository import (
+    AsyncJournalRepository,
+    JournalRepository,
+)
 from app.features.journal.schemas.requests import (
     ImageCompletionRequest,
     ImageGenerateRequest,
+    ImageUploadBatchRequest,
     ImageUploadRequest,
 )
 from app.features.journal.schemas.responses import (
+    ImageUrlResponse,
     JournalKeywordsListResponse,
+    PresignedUrlBatchResponse,
     PresignedUrlResponse,
 )
+from app.features.journal.search import (
+    MIN_TERM_LENGTH,
+    decode_cursor,
+    search_terms,
+)
 from app.features.journal.strategies import ImageStyleFactory, _load_prompt
 from app.features.user.models import User
 
@@ -40,11 +50,8 @@ class JournalService:
     def __init__(
         self,
         journal_repository: Annotated[JournalRepository, Depends()],
-        image_facade: Annotated[JournalImageFacade, Depends()],
     ) -> None:
         self.journal_repository = journal_repository
-        self.image_facade = image_facade
-        self._db_runner = partial(run_in_threadpool)
 
     def create_journal(
         self,
@@ -124,17 +131,95 @@ class JournalService:
             cursor=cursor,
         )
 
-    def get_journals_by_keyword(
+    def full_text_search(
+        self, user_id: int, query: str, limit: int = 10, cursor: str | None = None
+    ) -> list[tuple[Journal, float]]:
+        terms = search_terms(query)
+        if not terms:
+            raise JournalBadRequestError(
+                f"query must contain a word of at least {MIN_TERM_LENGTH} characters"
+            )
+        try:
+            decoded_cursor = decode_cursor(cursor) if cursor else None
+        except ValueError:
+            raise JournalBadRequestError("invalid cursor") from None
+        return self.journal_repository.full_text_search(
+            user_id=user_id, terms=terms, limit=limit, cursor=decoded_cursor
+        )
+
+    def get_journals_by_keywords(
         self,
         user_id: int,
-        keyword: str,
+        keywords: list[str],
+        match_all: bool = True,
+        prefix: bool = False,
         limit: int = 10,
         cursor: int | None = None,
     ) -> list[Journal]:
-        return self.journal_repository.get_journals_by_keyword(
-            user_id=user_id, keyword=keyword, limit=limit, cursor=cursor
+        names = list(
+            dict.fromkeys(
+                normalize_keyword(keyword) for keyword in keywords if keyword.strip()
+            )
+        )
+        if not names:
+            raise JournalBadRequestError("keyword must not be blank")
+        if len(names) > MAX_QUERY_KEYWORDS:
+            raise JournalBadRequestError(
+                f"at most {MAX_QUERY_KEYWORDS} keywords can be searched at once"
+            )
+        return self.journal_repository.get_journals_by_keywords(
+            user_id=user_id,
+            keywords=names,
+            match_all=match_all,
+            prefix=prefix,
+            limit=limit,
+            cursor=cursor,
         )
 
+    def get_top_keywords(self, user_id: int, limit: int = 10) -> list:
+        return self.journal_repository.get_top_keywords(user_id=user_id, limit=limit)
+
+    # Ownership helper reused by router to avoid duplicate DB hits.
+    def get_owned_journal(self, journal_id: int, user_id: int) -> Journal:
+        journal = self.journal_repository.get_journal_by_id(journal_id)
+        if journal is None:
+            raise JournalNotFoundError(journal_id)
+        if journal.user_id != user_id:
+            raise PermissionDeniedError()
+        return journal
+
+
+class AsyncJournalService:
+    """
+    async 라우트(이미지 업로드/조회, 키워드 분석)용 서비스.
+    소유권 확인도 AsyncJournalRepository로 해서 요청 하나가 AsyncSession 하나만 씁니다.
+    """
+
+    def __init__(
+        self,
+        journal_repository: Annotated[AsyncJournalRepository, Depends()],
+        image_facade: Annotated[JournalImageFacade, Depends()],
+    ) -> None:
+        self.journal_repository = journal_repository
+        self.image_facade = image_facade
+
+    async def get_owned_journal(self, journal_id: int, user_id: int) -> Journal:
+        journal = await self.journal_repository.get_journal_by_id(journal_id)
+        if journal is None:
+            raise JournalNotFoundError(journal_id)
+        if journal.user_id != user_id:
+            raise PermissionDeniedError()
+        return journal
+
+    async def check_owned_journals(self, journal_ids: list[int], user_id: int) -> None:
+        """여러 journal의 소유권을 쿼리 한 번으로 확인"""
+        owners = await self.journal_repository.get_journal_owners(journal_ids)
+        for journal_id in journal_ids:
+            if journal_id not in owners:
+                raise JournalNotFoundError(journal_id)
+            if owners[journal_id] != user_id:
+                raise PermissionDeniedError()
+
     async def create_image_presigned_url(
         self, journal_id: int, payload: ImageUploadRequest
     ) -> PresignedUrlResponse:
@@ -142,20 +227,28 @@ class JournalService:
             journal_id, payload.filename, payload.content_type
         )
 
+    async def create_image_presigned_urls(
+        self, user_id: int, payload: ImageUploadBatchRequest
+    ) -> PresignedUrlBatchResponse:
+        await self.check_owned_journals(
+            [upload.journal_id for upload in payload.uploads], user_id
+        )
+        items = await self.image_facade.initiate_image_uploads(payload.uploads)
+        return PresignedUrlBatchResponse(items=items)
+
+    async def get_image_url(self, journal: Journal) -> ImageUrlResponse:
+        journal_image = await self.journal_repository.get_image_by_journal_id(
+            journal.id
+        )
+        if journal_image is None:
+            raise JournalImageNotFoundError(journal.id)
+        return self.image_facade.get_image_url(journal_image)
+
     async def complete_image_upload(
         self, journal_id: int, payload: ImageCompletionRequest
     ) -> JournalImage:
         return await self.image_facade.finalize_image_upload(journal_id, payload.s3_key)
 
-    # Ownership helper reused by router to avoid duplicate DB hits.
-    def get_owned_journal(self, journal_id: int, user_id: int) -> Journal:
-        journal = self.journal_repository.get_journal_by_id(journal_id)
-        if journal is None:
-            raise JournalNotFoundError(journal_id)
-        if journal.user_id != user_id:
-            raise PermissionDeniedError()
-        return journal
-
 
 class JournalOpenAIService:
     """
@@ -164,21 +257,20 @@ class JournalOpenAIService:
 
     def __init__(
         self,
-        journal_repository: Annotated[JournalRepository, Depends()],
+        journal_repository: Annotated[AsyncJournalRepository, Depends()],
         style_factory: Annotated[ImageStyleFactory, Depends()],
     ):
         self.journal_repository = journal_repository
         self.style_factory = style_factory
-        self._db_runner = partial(run_in_threadpool)
 
         keyword_prompt_text = _load_prompt("keyword_prompt.txt")
 
-        self.client = AsyncOpenAI()
+        self.client = async_openai_client()
         if not self.client.api_key:
             raise ValueError("OPENAI_API_KEY not found.")
 
-        self.structured_llm = ChatOpenAI(
-            model="gpt-5-mini", temperature=0
+        self.structured_llm = chat_model(
+            "gpt-5-mini", temperature=0, cache=llm_cache("journal_keywords")
         ).with_structured_output(JournalKeywordsListResponse)
 
         self.keyword_prompt_template = PromptTemplate.from_template(keyword_prompt_text)
@@ -261,9 +353,7 @@ class JournalOpenAIService:
     async def extract_keywords_with_emotion_associations(
         self, journal_id: int
     ) -> list[JournalKeyword]:
-        journal = await self._db_runner(
-            self.journal_repository.get_journal_by_id, journal_id
-        )
+        journal = await self.journal_repository.get_journal_by_id(journal_id)
         if not journal:
             raise JournalNotFoundError(journal_id)
 
@@ -302,9 +392,7 @@ class JournalOpenAIService:
         set_keywords = set()
 
         for item in res:
-            normalized_keyword = item.keyword.strip()
-            normalized_keyword = unicodedata.normalize("NFC", normalized_keyword)
-            normalized_keyword = normalized_keyword.lower()
+            normalized_keyword = normalize_keyword(item.keyword)
 
             if normalized_keyword not in set_keywords:
                 set_keywords.add(normalized_keyword)
@@ -313,10 +401,11 @@ class JournalOpenAIService:
             else:
                 logger.info(f"Duplicate keyword removed: {normalized_keyword}")
 
-        created_keywords = await self._db_runner(
-            self.journal_repository.add_keywords_emotion_associations,
-            journal_id=journal_id,
-            keyword_emotion_associations=unique_res,
+        created_keywords = (
+            await self.journal_repository.add_keywords_emotion_associations(
+                journal_id=journal_id,
+                keyword_emotion_associations=unique_res,
+            )
         )
 
         return created_keywords
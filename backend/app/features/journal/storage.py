@@ -0,0 +1,82 @@
+"""
+프로세스 단위로 공유하는 S3 클라이언트.
+
+boto3 client는 thread-safe라 모든 요청이 하나를 공유합니다. (요청마다 만들면
+자격 증명/endpoint 설정 비용이 큼) S3_BACKEND=aiobotocore이면 threadpool 없이
+이벤트 루프에서 바로 호출하는 async client를 사용합니다. (poetry install -E s3-async)
+"""
+
+import asyncio
+import threading
+from typing import Any
+
+from app.core.config import settings
+
+
+class S3Clients:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._client: Any = None
+        self._async_lock: asyncio.Lock | None = None
+        self._async_context: Any = None
+        self._async_client: Any = None
+
+    def _client_kwargs(self) -> dict:
+        return {
+            "aws_access_key_id": settings.AWS_ACCESS_KEY_ID,
+            "aws_secret_access_key": settings.AWS_SECRET_ACCESS_KEY,
+            "region_name": settings.AWS_REGION,
+        }
+
+    def get(self) -> Any:
+        with self._lock:
+            if self._client is None:
+                # import 비용이 커서 처음 사용할 때 불러옵니다.
+                import boto3
+                from botocore.config import Config
+
+                self._client = boto3.client(
+                    "s3",
+                    config=Config(
+                        max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS
+                    ),
+                    **self._client_kwargs(),
+                )
+            return self._client
+
+    async def get_async(self) -> Any:
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            if self._async_client is None:
+                from aiobotocore.config import AioConfig
+                from aiobotocore.session import get_session
+
+                context = get_session().create_client(
+                    "s3",
+                    config=AioConfig(
+                        max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS
+                    ),
+                    **self._client_kwargs(),
+                )
+                self._async_client = await context.__aenter__()
+                self._async_context = context
+            return self._async_client
+
+    async def aclose(self) -> None:
+        """FastAPI lifespan 종료 시 연결 풀을 닫습니다."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+        context, self._async_context, self._async_client = (
+            self._async_context,
+            None,
+            None,
+        )
+        if context is not None:
+            await context.__aexit__(None, None, None)
+        self._async_lock = None
+
+
+s3_clients = S3Clients()
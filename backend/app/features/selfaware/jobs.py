@@ -0,0 +1,23 @@
+import logging
+
+from sqlalchemy.orm import Session
+
+from app.features.selfaware.di import get_value_map_service, get_value_score_service
+
+logger = logging.getLogger(__name__)
+
+
+def run_value_score_extraction(session: Session, user_id: int, payload: dict) -> None:
+    """value score 추출 및 value map 업데이트 후 value map comment 생성"""
+    detected_values = get_value_score_service(session).extract_value_score_from_answer(
+        user_id, payload["question_id"], payload["answer_id"]
+    )
+    # value_score INSERT와 value_map 반영을 한 번에 커밋 (comment LLM 호출 전에 lock 해제)
+    session.commit()
+    logger.info(f"Extracted {len(detected_values)} value scores for user {user_id}")
+
+    try:
+        get_value_map_service(session).generate_comment(user_id)
+    except Exception as e:
+        # comment 생성 실패는 job 실패(재시도)로 처리하지 않음
+        logger.warning(f"Could not generate comment for user {user_id}: {e}")
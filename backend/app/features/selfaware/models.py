@@ -118,6 +118,8 @@ class ValueScore(Base):
     polarity: Mapped[int] = mapped_column(
         Integer, nullable=False, default=1
     )  # -1, 0, +1       # 서버 계산치(즉시/증분)
+    # polarity가 -1일 때 화면에 보여줄 반대 가치 (저장 시점에 한 번 계산)
+    opposite_value: Mapped[str | None] = mapped_column(String(80), nullable=True)
 
     # 증거(문장/구) — 최대 2개 저장 추천
     evidence_quotes: Mapped[list[str] | None] = mapped_column(JSON)
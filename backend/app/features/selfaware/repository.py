@@ -1,14 +1,107 @@
+import logging
+from collections import defaultdict
+from collections.abc import Sequence
 from datetime import date, datetime, time, timedelta, timezone
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy import desc, select
+from sqlalchemy import desc, func, insert, select, update
 from sqlalchemy.orm import Session
 
 from app.common.utilities import get_korea_time
 from app.database.session import get_db_session
 from app.features.selfaware.models import Answer, Question, ValueMap, ValueScore
 
+logger = logging.getLogger(__name__)
+
+# ValueMap의 score_i/count_i 컬럼 인덱스
+VALUE_MAP_CATEGORY_INDEX = {
+    "Neuroticism": 0,
+    "Extraversion": 1,
+    "Openness to Experience": 2,
+    "Agreeableness": 3,
+    "Conscientiousness": 4,
+}
+
+
+def _question_date_range(target_date: date) -> tuple[datetime, datetime]:
+    KST = timezone(timedelta(hours=9))  # noqa: N806
+
+    # 한국 시간으로 날짜 기준 구간 계산
+    start_kst = datetime.combine(target_date, time.min, tzinfo=KST)
+    end_kst = start_kst + timedelta(days=1)
+    return start_kst, end_kst
+
+
+def _top_5_value_scores_query(user_id: int):
+    return (
+        select(ValueScore)
+        .where(ValueScore.user_id == user_id)
+        .order_by(
+            desc(
+                ValueScore.intensity
+                * ValueScore.confidence
+                * (ValueScore.polarity * ValueScore.polarity)
+            )
+        )  # intensity * confidence 기준 정렬, polarity 0이면 후순위
+        .limit(5)
+    )
+
+
+def _value_score_point(value_score: ValueScore) -> float:
+    # polarity/intensity/confidence (-1..1)를 0..100 점수로 변환
+    return (
+        value_score.intensity * value_score.polarity * value_score.confidence + 1
+    ) * 50
+
+
+def _fold_value_scores_update(user_id: int, value_scores: Sequence[ValueScore]):
+    """
+    value_score 목록을 카테고리별 running mean(score_i/count_i)에 반영하는 UPDATE 한 문장.
+    DB에서 현재 값을 기준으로 계산하므로 동시에 들어온 답변끼리 덮어쓰지 않습니다.
+    알 수 없는 카테고리는 rebuild_value_maps와 같이 경고만 남기고 건너뜁니다.
+    """
+    sums: dict[int, float] = defaultdict(float)
+    counts: dict[int, int] = defaultdict(int)
+    for value_score in value_scores:
+        category = VALUE_MAP_CATEGORY_INDEX.get(value_score.category)
+        if category is None:
+            logger.warning(
+                f"Skipping value score with unknown category "
+                f"{value_score.category!r} (user {user_id})"
+            )
+            continue
+        sums[category] += _value_score_point(value_score)
+        counts[category] += 1
+
+    # MySQL은 SET을 왼쪽부터 평가하므로 score_i를 count_i보다 먼저 갱신해야 합니다.
+    assignments = []
+    for category, n in counts.items():
+        score = getattr(ValueMap, f"score_{category}")
+        count = getattr(ValueMap, f"count_{category}")
+        assignments.append((score, (count * score + sums[category]) // (count + n)))
+    for category, n in counts.items():
+        count = getattr(ValueMap, f"count_{category}")
+        assignments.append((count, count + n))
+    assignments.append((ValueMap.updated_at, get_korea_time()))
+
+    return (
+        update(ValueMap)
+        .where(ValueMap.user_id == user_id)
+        .ordered_values(*assignments)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _value_map_by_user_query(user_id: int):
+    # UPDATE 문으로 바뀐 값을 identity map의 객체에도 반영
+    return (
+        select(ValueMap)
+        .where(ValueMap.user_id == user_id)
+        .limit(1)
+        .execution_options(populate_existing=True)
+    )
+
 
 # -------------------------------
 # Question Repository
@@ -52,12 +145,7 @@ class QuestionRepository:
         return query.limit(limit).all()
 
     def get_question_by_date(self, user_id: int, target_date: date) -> Question | None:
-        KST = timezone(timedelta(hours=9))  # noqa: N806
-
-        # 한국 시간으로 날짜 기준 구간 계산
-        start_kst = datetime.combine(target_date, time.min, tzinfo=KST)
-        end_kst = start_kst + timedelta(days=1)
-
+        start_kst, end_kst = _question_date_range(target_date)
         return self.session.scalar(
             select(Question)
             .where(
@@ -138,6 +226,7 @@ class ValueScoreRepository:
         intensity: float,
         polarity: int,
         evidence_quotes: list[str] | None = None,
+        opposite_value: str | None = None,
     ) -> ValueScore:
         value_score = ValueScore(
             user_id=user_id,
@@ -148,6 +237,7 @@ class ValueScoreRepository:
             confidence=confidence,
             intensity=intensity,
             polarity=polarity,
+            opposite_value=opposite_value,
         )
 
         if evidence_quotes:
@@ -158,20 +248,32 @@ class ValueScoreRepository:
         self.session.commit()
         return value_score
 
+    def create_value_scores(self, rows: Sequence[dict]) -> list[ValueScore]:
+        """
+        한 답변에서 나온 value_score를 executemany INSERT 한 번으로 저장합니다.
+        value_map 반영(update_by_value_scores)과 같은 트랜잭션이 되도록 커밋은 호출자가 합니다.
+        반환값은 value_map 반영용 객체이며 id는 채워지지 않습니다.
+        """
+        if not rows:
+            return []
+        self.session.execute(insert(ValueScore), list(rows))
+        return [ValueScore(**row) for row in rows]
+
     def get_top_5_value_scores(self, user_id: int):
-        query = (
-            select(ValueScore)
-            .where(ValueScore.user_id == user_id)
-            .order_by(
-                desc(
-                    ValueScore.intensity
-                    * ValueScore.confidence
-                    * (ValueScore.polarity * ValueScore.polarity)
-                )
-            )  # intensity * confidence 기준 정렬, polarity 0이면 후순위
-            .limit(5)
+        return self.session.scalars(_top_5_value_scores_query(user_id)).all()
+
+    def set_opposite_values(self, opposite_values: dict[int, str]) -> None:
+        """value_score id -> opposite_value 를 한 번에 저장"""
+        if not opposite_values:
+            return
+        self.session.execute(
+            update(ValueScore),
+            [
+                {"id": value_score_id, "opposite_value": opposite_value}
+                for value_score_id, opposite_value in opposite_values.items()
+            ],
         )
-        return self.session.scalars(query).all()
+        self.session.commit()
 
 
 # -------------------------------
@@ -190,94 +292,83 @@ class ValueMapRepository:
         self.session.commit()
         return value_map
 
-    def update_by_value_score(self, value_score: ValueScore):
-        value_map = (
-            self.session.query(ValueMap)
-            .filter(ValueMap.user_id == value_score.user_id)
-            .first()
-        )
+    def update_by_value_score(self, value_score: ValueScore) -> ValueMap:
+        return self.update_by_value_scores(value_score.user_id, [value_score])
 
+    def update_by_value_scores(
+        self, user_id: int, value_scores: Sequence[ValueScore]
+    ) -> ValueMap:
+        """한 답변에서 나온 value_score를 한 번의 UPDATE로 반영 (커밋은 호출자)"""
+        if value_scores:
+            result = self.session.execute(
+                _fold_value_scores_update(user_id, value_scores)
+            )
+            if result.rowcount == 0:
+                raise ValueError(f"value_map does't exist for user {user_id}")
+
+        value_map = self.session.scalar(_value_map_by_user_query(user_id))
         if not value_map:
-            raise
+            raise ValueError(f"value_map does't exist for user {user_id}")
+        return value_map
 
-        if value_score.category == "Neuroticism":
-            value = (
-                (
-                    value_score.intensity
-                    * value_score.polarity
-                    * value_score.confidence
-                    + 1
-                )
-                * 50
-                + value_map.count_0 * value_map.score_0
-            ) // (value_map.count_0 + 1)
-            count = value_map.count_0 + 1
-            category = 0
-        elif value_score.category == "Extraversion":
-            value = (
-                (
-                    value_score.intensity
-                    * value_score.polarity
-                    * value_score.confidence
-                    + 1
-                )
-                * 50
-                + value_map.count_1 * value_map.score_1
-            ) // (value_map.count_1 + 1)
-            count = value_map.count_1 + 1
-            category = 1
-        elif value_score.category == "Openness to Experience":
-            value = (
-                (
-                    value_score.intensity
-                    * value_score.polarity
-                    * value_score.confidence
-                    + 1
-                )
-                * 50
-                + value_map.count_2 * value_map.score_2
-            ) // (value_map.count_2 + 1)
-            count = value_map.count_2 + 1
-            category = 2
-        elif value_score.category == "Agreeableness":
-            value = (
-                (
-                    value_score.intensity
-                    * value_score.polarity
-                    * value_score.confidence
-                    + 1
-                )
-                * 50
-                + value_map.count_3 * value_map.score_3
-            ) // (value_map.count_3 + 1)
-            count = value_map.count_3 + 1
-            category = 3
-        elif value_score.category == "Conscientiousness":
-            value = (
-                (
-                    value_score.intensity
-                    * value_score.polarity
-                    * value_score.confidence
-                    + 1
+    def rebuild_value_maps(self, batch_size: int = 1000) -> int:
+        """
+        value_scores 전체로 모든 value_map의 score_i/count_i를 다시 계산합니다.
+        value_map이 없는 사용자는 새로 만들고, value_score가 없는 map은 0으로 초기화합니다.
+        """
+        totals: dict[int, dict[str, int]] = defaultdict(dict)
+        rows = self.session.execute(
+            select(
+                ValueScore.user_id,
+                ValueScore.category,
+                func.sum(
+                    (
+                        ValueScore.intensity
+                        * ValueScore.polarity
+                        * ValueScore.confidence
+                        + 1
+                    )
+                    * 50
+                ),
+                func.count(),
+            ).group_by(ValueScore.user_id, ValueScore.category)
+        )
+        for user_id, category_name, point_sum, count in rows:
+            category = VALUE_MAP_CATEGORY_INDEX.get(category_name)
+            if category is None:
+                logger.warning(
+                    f"Skipping {count} value scores with unknown category "
+                    f"{category_name!r} (user {user_id})"
                 )
-                * 50
-                + value_map.count_4 * value_map.score_4
-            ) // (value_map.count_4 + 1)
-            count = value_map.count_4 + 1
-            category = 4
-        else:
-            raise
-
-        # 실제 객체에 반영
-        setattr(value_map, f"score_{category}", value)
-        setattr(value_map, f"count_{category}", count)
-
-        # 갱신 시간 업데이트 (선택적)
-        value_map.updated_at = get_korea_time()
+                continue
+            totals[user_id][f"score_{category}"] = int(point_sum // count)
+            totals[user_id][f"count_{category}"] = count
 
-        self.session.flush()
+        map_ids = dict(
+            self.session.execute(select(ValueMap.user_id, ValueMap.id)).all()
+        )
+        empty = {
+            f"{column}_{category}": 0
+            for column in ("score", "count")
+            for category in VALUE_MAP_CATEGORY_INDEX.values()
+        }
+        now = get_korea_time()
+        updates = [
+            {**empty, **totals.get(user_id, {}), "id": map_id, "updated_at": now}
+            for user_id, map_id in map_ids.items()
+        ]
+        inserts = [
+            {**empty, **values, "user_id": user_id}
+            for user_id, values in totals.items()
+            if user_id not in map_ids
+        ]
+
+        for start in range(0, len(updates), batch_size):
+            self.session.execute(update(ValueMap), updates[start : start + batch_size])
+        for start in range(0, len(inserts), batch_size):
+            self.session.execute(insert(ValueMap), inserts[start : start + batch_size])
         self.session.commit()
-        return value_map
+        return len(updates) + len(inserts)
 
     def get_by_user(self, user_id: int) -> ValueMap | None:
         return self.session.query(ValueMap).filter(ValueMap.user_id == user_id).first()
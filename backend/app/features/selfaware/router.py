@@ -1,13 +1,12 @@
 from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer
 from sqlalchemy.exc import IntegrityError
 
 from app.common.authorization import get_current_user
-from app.features.analysis.di import get_analysis_service
-from app.features.analysis.service import AnalysisService
+from app.features.jobs.service import JobService
 from app.features.selfaware.di import (
     get_answer_service,
     get_question_service,
@@ -39,69 +38,6 @@ security = HTTPBearer()
 router = APIRouter(prefix="/self-aware", tags=["selfaware"])
 
 
-# -----------------------------
-# 🔧 백그라운드 작업 함수
-# -----------------------------
-def process_value_score_extraction(
-    user_id: int,
-    question_id: int,
-    answer_id: int,
-    value_score_service: ValueScoreService,
-    value_map_service: ValueMapService,
-):
-    """백그라운드에서 value score 추출 및 value map 업데이트"""
-    try:
-        print(
-            f"Starting value score extraction for user {user_id}, question {question_id}, answer {answer_id}"
-        )
-
-        # 1. value score 추출 및 value map 업데이트
-        detected_values = value_score_service.extract_value_score_from_answer(
-            user_id, question_id, answer_id
-        )
-        print(f"Extracted {len(detected_values)} value scores for user {user_id}")
-
-        # 2. value map comment 생성 (선택적)
-        try:
-            value_map_service.generate_comment(user_id)
-            print(f"Generated comment for user {user_id}")
-        except Exception as comment_error:
-            print(
-                f"Warning: Could not generate comment for user {user_id}: {comment_error}"
-            )
-            # comment 생성 실패는 전체 프로세스를 중단하지 않음
-
-    except Exception as e:
-        print(
-            f"Error processing value score for user {user_id}, question {question_id}, answer {answer_id}: {e}"
-        )
-        # 로깅을 위해 에러를 출력하지만 예외를 다시 발생시키지 않음
-
-
-def update_analysis_table(
-    user_id: int,
-    user_age: int,
-    user_gender: str,
-    analysis_service: AnalysisService,
-):
-    try:
-        if analysis_service.get_analysis_by_user(user_id) is None:
-            analysis_service.create_analysis(user_id)
-            print(f"Analysis table for user {user_id} created")
-        print("Start updating neo_pi_score")
-        analysis_service.update_neo_pi_score(user_id, user_age, user_gender)
-        print("Start updating user_id")
-        analysis_service.update_user_type(user_id)
-        print("Start updating comprehensive_analysis")
-        analysis_service.update_comprehensive_analysis(user_id, user_age, user_gender)
-        print("Start updating personalized_advice")
-        analysis_service.update_personalized_advice(user_id, user_age, user_gender)
-        print("Analysis updated")
-    except Exception as e:
-        print(f"Error processing updating analysis table for user {user_id}: {e}")
-        # 로깅을 위해 에러를 출력하지만 예외를 다시 발생시키지 않음
-
-
 # -----------------------------
 # 🧠 Question 관련 엔드포인트
 # -----------------------------
@@ -207,15 +143,12 @@ def get_user_QAs(  # noqa: N802
 )
 def submit_answer(
     request: AnswerRequest,
-    background_tasks: BackgroundTasks,
     question_service: Annotated[QuestionService, Depends(get_question_service)],
     answer_service: Annotated[AnswerService, Depends(get_answer_service)],
-    value_score_service: Annotated[ValueScoreService, Depends(get_value_score_service)],
-    value_map_service: Annotated[ValueMapService, Depends(get_value_map_service)],
-    analysis_service: Annotated[AnalysisService, Depends(get_analysis_service)],
+    job_service: Annotated[JobService, Depends()],
     user: User = Depends(get_current_user),
 ) -> AnswerResponse:
-    """답변을 제출하고 백그라운드에서 value score를 추출하여 value map을 업데이트합니다."""
+    """답변을 제출하고, value score 추출/value map 업데이트는 job worker에 맡깁니다."""
     question_id = request.question_id
     question = question_service.get_questions_by_id(question_id)
     if not question:
@@ -228,22 +161,13 @@ def submit_answer(
         user_id=user.id, question_id=question_id, text=request.text
     )
 
-    # 2. 백그라운드에서 value score 추출 및 value map 업데이트
-    background_tasks.add_task(
-        process_value_score_extraction,
-        user.id,
-        question_id,
-        answer.id,
-        value_score_service,
-        value_map_service,
-    )
+    # 2. value score 추출 및 value map 업데이트 (답변과 같은 트랜잭션으로 job 등록)
+    job_service.enqueue_value_score_extraction(user.id, question_id, answer.id)
 
     # 3. 충분한 answers가 모였을 경우, analysis 업데이트
     answers = answer_service.get_answer_by_user(user_id=user.id)
     if len(answers) > 0 and len(answers) % 10 == 0:
-        background_tasks.add_task(
-            update_analysis_table, user.id, user.age, user.gender, analysis_service
-        )
+        job_service.enqueue_analysis_update(user.id)
 
     return AnswerResponse.from_answer(answer)
 
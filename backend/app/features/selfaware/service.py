@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import logging
 import random
 from datetime import date
 
 # from app.core.config import settings
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
 
+from app.common.llm import chat_model
+from app.common.llm_cache import llm_cache
 from app.features.journal.repository import JournalRepository
 from app.features.selfaware.models import Answer, Question, ValueMap
 from app.features.selfaware.prompt import (
@@ -31,6 +33,8 @@ from app.features.selfaware.strategy import (
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 
 class QuestionService:
     def __init__(
@@ -111,9 +115,9 @@ class ValueScoreService:
     def extract_value_score_from_answer(
         self, user_id: int, question_id: int, answer_id: int
     ):
-        llm = ChatOpenAI(model="gpt-5-nano").with_structured_output(
-            MultiValueScoreStructure
-        )
+        llm = chat_model(
+            "gpt-5-nano", cache=llm_cache("value_score")
+        ).with_structured_output(MultiValueScoreStructure)
 
         question = self.question_repository.get_question_by_id(question_id)
         answer = self.answer_repository.get_answer_by_id(answer_id)
@@ -135,60 +139,96 @@ class ValueScoreService:
         # 혹은 value_map을 user가 등록되었을 때, craete해도 좋을 듯 합니다
         value_map = self.value_map_repository.get_by_user(user_id)
         if not value_map:
-            print("value_map created")
+            logger.info(f"Creating value_map for user {user_id}")
             self.value_map_repository.create_value_map(user_id=user_id)
 
-        for v in detected_values:
-            value_score = self.value_score_repository.create_value_score(
-                user_id=user_id,
-                question_id=question_id,
-                answer_id=answer_id,
-                category=v.category_key,
-                value=v.value,
-                confidence=v.confidence,
-                intensity=v.intensity,
-                polarity=v.polarity,
-                evidence_quotes=[v.evidence],
+        # 조회 API가 LLM을 부르지 않도록 반대 가치는 저장 시점에 함께 계산
+        opposite_values = iter(
+            self._get_opposite_values(
+                [(v.value, v.category_key) for v in detected_values if v.polarity == -1]
             )
-            self.value_map_repository.update_by_value_score(value_score)
+        )
+
+        value_scores = self.value_score_repository.create_value_scores(
+            [
+                {
+                    "user_id": user_id,
+                    "question_id": question_id,
+                    "answer_id": answer_id,
+                    "category": v.category_key,
+                    "value": v.value,
+                    "confidence": v.confidence,
+                    "intensity": v.intensity,
+                    "polarity": v.polarity,
+                    "evidence_quotes": [v.evidence],
+                    "opposite_value": (
+                        next(opposite_values) if v.polarity == -1 else None
+                    ),
+                }
+                for v in detected_values
+            ]
+        )
+        self.value_map_repository.update_by_value_scores(user_id, value_scores)
 
         return detected_values
 
+    def _get_opposite_values(self, values: list[tuple[str, str]]) -> list[str | None]:
+        """(value, category) 목록의 반대 가치를 동시에 요청합니다. 실패한 항목은 None"""
+        if not values:
+            return []
+        llm = chat_model(
+            "gpt-5-nano", cache=llm_cache("opposite_value")
+        ).with_structured_output(OppositeValueStructure)
+        get_opposite_value_chain = get_opposite_value_prompt | llm
+        responses = get_opposite_value_chain.batch(
+            [{"value": value, "category": category} for value, category in values],
+            return_exceptions=True,
+        )
+        opposite_values = []
+        for (value, _), response in zip(values, responses, strict=True):
+            if isinstance(response, OppositeValueStructure):
+                opposite_values.append(response.opposite_value)
+            else:
+                logger.warning(f"Could not get opposite value of {value}: {response}")
+                opposite_values.append(None)
+        return opposite_values
+
     def get_top_value_scores(self, user_id: int):
         top_value_scores = self.value_score_repository.get_top_5_value_scores(user_id)
-        value_scores = []
 
-        print(top_value_scores)
-
-        if top_value_scores:
-            for top_value_score in top_value_scores:
-                if top_value_score.polarity == 0:
-                    continue  # polarity가 0이면 append하지 않음
-
-                if top_value_score.polarity == -1:
-                    llm = ChatOpenAI(model="gpt-5-nano").with_structured_output(
-                        OppositeValueStructure
-                    )
-                    get_opposite_value_chain = get_opposite_value_prompt | llm
-                    response = get_opposite_value_chain.invoke(
-                        {
-                            "value": top_value_score.value,
-                            "category": top_value_score.category,
-                        }
-                    )
-                    value_scores.append(
-                        {
-                            "value": response.opposite_value,  # type: ignore
-                            "intensity": top_value_score.intensity,
-                        }
-                    )
-                else:
-                    value_scores.append(
-                        {
-                            "value": top_value_score.value,
-                            "intensity": top_value_score.intensity,
-                        }
-                    )
+        # 저장 시점에 계산하지 못한(이전 데이터 등) 반대 가치만 한 번 계산해서 저장
+        missing = [
+            value_score
+            for value_score in top_value_scores
+            if value_score.polarity == -1 and value_score.opposite_value is None
+        ]
+        if missing:
+            opposite_values = self._get_opposite_values(
+                [(value_score.value, value_score.category) for value_score in missing]
+            )
+            resolved = {}
+            for value_score, opposite_value in zip(
+                missing, opposite_values, strict=True
+            ):
+                if opposite_value is not None:
+                    value_score.opposite_value = opposite_value
+                    resolved[value_score.id] = opposite_value
+            self.value_score_repository.set_opposite_values(resolved)
+
+        value_scores = []
+        for top_value_score in top_value_scores:
+            if top_value_score.polarity == 0:
+                continue  # polarity가 0이면 append하지 않음
+
+            if top_value_score.polarity == -1:
+                if top_value_score.opposite_value is None:
+                    continue  # 반대 가치를 아직 얻지 못한 항목은 다음 조회에서 다시 시도
+                value = top_value_score.opposite_value
+            else:
+                value = top_value_score.value
+            value_scores.append(
+                {"value": value, "intensity": top_value_score.intensity}
+            )
 
         return value_scores
 
@@ -215,9 +255,9 @@ class ValueMapService:
         if not value_map:
             raise Exception("value_map does't exist")
 
-        llm = ChatOpenAI(model="gpt-5-nano").with_structured_output(
-            ValueMapAnalysisStructure
-        )
+        llm = chat_model(
+            "gpt-5-nano", cache=llm_cache("value_map_comment")
+        ).with_structured_output(ValueMapAnalysisStructure)
         value_map_combined_structured_chain = value_map_combined_structured_prompt | llm
 
         response = value_map_combined_structured_chain.invoke(
@@ -4,8 +4,9 @@ import random
 from abc import ABC, abstractmethod
 
 from langchain_core.output_parsers import PydanticOutputParser
-from langchain_openai import ChatOpenAI
 
+from app.common.llm import chat_model
+from app.common.llm_cache import llm_cache
 from app.features.journal.repository import JournalRepository
 from app.features.selfaware.models import Question
 from app.features.selfaware.prompt import (
@@ -40,7 +41,10 @@ class SelfawareStrategy(QuestionStrategy):
         journal_repository: JournalRepository,
         question_repository: QuestionRepository,
     ):
-        llm = ChatOpenAI(model="gpt-5-nano")
+        # 요약/카테고리는 같은 일기에 대해 결과를 재사용하고, 질문은 매번 새로 생성합니다.
+        summary_llm = chat_model("gpt-5-nano", cache=llm_cache("journal_summary"))
+        category_llm = chat_model("gpt-5-nano", cache=llm_cache("question_category"))
+        question_llm = chat_model("gpt-5-nano", cache=llm_cache("question_generation"))
         summary_parser = PydanticOutputParser(pydantic_object=JournalSummary)
         category_parser = PydanticOutputParser(
             pydantic_object=CategoryExtractionResponse
@@ -55,7 +59,7 @@ class SelfawareStrategy(QuestionStrategy):
         # ✅ 2. 최근 일기 3~5개만 선택 (토큰 제한 방지)
         combined_content = "\n".join([f"- {j.content}" for j in journals])
 
-        summary_chain = summary_prompt | llm | summary_parser
+        summary_chain = summary_prompt | summary_llm | summary_parser
 
         summary_response = summary_chain.invoke(
             {
@@ -65,7 +69,7 @@ class SelfawareStrategy(QuestionStrategy):
         summary = summary_response.summary
 
         # ✅ 4. 감정 분석 및 관련 카테고리 추출
-        category_chain = category_prompt | llm | category_parser
+        category_chain = category_prompt | category_llm | category_parser
         category_response: CategoryExtractionResponse = category_chain.invoke(
             {"summary": summary}
         )
@@ -78,7 +82,7 @@ class SelfawareStrategy(QuestionStrategy):
         categories_text = ", ".join(categories_text_list)
 
         # ✅ 5. 분석 결과를 바탕으로 자기성찰 질문 생성
-        question_chain = personalized_prompt | llm | question_parser
+        question_chain = personalized_prompt | question_llm | question_parser
         response: QuestionGenerationResponse = question_chain.invoke(
             {"summary": summary, "analysis": analysis, "categories": categories_text}
         )
@@ -100,7 +104,7 @@ class SingleStrategy(QuestionStrategy):
         journal_repository: JournalRepository,
         question_repository: QuestionRepository,
     ):
-        llm = ChatOpenAI(model="gpt-5-nano")
+        llm = chat_model("gpt-5-nano", cache=llm_cache("question_generation"))
         output_parser = PydanticOutputParser(pydantic_object=QuestionGenerationResponse)
 
         # 랜덤하게 카테고리 선택
@@ -131,7 +135,7 @@ class MultiStrategy(QuestionStrategy):
         journal_repository: JournalRepository,
         question_repository: QuestionRepository,
     ):
-        llm = ChatOpenAI(model="gpt-5-nano")
+        llm = chat_model("gpt-5-nano", cache=llm_cache("question_generation"))
         output_parser = PydanticOutputParser(pydantic_object=QuestionGenerationResponse)
 
         # 랜덤하게 2-3개 카테고리 선택
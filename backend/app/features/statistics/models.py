@@ -0,0 +1,47 @@
+from datetime import date
+
+from sqlalchemy import Date, Float, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.base import Base
+
+
+class EmotionDailyRollup(Base):
+    """
+    사용자/날짜/감정별 감정 강도 합계. journal 생성/삭제 시 증분으로 갱신하고,
+    /statistics/emotion-rate는 journal_emotions 대신 이 테이블을 합산합니다.
+    day는 journal.created_at(한국 시간)의 날짜입니다.
+    """
+
+    __tablename__ = "emotion_daily_rollups"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    emotion: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+    intensity_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # 해당 감정을 기록한 journal 수 (0이 되면 행을 삭제)
+    journal_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class KeywordEmotionDailyRollup(Base):
+    """
+    사용자/날짜/키워드/감정별 키워드 빈도와 연관도(weight) 합계. journal의 키워드를
+    저장(교체)하거나 journal을 삭제할 때 증분으로 갱신하고, /statistics/keywords는
+    journal_keywords 대신 이 테이블을 합산합니다. keyword는 정규화한 값입니다.
+    """
+
+    __tablename__ = "keyword_emotion_daily_rollups"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    keyword: Mapped[str] = mapped_column(String(100), primary_key=True)
+    emotion: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+    weight_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    # 해당 키워드가 이 감정으로 나온 journal 수 (0이 되면 행을 삭제)
+    journal_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
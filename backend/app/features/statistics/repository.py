@@ -1,12 +1,82 @@
-from datetime import date, datetime, timedelta
+from collections import defaultdict
+from datetime import date
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy import func
+from sqlalchemy import Date, delete, func, insert, select
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
 
 from app.database.session import get_db_session
-from app.features.journal.models import Journal, JournalEmotion
+from app.features.journal.models import Journal, JournalEmotion, JournalKeyword
+from app.features.statistics.models import (
+    EmotionDailyRollup,
+    KeywordEmotionDailyRollup,
+)
+from app.features.statistics.rollup import keyword_rollup_deltas
+
+
+def _emotion_counts_query(user_id: int, start_date: date, end_date: date) -> Select:
+    # 원본(journal_emotions) 대신 일별 rollup을 합산: 기간이 1년이어도 일수 x 감정 수 행
+    return (
+        select(
+            EmotionDailyRollup.emotion,
+            func.sum(EmotionDailyRollup.intensity_sum).label("count"),
+        )
+        .where(
+            EmotionDailyRollup.user_id == user_id,
+            EmotionDailyRollup.day >= start_date,
+            EmotionDailyRollup.day <= end_date,
+        )
+        .group_by(EmotionDailyRollup.emotion)
+    )
+
+
+def _keyword_emotion_query(
+    user_id: int, start_date: date, end_date: date, limit: int
+) -> Select:
+    """
+    기간 내 많이 나온 키워드 limit개의 감정별 (journal 수, weight 합).
+    키워드 journal 수 내림차순, 같은 키워드 안에서는 weight 합 내림차순.
+    """
+    in_range = (
+        KeywordEmotionDailyRollup.user_id == user_id,
+        KeywordEmotionDailyRollup.day >= start_date,
+        KeywordEmotionDailyRollup.day <= end_date,
+    )
+    keyword_count = func.sum(KeywordEmotionDailyRollup.journal_count)
+    top = (
+        select(
+            KeywordEmotionDailyRollup.keyword,
+            keyword_count.label("keyword_count"),
+        )
+        .where(*in_range)
+        .group_by(KeywordEmotionDailyRollup.keyword)
+        .order_by(keyword_count.desc(), KeywordEmotionDailyRollup.keyword)
+        .limit(limit)
+        .subquery()
+    )
+    weight = func.sum(KeywordEmotionDailyRollup.weight_sum)
+    return (
+        select(
+            KeywordEmotionDailyRollup.keyword,
+            KeywordEmotionDailyRollup.emotion,
+            func.sum(KeywordEmotionDailyRollup.journal_count).label("count"),
+            weight.label("weight"),
+        )
+        .join(top, top.c.keyword == KeywordEmotionDailyRollup.keyword)
+        .where(*in_range)
+        .group_by(
+            KeywordEmotionDailyRollup.keyword,
+            KeywordEmotionDailyRollup.emotion,
+            top.c.keyword_count,
+        )
+        .order_by(
+            top.c.keyword_count.desc(),
+            KeywordEmotionDailyRollup.keyword,
+            weight.desc(),
+        )
+    )
 
 
 class StatisticsRepository:
@@ -16,26 +86,85 @@ class StatisticsRepository:
     def get_emotion_counts(
         self, user_id: int, start_date: date, end_date: date
     ) -> tuple[list, int]:
-        start_datetime = datetime.combine(start_date, datetime.min.time())
-        end_datetime = datetime.combine(
-            end_date + timedelta(days=1), datetime.min.time()
-        )
+        results = self.session.execute(
+            _emotion_counts_query(user_id, start_date, end_date)
+        ).all()
+
+        total_count = sum((row.count or 0) for row in results)
+        return results, total_count
+
+    def get_keyword_emotion_stats(
+        self, user_id: int, start_date: date, end_date: date, limit: int = 30
+    ) -> list:
+        return self.session.execute(
+            _keyword_emotion_query(user_id, start_date, end_date, limit)
+        ).all()
 
-        query = (
-            self.session.query(
+    def rebuild_emotion_rollups(self, batch_size: int = 1000) -> int:
+        """
+        journal_emotions 전체로 emotion_daily_rollups를 다시 만듭니다.
+        (rollup 도입 전 데이터 backfill, 또는 집계가 어긋났을 때)
+        """
+        day = func.date(Journal.created_at, type_=Date)
+        rows = self.session.execute(
+            select(
+                Journal.user_id,
+                day,
                 JournalEmotion.emotion,
-                func.sum(JournalEmotion.intensity).label("count"),
+                func.sum(JournalEmotion.intensity),
+                func.count(),
             )
             .join(Journal)
-            .filter(
-                Journal.user_id == user_id,
-                Journal.created_at >= start_datetime,
-                Journal.created_at < end_datetime,
+            .group_by(Journal.user_id, day, JournalEmotion.emotion)
+        ).all()
+        rollups = [
+            {
+                "user_id": user_id,
+                "day": rollup_day,
+                "emotion": emotion,
+                "intensity_sum": intensity_sum,
+                "journal_count": journal_count,
+            }
+            for user_id, rollup_day, emotion, intensity_sum, journal_count in rows
+        ]
+
+        self.session.execute(delete(EmotionDailyRollup))
+        for start in range(0, len(rollups), batch_size):
+            self.session.execute(
+                insert(EmotionDailyRollup), rollups[start : start + batch_size]
             )
-            .group_by(JournalEmotion.emotion)
-        )
+        self.session.commit()
+        return len(rollups)
 
-        results = query.all()
+    def rebuild_keyword_rollups(self, batch_size: int = 1000) -> int:
+        """
+        journal_keywords 전체로 keyword_emotion_daily_rollups를 다시 만듭니다.
+        (rollup 도입 전 데이터 backfill, 또는 집계가 어긋났을 때)
+        """
+        # 키워드 저장 시와 같은 키가 되도록 SQL(lower/trim)이 아니라
+        # keyword_rollup_deltas(normalize_keyword)로 (user, 날짜)별 합산
+        rows = self.session.execute(
+            select(
+                Journal.user_id,
+                Journal.created_at,
+                JournalKeyword.keyword,
+                JournalKeyword.emotion,
+                JournalKeyword.weight,
+            ).join(Journal)
+        ).all()
+        groups: dict[tuple[int, date], list] = defaultdict(list)
+        for row in rows:
+            groups[(row.user_id, row.created_at.date())].append(row)
+        rollups = [
+            rollup
+            for (user_id, day), items in groups.items()
+            for rollup in keyword_rollup_deltas(user_id, day, [], items)
+        ]
 
-        total_count = sum((row.count or 0) for row in results)
-        return results, total_count
+        self.session.execute(delete(KeywordEmotionDailyRollup))
+        for start in range(0, len(rollups), batch_size):
+            self.session.execute(
+                insert(KeywordEmotionDailyRollup), rollups[start : start + batch_size]
+            )
+        self.session.commit()
+        return len(rollups)
@@ -0,0 +1,180 @@
+"""
+emotion_daily_rollups / keyword_emotion_daily_rollups 증분 갱신용 SQL.
+
+journal을 만들거나 지울 때(키워드는 저장/교체할 때) 같은 트랜잭션에서 행별 증감을
+upsert 한 문장(executemany)으로 반영합니다. DB의 현재 값에 더하므로 같은 날
+동시에 저장된 journal끼리 덮어쓰지 않습니다.
+
+*_statements 함수는 실행할 (문장, executemany 파라미터) 목록을 만들고, sync/async
+JournalRepository는 순서대로 execute만 합니다.
+"""
+
+from collections.abc import Iterable
+from datetime import date
+
+from sqlalchemy import Delete, Executable, Insert, Select, delete, select
+from sqlalchemy.dialects import mysql, sqlite
+
+from app.features.journal.keyword_index import normalize_keyword
+from app.features.journal.models import Journal, JournalKeyword
+from app.features.statistics.models import EmotionDailyRollup, KeywordEmotionDailyRollup
+
+# 순서대로 실행할 (문장, executemany 파라미터 또는 None) 목록
+Statements = list[tuple[Executable, list[dict] | None]]
+
+
+def emotion_rollup_deltas(journal: Journal, sign: int) -> list[dict]:
+    """journal 하나가 rollup에 더하는(sign=1) 또는 빼는(sign=-1) 값"""
+    if not journal.emotions:
+        return []
+    day = journal.created_at.date()
+    return [
+        {
+            "user_id": journal.user_id,
+            "day": day,
+            "emotion": emotion.emotion,
+            "intensity_sum": sign * emotion.intensity,
+            "journal_count": sign,
+        }
+        for emotion in journal.emotions
+    ]
+
+
+def upsert_emotion_rollups(dialect_name: str) -> Insert:
+    if dialect_name == "mysql":
+        stmt = mysql.insert(EmotionDailyRollup)
+        return stmt.on_duplicate_key_update(
+            intensity_sum=EmotionDailyRollup.intensity_sum
+            + stmt.inserted.intensity_sum,
+            journal_count=EmotionDailyRollup.journal_count
+            + stmt.inserted.journal_count,
+        )
+    # SQLite(로컬/테스트)
+    stmt = sqlite.insert(EmotionDailyRollup)
+    return stmt.on_conflict_do_update(
+        index_elements=[
+            EmotionDailyRollup.user_id,
+            EmotionDailyRollup.day,
+            EmotionDailyRollup.emotion,
+        ],
+        set_={
+            "intensity_sum": EmotionDailyRollup.intensity_sum
+            + stmt.excluded.intensity_sum,
+            "journal_count": EmotionDailyRollup.journal_count
+            + stmt.excluded.journal_count,
+        },
+    )
+
+
+def prune_emotion_rollups(user_id: int, day: date) -> Delete:
+    """해당 날짜에 더 이상 기록이 없는 감정 행 삭제"""
+    return delete(EmotionDailyRollup).where(
+        EmotionDailyRollup.user_id == user_id,
+        EmotionDailyRollup.day == day,
+        EmotionDailyRollup.journal_count <= 0,
+    )
+
+
+def keyword_rollup_deltas(
+    user_id: int,
+    day: date,
+    removed: Iterable,
+    added: Iterable,
+) -> list[dict]:
+    """
+    journal 키워드를 removed -> added로 바꿀 때 rollup에 더할 값.
+    항목은 keyword/emotion/weight 속성을 가진 객체(JournalKeyword 등)이고,
+    변화가 없는 (keyword, emotion)은 제외합니다.
+    """
+    totals: dict[tuple[str, str], list] = {}
+    for sign, items in ((-1, removed), (1, added)):
+        for item in items:
+            key = (normalize_keyword(item.keyword), item.emotion)
+            total = totals.setdefault(key, [0.0, 0])
+            total[0] += sign * item.weight
+            total[1] += sign
+    return [
+        {
+            "user_id": user_id,
+            "day": day,
+            "keyword": keyword,
+            "emotion": emotion,
+            "weight_sum": weight_sum,
+            "journal_count": journal_count,
+        }
+        for (keyword, emotion), (weight_sum, journal_count) in totals.items()
+        if weight_sum or journal_count
+    ]
+
+
+def upsert_keyword_rollups(dialect_name: str) -> Insert:
+    if dialect_name == "mysql":
+        stmt = mysql.insert(KeywordEmotionDailyRollup)
+        return stmt.on_duplicate_key_update(
+            weight_sum=KeywordEmotionDailyRollup.weight_sum + stmt.inserted.weight_sum,
+            journal_count=KeywordEmotionDailyRollup.journal_count
+            + stmt.inserted.journal_count,
+        )
+    # SQLite(로컬/테스트)
+    stmt = sqlite.insert(KeywordEmotionDailyRollup)
+    return stmt.on_conflict_do_update(
+        index_elements=[
+            KeywordEmotionDailyRollup.user_id,
+            KeywordEmotionDailyRollup.day,
+            KeywordEmotionDailyRollup.keyword,
+            KeywordEmotionDailyRollup.emotion,
+        ],
+        set_={
+            "weight_sum": KeywordEmotionDailyRollup.weight_sum
+            + stmt.excluded.weight_sum,
+            "journal_count": KeywordEmotionDailyRollup.journal_count
+            + stmt.excluded.journal_count,
+        },
+    )
+
+
+def prune_keyword_rollups(user_id: int, day: date) -> Delete:
+    """해당 날짜에 더 이상 나오지 않는 키워드/감정 행 삭제"""
+    return delete(KeywordEmotionDailyRollup).where(
+        KeywordEmotionDailyRollup.user_id == user_id,
+        KeywordEmotionDailyRollup.day == day,
+        KeywordEmotionDailyRollup.journal_count <= 0,
+    )
+
+
+def emotion_rollup_statements(
+    dialect_name: str, journal: Journal, sign: int
+) -> Statements:
+    """감정 일별 rollup에 journal을 더하거나(sign=1) 빼는(sign=-1) 문장"""
+    deltas = emotion_rollup_deltas(journal, sign)
+    if not deltas:
+        return []
+    statements: Statements = [(upsert_emotion_rollups(dialect_name), deltas)]
+    if sign < 0:
+        statements.append(
+            (prune_emotion_rollups(journal.user_id, deltas[0]["day"]), None)
+        )
+    return statements
+
+
+def keyword_rollup_statements(
+    dialect_name: str, user_id: int, day: date, removed: Iterable, added: Iterable
+) -> Statements:
+    """키워드 일별 rollup에서 removed를 빼고 added를 더하는 문장"""
+    deltas = keyword_rollup_deltas(user_id, day, removed, added)
+    if not deltas:
+        return []
+    statements: Statements = [(upsert_keyword_rollups(dialect_name), deltas)]
+    if any(delta["journal_count"] < 0 for delta in deltas):
+        statements.append((prune_keyword_rollups(user_id, day), None))
+    return statements
+
+
+def stored_keywords_query(journal_id: int) -> Select:
+    """
+    journal에 저장된 (keyword, emotion, weight). 키워드를 교체/삭제할 때 rollup에서 뺄 값으로,
+    로드된 journal.keywords는 교체 후 최신이 아닐 수 있어서 DB에서 다시 읽습니다.
+    """
+    return select(
+        JournalKeyword.keyword, JournalKeyword.emotion, JournalKeyword.weight
+    ).where(JournalKeyword.journal_id == journal_id)
@@ -4,7 +4,10 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Query, status
 
 from app.common.authorization import get_current_user
-from app.features.statistics.schema.responses import StatisticsEmotionResponse
+from app.features.statistics.schema.responses import (
+    StatisticsEmotionResponse,
+    StatisticsKeywordResponse,
+)
 from app.features.statistics.service import StatisticsService
 from app.features.user.models import User
 
@@ -27,3 +30,22 @@ def get_emotion_rates(
     user: User = Depends(get_current_user),
 ) -> StatisticsEmotionResponse:
     return statistics_service.get_emotion_rates(user.id, start_date, end_date)
+
+
+@router.get(
+    "/keywords",
+    response_model=StatisticsKeywordResponse,
+    status_code=status.HTTP_200_OK,
+    summary="키워드 빈도와 감정 연관도",
+    description="""
+    특정 기간에 일기에 많이 나온 키워드와 키워드별 감정 연관도(weight 합, 비율)를 반환합니다.
+    """,
+)
+def get_keyword_stats(
+    statistics_service: Annotated[StatisticsService, Depends()],
+    start_date: date = Query(..., description="조회 시작 날짜 (YYYY-MM-DD 형식)"),
+    end_date: date = Query(..., description="조회 종료 날짜 (YYYY-MM-DD 형식)"),
+    limit: int = Query(default=30, ge=1, le=100, description="키워드 수"),
+    user: User = Depends(get_current_user),
+) -> StatisticsKeywordResponse:
+    return statistics_service.get_keyword_stats(user.id, start_date, end_date, limit)
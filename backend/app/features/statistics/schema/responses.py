@@ -39,3 +39,20 @@ class EmotionStat(BaseModel):
 class StatisticsEmotionResponse(BaseModel):
     total_count: int
     statistics: list[EmotionStat]
+
+
+class KeywordEmotionStat(BaseModel):
+    emotion: str
+    count: int
+    weight: float
+    percentage: float
+
+
+class KeywordStat(BaseModel):
+    keyword: str
+    count: int
+    emotions: list[KeywordEmotionStat]
+
+
+class StatisticsKeywordResponse(BaseModel):
+    keywords: list[KeywordStat]
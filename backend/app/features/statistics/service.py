@@ -6,7 +6,9 @@ from fastapi import Depends
 from app.features.statistics.repository import StatisticsRepository
 from app.features.statistics.schema.responses import (
     EmotionStat,
+    KeywordStat,
     StatisticsEmotionResponse,
+    StatisticsKeywordResponse,
 )
 
 
@@ -37,3 +39,39 @@ class StatisticsService:
                 )
 
         return {"total_count": total_count, "statistics": statistics_list}
+
+    def get_keyword_stats(
+        self, user_id: int, start_date: date, end_date: date, limit: int = 30
+    ) -> StatisticsKeywordResponse:
+        rows = self.statistics_repository.get_keyword_emotion_stats(
+            user_id, start_date, end_date, limit
+        )
+
+        # 행은 키워드 순서대로 감정별로 나뉘어 있음
+        keywords: dict[str, list] = {}
+        for row in rows:
+            keywords.setdefault(row.keyword, []).append(row)
+
+        statistics_list: list[KeywordStat] = []
+        for keyword, emotion_rows in keywords.items():
+            # 감정별 비율은 연관도(weight) 합 기준
+            total_weight = sum(row.weight for row in emotion_rows)
+            statistics_list.append(
+                {
+                    "keyword": keyword,
+                    "count": sum(row.count for row in emotion_rows),
+                    "emotions": [
+                        {
+                            "emotion": row.emotion,
+                            "count": row.count,
+                            "weight": round(row.weight, 4),
+                            "percentage": round(row.weight / total_weight * 100, 2)
+                            if total_weight > 0
+                            else 0.0,
+                        }
+                        for row in emotion_rows
+                    ],
+                }
+            )
+
+        return {"keywords": statistics_list}
@@ -0,0 +1,143 @@
+import json
+import threading
+from datetime import date
+from typing import Protocol
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.common.ttl_cache import InMemoryTTLCache
+from app.core.config import settings
+from app.features.user.models import User
+
+# 캐시에 저장하는 컬럼 (relationship은 merge 이후 요청 세션에서 lazy load)
+# hashed_password는 공유 캐시에 복사하지 않고, 비밀번호 확인 시 DB에서 읽습니다.
+# (다른 worker의 캐시가 TTL 동안 이전 비밀번호를 통과시키지 않도록)
+CACHED_USER_COLUMNS = (
+    "id",
+    "login_id",
+    "username",
+    "gender",
+    "birthdate",
+    "appearance",
+)
+
+
+class UserCacheBackend(Protocol):
+    def get(self, key: str) -> dict | None: ...
+
+    def set(self, key: str, value: dict, ttl_seconds: float) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def __len__(self) -> int: ...
+
+
+class InMemoryUserCacheBackend(InMemoryTTLCache):
+    """기본 backend. worker 간 공유가 필요하면 USER_CACHE_REDIS_URL을 설정합니다."""
+
+
+class RedisUserCacheBackend:
+    """
+    worker 간 공유 캐시. redis 패키지는 선택 의존성이므로 사용할 때만 import 합니다.
+    (poetry install -E cache)
+    """
+
+    def __init__(self, url: str, prefix: str = "mindlog:user:") -> None:
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def get(self, key: str) -> dict | None:
+        raw = self._client.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: dict, ttl_seconds: float) -> None:
+        self._client.set(
+            self.prefix + key, json.dumps(value), px=int(ttl_seconds * 1000)
+        )
+
+    def delete(self, key: str) -> None:
+        self._client.delete(self.prefix + key)
+
+    def clear(self) -> None:
+        keys = list(self._client.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self._client.delete(*keys)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._client.scan_iter(match=self.prefix + "*"))
+
+
+class UserCache:
+    """
+    get_current_user용 인증 사용자 캐시 (login_id -> User 컬럼 값).
+    세션에 묶이지 않은 값만 저장하고, 꺼낼 때 detached User로 복원합니다.
+    """
+
+    def __init__(self, backend: UserCacheBackend, ttl_seconds: float) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, login_id: str) -> User | None:
+        if not self.enabled:
+            return None
+        data = self.backend.get(login_id)
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        user = User(**{**data, "birthdate": date.fromisoformat(data["birthdate"])})
+        make_transient_to_detached(user)
+        return user
+
+    def set(self, user: User) -> None:
+        if not self.enabled:
+            return
+        data = {column: getattr(user, column) for column in CACHED_USER_COLUMNS}
+        data["birthdate"] = user.birthdate.isoformat()
+        self.backend.set(user.login_id, data, self.ttl_seconds)
+
+    def invalidate(self, login_id: str) -> None:
+        self.backend.delete(login_id)
+        with self._lock:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": type(self.backend).__name__,
+                "enabled": self.enabled,
+                "ttl_seconds": self.ttl_seconds,
+                "size": len(self.backend),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def build_user_cache() -> UserCache:
+    if settings.USER_CACHE_REDIS_URL:
+        backend: UserCacheBackend = RedisUserCacheBackend(settings.USER_CACHE_REDIS_URL)
+    else:
+        backend = InMemoryUserCacheBackend(settings.USER_CACHE_MAX_SIZE)
+    return UserCache(backend, settings.USER_CACHE_TTL_SECONDS)
+
+
+user_cache = build_user_cache()
@@ -14,6 +14,15 @@ if TYPE_CHECKING:
     from app.features.selfaware.models import Answer, Question, ValueMap
 
 
+def calculate_age(birthdate: date, today: date | None = None) -> int:
+    today = today or date.today()
+    return (
+        today.year
+        - birthdate.year
+        - ((today.month, today.day) < (birthdate.month, birthdate.day))
+    )
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -43,9 +52,4 @@ class User(Base):
 
     @property
     def age(self) -> int:
-        today = date.today()
-        return (
-            today.year
-            - self.birthdate.year
-            - ((today.month, today.day) < (self.birthdate.month, self.birthdate.day))
-        )
+        return calculate_age(self.birthdate)
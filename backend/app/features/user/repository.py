@@ -2,12 +2,13 @@ from datetime import date
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.orm import Session
 
 from app.database.session import get_db_session
 from app.features.auth.security import hash_password
 
+from .cache import user_cache
 from .models import User
 
 
@@ -37,6 +38,25 @@ class UserRepository:
     def get_user_by_login_id(self, login_id: str) -> User | None:
         return self.session.scalar(select(User).filter(User.login_id == login_id))
 
+    def get_cached_user_by_login_id(self, login_id: str) -> User | None:
+        """
+        user_cache에 있으면 DB 조회 없이 현재 세션에 merge 해서 반환합니다.
+        merge(load=False)라 SELECT가 나가지 않고, 이후 수정/lazy load는 이 세션에서 동작합니다.
+        """
+        cached = user_cache.get(login_id)
+        if cached is not None:
+            return self.session.merge(cached, load=False)
+        user = self.get_user_by_login_id(login_id)
+        if user is not None:
+            user_cache.set(user)
+        return user
+
+    def get_hashed_password(self, user_id: int) -> str | None:
+        """캐시된 User에는 hashed_password가 없으므로 항상 DB에서 읽습니다."""
+        return self.session.scalar(
+            select(User.hashed_password).where(User.id == user_id)
+        )
+
     def update_me(
         self,
         user: User,
@@ -57,3 +77,13 @@ class UserRepository:
         if appearance is not None:
             user.appearance = appearance
         self.session.flush()
+
+        # 커밋 전에 다른 요청이 이전 값을 다시 채울 수 있으므로 커밋 직후에도 한 번 더 비웁니다.
+        login_id = user.login_id
+        user_cache.invalidate(login_id)
+        event.listen(
+            self.session,
+            "after_commit",
+            lambda session: user_cache.invalidate(login_id),
+            once=True,
+        )
@@ -19,6 +19,9 @@ class UserService:
     def get_user_by_login_id(self, login_id: str) -> User | None:
         return self.user_repository.get_user_by_login_id(login_id)
 
+    def get_authenticated_user(self, login_id: str) -> User | None:
+        return self.user_repository.get_cached_user_by_login_id(login_id)
+
     def update_me(
         self,
         user: User,
@@ -38,7 +41,10 @@ class UserService:
         )
 
     def is_my_password(self, user: User, current_password: str) -> bool:
-        if not verify_password(current_password, user.hashed_password):
+        hashed_password = self.user_repository.get_hashed_password(user.id)
+        if hashed_password is None or not verify_password(
+            current_password, hashed_password
+        ):
             return False
         return True
 
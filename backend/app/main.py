@@ -1,13 +1,38 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 
+from .common.llm import llm_clients
+from .core.config import settings
 from .features.analysis.router import router as analysis_router
 from .features.auth.router import router as auth_router
+from .features.auth.tasks import run_blocked_token_maintenance
+from .features.internal.router import router as internal_router
+from .features.jobs.router import router as jobs_router
 from .features.journal.router import router as journal_router
+from .features.journal.storage import s3_clients
 from .features.selfaware.router import router as self_aware_router
 from .features.statistics.router import router as statistics_router
 from .features.user.router import router as user_router
 
-app = FastAPI(title="MindLog")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    maintenance = None
+    if settings.BLOCKED_TOKEN_INDEX_ENABLED:
+        maintenance = asyncio.create_task(run_blocked_token_maintenance())
+    yield
+    if maintenance is not None:
+        maintenance.cancel()
+        with suppress(asyncio.CancelledError):
+            await maintenance
+    # OpenAI/S3 클라이언트는 처음 사용할 때 만들어지고, 종료 시 연결 풀을 닫습니다.
+    await llm_clients.aclose()
+    await s3_clients.aclose()
+
+
+app = FastAPI(title="MindLog", lifespan=lifespan)
 
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(user_router, prefix="/api/v1")
@@ -15,6 +40,8 @@ app.include_router(journal_router, prefix="/api/v1")
 app.include_router(statistics_router, prefix="/api/v1")
 app.include_router(self_aware_router, prefix="/api/v1")
 app.include_router(analysis_router, prefix="/api/v1")
+app.include_router(jobs_router, prefix="/api/v1")
+app.include_router(internal_router, prefix="/api/v1")
 
 
 @app.get("/")
@@ -0,0 +1,47 @@
+"""
+백그라운드 job worker 실행 진입점.
+
+    python -m app.worker           # jobs 테이블을 계속 polling
+    python -m app.worker --once    # 실행 가능한 job을 모두 처리하고 종료
+
+API 서버(uvicorn)와 같은 DATABASE_URL을 사용하며, 여러 개를 띄워도 됩니다.
+"""
+
+import argparse
+import logging
+import signal
+import threading
+
+from app.core.config import settings
+from app.features.jobs.handlers import JOB_HANDLERS
+from app.features.jobs.worker import JobWorker
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MindLog background job worker")
+    parser.add_argument(
+        "--once", action="store_true", help="process runnable jobs and exit"
+    )
+    parser.add_argument(
+        "--poll-interval", type=float, default=settings.JOB_POLL_INTERVAL_SECONDS
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    worker = JobWorker(handlers=JOB_HANDLERS)
+    if args.once:
+        processed = worker.run_until_empty()
+        logging.info(f"Processed {processed} jobs")
+        return
+
+    # 실행 중인 job은 끝까지 처리하고 종료합니다.
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    worker.run_forever(args.poll_interval, stop)
+
+
+if __name__ == "__main__":
+    main()
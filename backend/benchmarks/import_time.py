@@ -0,0 +1,129 @@
+"""
+앱 import 시간 예산 체크. (backend 디렉터리에서 실행)
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --module app.worker --budget-ms 1500 --top 30
+
+`python -X importtime -c "import <module>"`를 --runs번 실행해서 가장 빠른 결과로
+전체 시간, 패키지별/모듈별 self 시간을 출력합니다. 전체 시간이 --budget-ms를 넘거나
+--forbid 모듈(처음 사용할 때 불러와야 하는 무거운 클라이언트)이 import 시점에
+로드되면 exit code 1로 끝납니다.
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+
+DEFAULT_MODULE = "app.main"
+DEFAULT_BUDGET_MS = 2000
+# app.common.llm / S3Repository에서 처음 사용할 때 import합니다.
+DEFAULT_FORBIDDEN = ("langchain_openai", "openai", "boto3")
+
+LINE_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> list[ImportRecord]:
+    records = []
+    for line in stderr.splitlines():
+        match = LINE_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(
+                ImportRecord(module, int(self_us), int(cumulative_us), len(indent) // 2)
+            )
+    return records
+
+
+def measure_imports(module: str) -> list[ImportRecord]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{completed.stderr}")
+    return parse_importtime(completed.stderr)
+
+
+def total_ms(records: list[ImportRecord]) -> float:
+    # 최상위(depth 0) import의 cumulative 합
+    return sum(r.cumulative_us for r in records if r.depth == 0) / 1000
+
+
+def by_package(records: list[ImportRecord]) -> dict[str, float]:
+    packages: dict[str, float] = defaultdict(float)
+    for record in records:
+        packages[record.module.split(".")[0]] += record.self_us / 1000
+    return dict(sorted(packages.items(), key=lambda item: item[1], reverse=True))
+
+
+def find_violations(
+    records: list[ImportRecord], budget_ms: float, forbidden: tuple[str, ...]
+) -> list[str]:
+    violations = []
+    total = total_ms(records)
+    if total > budget_ms:
+        violations.append(f"import time {total:.1f}ms exceeds budget {budget_ms:.0f}ms")
+    loaded = {record.module for record in records}
+    for module in forbidden:
+        if module in loaded:
+            violations.append(f"{module} is imported eagerly")
+    return violations
+
+
+def print_report(records: list[ImportRecord], module: str, top: int) -> None:
+    print(f"import {module}: {total_ms(records):.0f}ms, {len(records)} modules")
+    print(f"\n{'package':<32}{'self ms':>10}")
+    for package, self_ms in list(by_package(records).items())[:top]:
+        print(f"{package:<32}{self_ms:>10.1f}")
+    print(f"\n{'module':<56}{'self ms':>10}{'cumul ms':>10}")
+    for record in sorted(records, key=lambda r: r.self_us, reverse=True)[:top]:
+        print(
+            f"{record.module:<56}{record.self_us / 1000:>10.1f}"
+            f"{record.cumulative_us / 1000:>10.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check the app import-time budget")
+    parser.add_argument("--module", default=DEFAULT_MODULE, help="module to import")
+    parser.add_argument("--runs", type=int, default=3, help="keep the fastest run")
+    parser.add_argument("--top", type=int, default=20, help="rows per table")
+    parser.add_argument(
+        "--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="total time budget"
+    )
+    parser.add_argument(
+        "--forbid",
+        action="append",
+        help=f"module that must not load at import (default: {DEFAULT_FORBIDDEN})",
+    )
+    args = parser.parse_args()
+
+    runs = [measure_imports(args.module) for _ in range(args.runs)]
+    records = min(runs, key=total_ms)
+    print_report(records, args.module, args.top)
+
+    violations = find_violations(
+        records, args.budget_ms, tuple(args.forbid or DEFAULT_FORBIDDEN)
+    )
+    if violations:
+        print("\nImport budget violations:")
+        for violation in violations:
+            print(f"  {violation}")
+        sys.exit(1)
+    print(f"\nWithin {args.budget_ms:.0f}ms budget")
+
+
+if __name__ == "__main__":
+    main()
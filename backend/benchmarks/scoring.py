@@ -0,0 +1,313 @@
+"""
+comprehensive-analysis 채점 경로 벤치마크. (backend 디렉터리에서 실행)
+
+    python -m benchmarks.scoring
+    python -m benchmarks.scoring --workers 4
+    python -m benchmarks.scoring --compare benchmarks/baseline.json
+    python -m benchmarks.scoring --save benchmarks/baseline.json
+
+각 벤치마크를 --workers개 프로세스에서 동시에 돌려 전체 처리량과 코어당 처리량을 출력합니다.
+머신 성능 차이를 줄이기 위해 같은 프로세스에서 잰 calibration 루프 처리량으로 나눈
+normalized 값으로 baseline과 비교하고, --threshold(기본 30%)보다 많이 떨어진
+항목이 있으면 exit code 1로 끝납니다.
+
+calibration으로 나눠도 머신/부하에 따라 수십 % 흔들릴 수 있어서 CI에서는 참고용
+(continue-on-error)으로만 실행합니다. 회귀 여부는 같은 머신에서 변경 전후를
+--save/--compare로 비교해 확인합니다.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+import numpy as np
+
+from app.features.analysis.comprehensive_analysis.evaluator import (
+    ITEMS,
+    SEXES,
+    evaluate,
+    score_batch,
+)
+
+DEFAULT_THRESHOLD = 0.30
+SEED = 14
+
+# 이름 -> (setup(batch_size) -> 한 번 호출할 함수, 호출 한 번의 처리 건수)
+Benchmark = tuple[Callable[[], object], int]
+
+
+def synthetic_answers(count: int, seed: int = SEED) -> list[list[int]]:
+    """evaluate 입력 형식(0번 미사용, 1~5 응답)의 무작위 응답 벡터"""
+    rng = np.random.default_rng(seed)
+    answers = rng.integers(1, 6, size=(count, ITEMS))
+    answers[:, 0] = 0
+    return answers.tolist()
+
+
+def synthetic_respondents(count: int, seed: int = SEED) -> tuple[list, list, list]:
+    rng = np.random.default_rng(seed)
+    sexes = [SEXES[i] for i in rng.integers(0, len(SEXES), size=count)]
+    ages = rng.integers(15, 80, size=count).tolist()
+    return synthetic_answers(count, seed), sexes, ages
+
+
+def calibration() -> int:
+    # 채점 경로와 비슷하게 파이썬 루프 + numpy 연산을 섞은 고정 작업량
+    values = np.arange(ITEMS * 200, dtype=np.float64).reshape(200, ITEMS)
+    total = sum(i * i for i in range(2000))
+    return total + int((values * 1.5 + 3.0).sum(axis=1).max())
+
+
+def setup_evaluate(batch_size: int) -> Benchmark:
+    answers, sexes, ages = synthetic_respondents(256)
+    cases = iter(range(10**9))
+
+    def run():
+        i = next(cases) % len(answers)
+        return evaluate(answers[i], sexes[i], ages[i])
+
+    return run, 1
+
+
+def setup_score_batch(batch_size: int) -> Benchmark:
+    answers, sexes, ages = synthetic_respondents(batch_size)
+    answers_array = np.asarray(answers)
+    return lambda: score_batch(answers_array, sexes, ages), batch_size
+
+
+def setup_load_questions(batch_size: int) -> Benchmark:
+    # 캐시를 거치지 않는 questions.ts 파싱 비용
+    from app.features.analysis.comprehensive_analysis.question_bank import (
+        source_path,
+    )
+    from app.features.analysis.comprehensive_analysis.score import (
+        load_questions_with_keyed,
+    )
+
+    path = str(source_path("ko"))
+    return lambda: load_questions_with_keyed(path), 1
+
+
+def setup_evaluate_user_type(batch_size: int) -> Benchmark:
+    """SQLite in-memory DB에 채점된 analysis를 넣고 evaluate_user_type을 호출합니다."""
+    from sqlalchemy import create_engine, insert
+    from sqlalchemy.orm import Session
+
+    from app.database.base import Base
+    from app.features.analysis.di import get_analysis_service
+    from app.features.analysis.models import Analysis
+    from app.features.journal.models import Journal  # noqa: F401
+    from app.features.user.models import User
+
+    users = 200
+    answers, sexes, ages = synthetic_respondents(users)
+    scores = score_batch(answers, sexes, ages)
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    session.execute(
+        insert(User),
+        [
+            {
+                "id": i + 1,
+                "login_id": f"bench{i}",
+                "hashed_password": "x",
+                "gender": sexes[i],
+                "birthdate": date(date.today().year - ages[i], 1, 1),
+            }
+            for i in range(users)
+        ],
+    )
+    session.execute(
+        insert(Analysis),
+        [{"user_id": i + 1, "neo_pi_score": scores.to_dict(i)} for i in range(users)],
+    )
+    session.commit()
+
+    service = get_analysis_service(session)
+    user_ids = iter(range(10**9))
+
+    def run():
+        # identity map 캐시가 아니라 실제 SELECT 경로를 재도록 매번 비웁니다.
+        session.expunge_all()
+        return service.evaluate_user_type(next(user_ids) % users + 1)
+
+    return run, 1
+
+
+BENCHMARKS: dict[str, Callable[[int], Benchmark]] = {
+    "evaluate": setup_evaluate,
+    "score_batch": setup_score_batch,
+    "load_questions_with_keyed": setup_load_questions,
+    "evaluate_user_type": setup_evaluate_user_type,
+}
+
+
+def measure(
+    fn: Callable[[], object], ops_per_call: int, min_time: float, repeats: int
+) -> float:
+    """min_time 이상 걸리도록 호출 횟수를 정한 뒤 repeats번 재서 가장 빠른 처리량(ops/s)"""
+    calls = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time / 10:
+            break
+        calls *= 10
+    calls = max(1, int(calls * min_time / elapsed))
+
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, time.perf_counter() - started)
+    return calls * ops_per_call / best
+
+
+def run_suite(
+    names: list[str], batch_size: int, min_time: float, repeats: int
+) -> dict[str, float]:
+    """
+    한 프로세스에서 각 벤치마크의 처리량(ops/s)을 잽니다.
+    calibration은 suite 앞뒤로 재서 평균을 씁니다. (측정 중 머신 부하 변화 완화)
+    """
+    before = measure(calibration, 1, min_time, repeats)
+    rates = {}
+    for name in names:
+        fn, ops_per_call = BENCHMARKS[name](batch_size)
+        rates[name] = measure(fn, ops_per_call, min_time, repeats)
+    rates["calibration"] = (before + measure(calibration, 1, min_time, repeats)) / 2
+    return rates
+
+
+def run(
+    names: list[str],
+    workers: int = 1,
+    batch_size: int = 1000,
+    min_time: float = 0.2,
+    repeats: int = 5,
+) -> dict[str, dict[str, float]]:
+    """
+    workers개 프로세스에서 동시에 run_suite를 실행하고 벤치마크별로
+    ops_per_sec(전체), per_core, normalized(per_core / calibration per_core)를 반환합니다.
+    """
+    args = (names, batch_size, min_time, repeats)
+    if workers == 1:
+        per_worker = [run_suite(*args)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_suite, *args) for _ in range(workers)]
+            per_worker = [future.result() for future in futures]
+
+    calibration_per_core = sum(r["calibration"] for r in per_worker) / workers
+    results = {}
+    for name in names:
+        total = sum(r[name] for r in per_worker)
+        results[name] = {
+            "ops_per_sec": round(total, 2),
+            "per_core": round(total / workers, 2),
+            "normalized": round(total / workers / calibration_per_core, 4),
+        }
+    return results
+
+
+def find_regressions(
+    results: dict[str, dict[str, float]], baseline: dict, threshold: float
+) -> list[str]:
+    """baseline보다 normalized 처리량이 threshold 비율 넘게 떨어진 항목"""
+    regressions = []
+    for name, expected in baseline["results"].items():
+        if name not in results:
+            continue
+        current = results[name]["normalized"]
+        change = current / expected["normalized"] - 1
+        if change < -threshold:
+            regressions.append(
+                f"{name}: {change:+.1%} (baseline {expected['normalized']:.4g}, "
+                f"now {current:.4g}, threshold -{threshold:.0%})"
+            )
+    return regressions
+
+
+def print_results(results: dict[str, dict[str, float]], workers: int) -> None:
+    print(f"{'benchmark':<28}{'ops/s':>14}{'ops/s/core':>14}{'normalized':>12}")
+    for name, result in results.items():
+        print(
+            f"{name:<28}{result['ops_per_sec']:>14,.0f}"
+            f"{result['per_core']:>14,.0f}{result['normalized']:>12.4g}"
+        )
+    print(f"({workers} worker process(es), {os.cpu_count()} cpu(s))")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark NEO-PI scoring paths")
+    parser.add_argument(
+        "--only",
+        action="append",
+        choices=sorted(BENCHMARKS),
+        help="run only this benchmark (repeatable)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="processes running the suite at once"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help="respondents per score_batch call"
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="seconds per measurement"
+    )
+    parser.add_argument("--repeats", type=int, default=5, help="measurements per run")
+    parser.add_argument("--save", help="write results to this baseline file")
+    parser.add_argument("--compare", help="fail on regression against this baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed slowdown ratio before failing (0.3 = 30%%)",
+    )
+    args = parser.parse_args()
+
+    names = args.only or list(BENCHMARKS)
+    results = run(names, args.workers, args.batch_size, args.min_time, args.repeats)
+    print_results(results, args.workers)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "machine": f"{platform.platform()} / {platform.processor()}",
+                    "python": platform.python_version(),
+                    "workers": args.workers,
+                    "batch_size": args.batch_size,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+            f.write("\n")
+        print(f"Saved baseline to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.threshold)
+        if regressions:
+            print("Performance regressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%} against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+journal 전문 검색(FTS) vs LIKE scan 벤치마크. (backend 디렉터리에서 실행)
+
+    python -m benchmarks.search
+    python -m benchmarks.search --journals 100000 --users 10 --repeats 20
+
+SQLite 파일 DB에 합성 journal을 --journals개 만들고(사용자 --users명에게 고르게
+분배), 한 사용자의 journal을 검색하는 첫 페이지(limit 10) 조회 시간을 비교합니다.
+
+- like: title/content/gratitude에 ILIKE '%단어%'를 OR로 걸고 최신 순 정렬
+- fts: JournalRepository.full_text_search (FTS5 trigram + bm25 정렬)
+
+LIKE는 최신 순으로 훑다가 limit개를 채우면 끝나므로 흔한 단어에서는 빠르지만,
+드문 단어는 사용자 journal 전체를 훑어야 합니다(journal 수에 비례). FTS는 일치하는
+journal 수에 비례하므로 드문 단어일수록 빠르고, 거의 모든 journal에 있는 단어는
+전부 점수를 매겨 정렬해야 해서 LIKE보다 느립니다. MySQL FULLTEXT(ngram)와 수치가
+같지는 않으니 경향만 참고합니다.
+"""
+
+import argparse
+import itertools
+import os
+import random
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, insert, or_, select
+from sqlalchemy.orm import Session
+
+import app.database  # noqa: F401  (모든 모델 등록)
+from app.database.base import Base
+from app.features.journal.models import Journal
+from app.features.journal.repository import (
+    JOURNAL_LIST_LOADER_OPTIONS,
+    JournalRepository,
+)
+from app.features.user.models import User
+
+SEED = 14
+LIMIT = 10
+
+VOCABULARY_SIZE = 5000
+SYLLABLES = (
+    "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추"
+)
+PARTICLES = ("", "을", "를", "이", "가", "에서", "와", "는")
+RARE_WORDS = ("스카이다이빙을", "오로라를", "마라톤을", "캘리그라피를")
+
+
+def synthetic_vocabulary(rng: random.Random) -> list[str]:
+    words: set[str] = set()
+    while len(words) < VOCABULARY_SIZE:
+        stem = "".join(rng.choices(SYLLABLES, k=rng.randint(2, 3)))
+        words.add(stem + rng.choice(PARTICLES))
+    return sorted(words)
+
+
+def synthetic_text(rng: random.Random, vocabulary: list[str], words: int) -> str:
+    # 앞쪽 단어일수록 흔하게 (Zipf 분포)
+    chosen = rng.choices(vocabulary, cum_weights=ZIPF_CUM_WEIGHTS, k=words)
+    if rng.random() < 0.001:
+        chosen[rng.randrange(words)] = rng.choice(RARE_WORDS)
+    return " ".join(chosen)
+
+
+ZIPF_CUM_WEIGHTS = list(
+    itertools.accumulate(1 / (rank + 1) for rank in range(VOCABULARY_SIZE))
+)
+
+
+def search_queries(vocabulary: list[str]) -> dict[str, list[str]]:
+    """이름 -> 검색어 (단어의 흔한 정도별)"""
+    return {
+        "common word": [vocabulary[0]],
+        "mid-frequency word": [vocabulary[100]],
+        "uncommon word": [vocabulary[2000]],
+        "rare word": [RARE_WORDS[1]],
+        "two words (AND)": [vocabulary[10], vocabulary[50]],
+        "three words (AND)": [vocabulary[1], vocabulary[20], vocabulary[300]],
+    }
+
+
+def seed_database(
+    session: Session, vocabulary: list[str], journals: int, users: int
+) -> list[int]:
+    rng = random.Random(SEED)
+    user_rows = [
+        {
+            "login_id": f"bench_user_{i}",
+            "hashed_password": "x",
+            "username": f"bench_user_{i}",
+            "gender": "Female",
+            "birthdate": datetime(2000, 1, 1).date(),
+        }
+        for i in range(users)
+    ]
+    session.execute(insert(User), user_rows)
+    user_ids = list(session.scalars(select(User.id)))
+
+    started = datetime(2024, 1, 1)
+    batch: list[dict] = []
+    for i in range(journals):
+        batch.append(
+            {
+                "user_id": user_ids[i % users],
+                "title": synthetic_text(rng, vocabulary, 3),
+                "content": synthetic_text(rng, vocabulary, rng.randint(30, 120)),
+                "gratitude": synthetic_text(rng, vocabulary, 8),
+                "created_at": started + timedelta(minutes=10 * i),
+            }
+        )
+        if len(batch) == 5000:
+            session.execute(insert(Journal), batch)
+            batch.clear()
+    if batch:
+        session.execute(insert(Journal), batch)
+    session.commit()
+    return user_ids
+
+
+def like_search(session: Session, user_id: int, terms: list[str]) -> list[Journal]:
+    """전문 검색 도입 전 방식: 컬럼마다 ILIKE, 최신 순"""
+    stmt = (
+        select(Journal)
+        .options(*JOURNAL_LIST_LOADER_OPTIONS)
+        .where(Journal.user_id == user_id)
+    )
+    for term in terms:
+        stmt = stmt.where(
+            or_(
+                Journal.title.ilike(f"%{term}%"),
+                Journal.content.ilike(f"%{term}%"),
+                Journal.gratitude.ilike(f"%{term}%"),
+            )
+        )
+    stmt = stmt.order_by(Journal.id.desc()).limit(LIMIT)
+    return list(session.scalars(stmt))
+
+
+def measure(run: Callable[[], list], repeats: int) -> tuple[float, int]:
+    """(중앙값 ms, 결과 수)"""
+    found = len(run())  # warm-up
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Full-text search vs LIKE scan")
+    parser.add_argument("--journals", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'search.db')}")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            started = time.perf_counter()
+            vocabulary = synthetic_vocabulary(random.Random(SEED))
+            user_ids = seed_database(session, vocabulary, args.journals, args.users)
+            print(
+                f"seeded {args.journals} journals for {args.users} users "
+                f"in {time.perf_counter() - started:.1f}s"
+            )
+            user_id = user_ids[0]
+            repository = JournalRepository(session)
+
+            print(f"{'query':<20} {'like ms':>9} {'fts ms':>9} {'speedup':>8} hits")
+            for name, terms in search_queries(vocabulary).items():
+                like_ms, like_hits = measure(
+                    lambda terms=terms: like_search(session, user_id, terms),
+                    args.repeats,
+                )
+                fts_ms, fts_hits = measure(
+                    lambda terms=terms: repository.full_text_search(
+                        user_id, terms, LIMIT
+                    ),
+                    args.repeats,
+                )
+                print(
+                    f"{name:<20} {like_ms:>9.2f} {fts_ms:>9.2f} "
+                    f"{like_ms / fts_ms:>7.1f}x {like_hits}/{fts_hits}"
+                )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,39 @@
-from collections.abc import Generator
+import atexit
+import os
+import shutil
+import tempfile
+from collections.abc import AsyncGenerator, Generator
 from datetime import date
 from typing import Any
 
 import pytest
+import pytest_asyncio
 from dotenv import load_dotenv
 from passlib.context import CryptContext
-from sqlalchemy import StaticPool, create_engine
+from sqlalchemy import NullPool, StaticPool, create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 from starlette.testclient import TestClient
 
+from app.common import llm_cache
+from app.core.config import settings
 from app.database.base import Base
-from app.database.session import get_db_session
+from app.database.session import get_async_db_session, get_db_session
+from app.features.auth.blocklist import blocked_token_index
 from app.features.journal.models import Journal, JournalEmotion, JournalKeyword
+from app.features.user.cache import user_cache
 from app.features.user.models import User  # noqa: F401 # 사용하는 모든 모델 임포트
 from app.main import app
 
 load_dotenv(".env.local")
 
-# --- 1. 테스트 전용 In memory DB 엔진 설정 ---
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# --- 1. 테스트 전용 SQLite DB 엔진 설정 ---
+# async 라우트(AsyncSession)도 같은 DB를 보도록 In memory 대신 임시 파일을 사용합니다.
+TEST_DB_DIR = tempfile.mkdtemp(prefix="mindlog-test-")
+atexit.register(shutil.rmtree, TEST_DB_DIR, ignore_errors=True)
+TEST_DB_PATH = os.path.join(TEST_DB_DIR, "test.db")
+
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{TEST_DB_PATH}"
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
@@ -26,6 +41,14 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# TestClient는 요청마다 다른 이벤트 루프에서 돌 수 있으므로 연결을 재사용하지 않습니다.
+async_engine = create_async_engine(
+    f"sqlite+aiosqlite:///{TEST_DB_PATH}", poolclass=NullPool
+)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 # --- 2. DB 세션 Fixture: Setup과 Teardown을 책임집니다 ---
 @pytest.fixture(scope="function")
@@ -43,6 +66,76 @@ def db_session() -> Generator[Session, Any, None]:
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest_asyncio.fixture(scope="function")
+async def async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    async repository 테스트용 aiosqlite In memory DB 세션.
+    이벤트 루프가 테스트마다 바뀌므로 엔진도 테스트마다 생성/정리합니다.
+    """
+    async_engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:", poolclass=StaticPool
+    )
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session = async_sessionmaker(bind=async_engine, expire_on_commit=False)()
+    try:
+        yield session
+    finally:
+        await session.close()
+        await async_engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def query_counter() -> Generator[list[str], Any, None]:
+    """
+    테스트 엔진에서 실행된 SQL 문을 순서대로 기록합니다. (N+1 회귀 테스트용)
+    """
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache() -> Generator[None, Any, None]:
+    """
+    테스트마다 DB를 새로 만들므로 인증 사용자 캐시도 비웁니다.
+    """
+    user_cache.clear()
+    yield
+    user_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def disable_blocked_token_maintenance(monkeypatch) -> Generator[None, Any, None]:
+    """
+    lifespan의 인덱스 warm/sweep은 테스트 DB가 아닌 SessionLocal을 사용하므로 끕니다.
+    인덱스가 ready가 아니면 is_token_blocked는 항상 DB를 조회합니다.
+    """
+    monkeypatch.setattr(settings, "BLOCKED_TOKEN_INDEX_ENABLED", False)
+    blocked_token_index.reset()
+    yield
+    blocked_token_index.reset()
+
+
+@pytest.fixture(autouse=True)
+def disable_llm_cache_database_tier(monkeypatch) -> Generator[None, Any, None]:
+    """
+    LLM 캐시 DB tier는 앱 엔진(settings.DATABASE_URL)으로 만들어지므로
+    테스트에서는 끄고 메모리 tier만 사용합니다. (DB tier 테스트는 테스트 엔진으로 직접 생성)
+    """
+    monkeypatch.setattr(settings, "LLM_CACHE_DB_ENABLED", False)
+    monkeypatch.setattr(llm_cache, "_database_tier", None)
+    monkeypatch.setattr(llm_cache, "_database_tier_ready", False)
+    yield
+
+
 # --- 3. TestClient Fixture: 앱의 의존성을 오버라이드합니다 ---
 @pytest.fixture(scope="function")
 def client(db_session: Session):
@@ -51,13 +144,30 @@ def client(db_session: Session):
     """
 
     def override_get_db_session():
-        yield db_session
+        # 실제 의존성처럼 요청이 끝나면 commit (async 세션에서 보이도록)
+        try:
+            yield db_session
+            db_session.commit()
+        except Exception:
+            db_session.rollback()
+            raise
+
+    async def override_get_async_db_session():
+        async with TestingAsyncSessionLocal() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
 
     app.dependency_overrides[get_db_session] = override_get_db_session
+    app.dependency_overrides[get_async_db_session] = override_get_async_db_session
     with TestClient(app) as c:
         yield c
     # 오버라이드 원상복구
     del app.dependency_overrides[get_db_session]
+    del app.dependency_overrides[get_async_db_session]
 
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
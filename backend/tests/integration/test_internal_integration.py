@@ -0,0 +1,37 @@
+from app.core.config import settings
+
+
+def test_internal_metrics_disabled_without_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "INTERNAL_METRICS_TOKEN", None)
+    response = client.get("/api/v1/internal/metrics")
+    assert response.status_code == 404
+
+
+def test_internal_metrics_rejects_wrong_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "INTERNAL_METRICS_TOKEN", "secret")
+    response = client.get(
+        "/api/v1/internal/metrics", headers={"X-Internal-Token": "wrong"}
+    )
+    assert response.status_code == 401
+
+
+def test_internal_metrics_rejects_missing_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "INTERNAL_METRICS_TOKEN", "secret")
+    response = client.get("/api/v1/internal/metrics")
+    assert response.status_code == 401
+
+
+def test_internal_metrics_reports_pool(client, monkeypatch):
+    monkeypatch.setattr(settings, "INTERNAL_METRICS_TOKEN", "secret")
+    response = client.get(
+        "/api/v1/internal/metrics", headers={"X-Internal-Token": "secret"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert "pid" in data
+    assert {"sync", "async", "config"} <= data["db_pool"].keys()
+    assert data["db_pool"]["config"]["pool_size"] == settings.DB_POOL_SIZE
+    assert {"hits", "misses", "hit_rate"} <= data["user_cache"].keys()
+    assert isinstance(data["llm_cache"], dict)
+    assert isinstance(data["llm_clients"], dict)
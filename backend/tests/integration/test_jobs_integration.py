@@ -0,0 +1,71 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.features.jobs.models import Job, JobKind, JobStatus
+from app.features.selfaware.models import Question
+from app.features.user.models import User
+
+
+def test_submit_answer_enqueues_value_score_job(
+    client: TestClient,
+    auth_headers: dict[str, str],
+    db_session: Session,
+    test_user: User,
+):
+    # Given: 질문 생성(LLM) 대신 DB에 직접 추가
+    question = Question(user_id=test_user.id, text="오늘 가장 좋았던 순간은?")
+    db_session.add(question)
+    db_session.commit()
+
+    # When
+    response = client.post(
+        "/api/v1/self-aware/answer",
+        headers=auth_headers,
+        json={"question_id": question.id, "text": "친구와 산책했다."},
+    )
+
+    # Then: 응답 즉시 반환, job은 worker가 처리할 때까지 queued
+    assert response.status_code == 201
+    job = db_session.query(Job).filter(Job.user_id == test_user.id).one()
+    assert job.kind == JobKind.VALUE_SCORE_EXTRACTION
+    assert job.status == JobStatus.QUEUED
+    assert job.payload == {
+        "question_id": question.id,
+        "answer_id": response.json()["id"],
+    }
+
+    # 상태 조회
+    status_response = client.get(f"/api/v1/jobs/{job.id}", headers=auth_headers)
+    assert status_response.status_code == 200
+    assert status_response.json()["status"] == "queued"
+
+    list_response = client.get(
+        "/api/v1/jobs?kind=selfaware.value_score", headers=auth_headers
+    )
+    assert [item["id"] for item in list_response.json()["data"]] == [job.id]
+
+
+def test_get_job_of_other_user_is_forbidden(
+    client: TestClient,
+    auth_headers: dict[str, str],
+    db_session: Session,
+    test_user: User,
+):
+    other = User(
+        login_id="other_user",
+        hashed_password="pwd",
+        username="Other",
+        gender="Male",
+        birthdate=test_user.birthdate,
+    )
+    db_session.add(other)
+    db_session.flush()
+    job = Job(kind=JobKind.ANALYSIS_UPDATE, user_id=other.id, max_attempts=3)
+    db_session.add(job)
+    db_session.commit()
+
+    response = client.get(f"/api/v1/jobs/{job.id}", headers=auth_headers)
+    missing = client.get("/api/v1/jobs/9999", headers=auth_headers)
+
+    assert response.status_code == 403
+    assert missing.status_code == 404
@@ -1,16 +1,26 @@
 import os
 from datetime import date
-from unittest.mock import AsyncMock  # AsyncMock 사용
+from unittest.mock import AsyncMock, MagicMock  # AsyncMock 사용
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.features.journal.models import Journal, JournalEmotion, JournalKeyword
+from app.features.journal.models import (
+    Journal,
+    JournalEmotion,
+    JournalImage,
+    JournalKeyword,
+)
+from app.features.journal.presign import presigned_get_urls
+from app.features.journal.repository import JournalRepository
 from app.features.journal.schemas.responses import (
     JournalImageResponse,
+    KeywordEmotionAssociationItem,
     PresignedUrlResponse,
 )
+from app.features.journal.storage import s3_clients
 from app.features.user.models import User
 
 # --- 1. 일지 생성 (POST /) ---
@@ -243,17 +253,82 @@ def test_search_journals_bad_request(
     assert response.status_code == 400
 
 
+def test_search_journals_full_text_success(
+    client: TestClient,
+    auth_headers: dict[str, str],
+    db_session: Session,
+    test_user: User,
+):
+    """
+    일지 전문 검색 (GET /api/v1/journal/search-text) 성공 테스트 (관련도 순 + 커서)
+    """
+    j1 = Journal(title="산책", content="공원 산책을 했다", user_id=test_user.id)
+    j2 = Journal(
+        title="일기",
+        content="비",
+        gratitude="산책을 함께 해준 친구",
+        user_id=test_user.id,
+    )
+    j3 = Journal(title="산책을 했다", content="산책을 또 산책을", user_id=test_user.id)
+    j4 = Journal(title="회의", content="회의가 길었다", user_id=test_user.id)
+    db_session.add_all([j1, j2, j3, j4])
+    db_session.commit()
+
+    # 1. API 요청
+    response = client.get(
+        "/api/v1/journal/search-text?q=산책을&limit=2", headers=auth_headers
+    )
+
+    # 2. 상태 코드 검증
+    assert response.status_code == 200
+
+    # 3. 응답 데이터 검증 (검색어가 가장 많은 j3가 먼저)
+    first_page = response.json()
+    assert [item["id"] for item in first_page["items"]][0] == j3.id
+    assert first_page["items"][0]["score"] >= first_page["items"][1]["score"]
+    assert first_page["next_cursor"] is not None
+
+    # 4. 다음 페이지
+    response = client.get(
+        "/api/v1/journal/search-text",
+        params={"q": "산책을", "limit": 2, "cursor": first_page["next_cursor"]},
+        headers=auth_headers,
+    )
+    second_page = response.json()
+    ids = [item["id"] for item in first_page["items"] + second_page["items"]]
+    assert sorted(ids) == sorted([j1.id, j2.id, j3.id])
+    assert second_page["next_cursor"] is None
+
+
+@pytest.mark.parametrize("params", [{"q": "a"}, {"q": "산책을", "cursor": "x"}])
+def test_search_journals_full_text_bad_request(
+    client: TestClient, auth_headers: dict[str, str], params: dict
+):
+    """
+    일지 전문 검색 (GET /api/v1/journal/search-text) 실패 테스트 (짧은 검색어/잘못된 커서 400)
+    """
+    response = client.get(
+        "/api/v1/journal/search-text", params=params, headers=auth_headers
+    )
+
+    assert response.status_code == 400
+
+
 # --- 4. 키워드 기반 일지 검색 (GET /search-keyword) ---
 
 
 def test_search_journals_by_keyword_success(
     client: TestClient,
     auth_headers: dict[str, str],
+    db_session: Session,
     test_journal: Journal,
 ):
     """
     키워드 기반 일지 검색 (GET /api/v1/journal/search-keyword) 성공 테스트
     """
+    # fixture는 journal_keywords만 직접 넣으므로 키워드 역색인을 채움
+    JournalRepository(db_session).rebuild_keyword_index()
+
     # 1. API 요청
     response = client.get(
         "/api/v1/journal/search-keyword?keyword=keyword1", headers=auth_headers
@@ -268,6 +343,91 @@ def test_search_journals_by_keyword_success(
     assert response_data["items"][0]["id"] == test_journal.id
 
 
+def _add_journal_with_keywords(
+    db_session: Session, user_id: int, title: str, keywords: list[str]
+) -> Journal:
+    repo = JournalRepository(db_session)
+    journal = repo.add_journal(user_id, title, "content", {"happy": 3})
+    repo.add_keywords_emotion_associations(
+        journal.id,
+        [
+            KeywordEmotionAssociationItem(
+                keyword=keyword, emotion="happy", summary="s", weight=0.5
+            )
+            for keyword in keywords
+        ],
+    )
+    db_session.commit()
+    return journal
+
+
+def test_search_journals_by_multiple_keywords(
+    client: TestClient,
+    auth_headers: dict[str, str],
+    db_session: Session,
+    test_user: User,
+):
+    """
+    키워드 기반 일지 검색 (GET /api/v1/journal/search-keyword) 여러 키워드 AND/OR/접두어
+    """
+    walk = _add_journal_with_keywords(db_session, test_user.id, "j1", ["산책", "친구"])
+    coffee = _add_journal_with_keywords(
+        db_session, test_user.id, "j2", ["커피", "친구"]
+    )
+    walk_alone = _add_journal_with_keywords(db_session, test_user.id, "j3", ["산책로"])
+
+    def search(query: str) -> list[int]:
+        response = client.get(
+            f"/api/v1/journal/search-keyword?{query}", headers=auth_headers
+        )
+        assert response.status_code == 200
+        return [item["id"] for item in response.json()["items"]]
+
+    assert search("keyword=산책&keyword=친구") == [walk.id]
+    assert search("keyword=산책&keyword=커피&match=any") == [coffee.id, walk.id]
+    assert search("keyword=산책&prefix=true") == [walk_alone.id, walk.id]
+    assert search("keyword=산책&keyword=친구&match=any&limit=2") == [
+        coffee.id,
+        walk.id,
+    ]
+
+
+def test_search_journals_by_keyword_blank(
+    client: TestClient,
+    auth_headers: dict[str, str],
+):
+    """
+    키워드 기반 일지 검색 (GET /api/v1/journal/search-keyword) 빈 키워드 400
+    """
+    response = client.get(
+        "/api/v1/journal/search-keyword?keyword=%20&keyword=", headers=auth_headers
+    )
+
+    assert response.status_code == 400
+
+
+def test_get_top_keywords(
+    client: TestClient,
+    auth_headers: dict[str, str],
+    db_session: Session,
+    test_user: User,
+):
+    """
+    사용자 키워드 빈도 (GET /api/v1/journal/keywords/top) 테스트
+    """
+    _add_journal_with_keywords(db_session, test_user.id, "j1", ["산책", "친구"])
+    _add_journal_with_keywords(db_session, test_user.id, "j2", ["커피", "친구"])
+    _add_journal_with_keywords(db_session, test_user.id, "j3", ["친구"])
+
+    response = client.get("/api/v1/journal/keywords/top?limit=2", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json()["data"] == [
+        {"keyword": "친구", "journal_count": 3},
+        {"keyword": "산책", "journal_count": 1},
+    ]
+
+
 # --- 5. 일지 단일 조회 (GET /{journal_id}) ---
 
 
@@ -469,9 +629,9 @@ async def test_generate_image_upload_url_success(
         s3_key="images/journals/...",
     )
 
-    # JournalService의 async 메서드 모킹
+    # AsyncJournalService의 async 메서드 모킹
     mocker.patch(
-        "app.features.journal.service.JournalService.create_image_presigned_url",
+        "app.features.journal.service.AsyncJournalService.create_image_presigned_url",
         new_callable=AsyncMock,
         return_value=mock_presigned_response,
     )
@@ -518,7 +678,7 @@ async def test_complete_image_upload_success(
     )
 
     mocker.patch(
-        "app.features.journal.service.JournalService.complete_image_upload",
+        "app.features.journal.service.AsyncJournalService.complete_image_upload",
         new_callable=AsyncMock,
         return_value=mock_journal_image,
     )
@@ -541,6 +701,156 @@ async def test_complete_image_upload_success(
     assert response_data["journal_id"] == test_journal.id
 
 
+def test_complete_image_upload_saves_image_in_test_db(
+    client: TestClient,
+    auth_headers: dict[str, str],
+    db_session: Session,
+    test_journal: Journal,
+    mocker,
+):
+    """
+    async 라우트(AsyncJournalRepository)도 테스트 DB에 저장하는지 테스트
+    (S3 확인만 mock, 서비스/리포지토리는 실제 코드)
+    """
+    mocker.patch(
+        "app.features.journal.repository.S3Repository.check_file_exists",
+        new_callable=AsyncMock,
+        return_value=True,
+    )
+    s3_key = f"images/journals/{test_journal.id}/saved.jpg"
+
+    response = client.post(
+        f"/api/v1/journal/{test_journal.id}/image/complete",
+        headers=auth_headers,
+        json={"s3_key": s3_key},
+    )
+
+    assert response.status_code == 201
+    saved = db_session.scalars(
+        select(JournalImage).where(JournalImage.journal_id == test_journal.id)
+    ).all()
+    assert [image.s3_key for image in saved] == [s3_key]
+    assert response.json()["id"] == saved[0].id
+
+
+# --- 10-1. 여러 이미지 업로드 URL 생성 (POST /image/batch) ---
+
+
+def test_generate_image_upload_urls_batch(
+    client: TestClient,
+    auth_headers: dict[str, str],
+    db_session: Session,
+    test_user: User,
+    test_journal: Journal,
+    mocker,
+):
+    """
+    여러 일지의 presigned URL을 S3 호출 없이 한 번에 발급하는지 테스트
+    """
+    mocker.patch.object(s3_clients, "get", return_value=MagicMock())
+    other = Journal(title="두 번째", content="내용", user_id=test_user.id)
+    db_session.add(other)
+    # 이미지 라우트는 AsyncSession으로 조회하므로 커밋해야 보임
+    db_session.commit()
+    request_data = {
+        "uploads": [
+            {
+                "journal_id": test_journal.id,
+                "filename": "a.jpg",
+                "content_type": "image/jpeg",
+            },
+            {"journal_id": other.id, "filename": "b.png", "content_type": "image/png"},
+        ]
+    }
+
+    response = client.post(
+        "/api/v1/journal/image/batch", headers=auth_headers, json=request_data
+    )
+
+    assert response.status_code == 201
+    items = response.json()["items"]
+    assert [item["journal_id"] for item in items] == [test_journal.id, other.id]
+    assert items[1]["s3_key"].startswith(f"images/journals/{other.id}/")
+    assert all("X-Amz-Signature=" in item["presigned_url"] for item in items)
+
+
+def test_generate_image_upload_urls_batch_rejects_foreign_journal(
+    client: TestClient,
+    auth_headers: dict[str, str],
+    db_session: Session,
+    test_journal: Journal,
+):
+    """
+    다른 사용자의 일지가 하나라도 포함되면 PermissionDeniedError (401)
+    """
+    stranger = User(
+        login_id="stranger",
+        hashed_password="x",
+        username="Stranger",
+        gender="Male",
+        birthdate=date(2000, 1, 1),
+    )
+    db_session.add(stranger)
+    db_session.flush()
+    foreign = Journal(title="남의 일기", content="내용", user_id=stranger.id)
+    db_session.add(foreign)
+    db_session.commit()
+    uploads = [
+        {"journal_id": journal_id, "filename": "a.jpg", "content_type": "image/jpeg"}
+        for journal_id in (test_journal.id, foreign.id)
+    ]
+
+    response = client.post(
+        "/api/v1/journal/image/batch", headers=auth_headers, json={"uploads": uploads}
+    )
+
+    assert response.status_code == 401
+
+
+# --- 10-2. 이미지 조회 URL (GET /{journal_id}/image/url) ---
+
+
+def test_get_image_url_cached(
+    client: TestClient,
+    auth_headers: dict[str, str],
+    db_session: Session,
+    test_journal: Journal,
+    mocker,
+):
+    """
+    이미지 조회용 presigned GET URL을 발급하고, 같은 이미지는 캐시된 URL을 반환
+    """
+    mocker.patch.object(s3_clients, "get", return_value=MagicMock())
+    presigned_get_urls.clear()
+    s3_key = f"images/journals/{test_journal.id}/a.jpg"
+    db_session.add(JournalImage(journal_id=test_journal.id, s3_key=s3_key))
+    # 이미지 라우트는 AsyncSession으로 조회하므로 커밋해야 보임
+    db_session.commit()
+
+    first = client.get(
+        f"/api/v1/journal/{test_journal.id}/image/url", headers=auth_headers
+    )
+    second = client.get(
+        f"/api/v1/journal/{test_journal.id}/image/url", headers=auth_headers
+    )
+
+    assert first.status_code == 200
+    assert first.json()["s3_key"] == s3_key
+    assert "X-Amz-SignedHeaders=host" in first.json()["url"]
+    assert second.json() == first.json()
+    presigned_get_urls.clear()
+
+
+def test_get_image_url_without_image(
+    client: TestClient, auth_headers: dict[str, str], test_journal: Journal
+):
+    response = client.get(
+        f"/api/v1/journal/{test_journal.id}/image/url", headers=auth_headers
+    )
+
+    assert response.status_code == 404
+
+
 # --- 11. AI 이미지 생성 (POST /image/generate) ---
 
 
@@ -1,6 +1,9 @@
 from datetime import date, datetime
 
 from app.features.journal.models import Journal, JournalEmotion
+from app.features.journal.repository import JournalRepository
+from app.features.journal.schemas.responses import KeywordEmotionAssociationItem
+from app.features.statistics.repository import StatisticsRepository
 
 
 def test_get_emotion_rates(client, db_session, test_user, auth_headers):
@@ -21,6 +24,7 @@ def test_get_emotion_rates(client, db_session, test_user, auth_headers):
     emotion = JournalEmotion(journal_id=journal.id, emotion="happy", intensity=4)
     db_session.add(emotion)
     db_session.commit()
+    StatisticsRepository(db_session).rebuild_emotion_rollups()
 
     # Act: API 호출 (query param: start_date, end_date)
     params = {"start_date": today.isoformat(), "end_date": today.isoformat()}
@@ -45,3 +49,73 @@ def test_get_emotion_rates_unauthorized(client):
     params = {"start_date": "2025-01-01", "end_date": "2025-01-31"}
     response = client.get("/api/v1/statistics/emotion-rate", params=params)
     assert response.status_code == 403
+
+
+def test_emotion_rates_follow_journal_api(client, auth_headers):
+    """API로 만든/삭제한 journal이 backfill 없이 바로 통계에 반영되는지"""
+    journal_data = {"title": "t", "content": "c", "emotions": {"calm": 3, "sad": 1}}
+    created = client.post("/api/v1/journal", headers=auth_headers, json=journal_data)
+    day = created.json()["created_at"][:10]
+    params = {"start_date": day, "end_date": day}
+
+    after_create = client.get(
+        "/api/v1/statistics/emotion-rate", headers=auth_headers, params=params
+    ).json()
+    client.delete(f"/api/v1/journal/{created.json()['id']}", headers=auth_headers)
+    after_delete = client.get(
+        "/api/v1/statistics/emotion-rate", headers=auth_headers, params=params
+    ).json()
+
+    assert after_create["total_count"] == 4
+    assert {s["emotion"]: s["percentage"] for s in after_create["statistics"]} == {
+        "calm": 75.0,
+        "sad": 25.0,
+    }
+    assert after_delete == {"total_count": 0, "statistics": []}
+
+
+def test_get_keyword_stats_follow_keyword_analysis(
+    client, db_session, test_user, auth_headers
+):
+    """키워드 저장(분석) 결과가 backfill 없이 바로 키워드 통계에 반영되는지"""
+    # Arrange
+    journal_repo = JournalRepository(db_session)
+    for keywords in (
+        [("산책", "happy", 0.9), ("친구", "happy", 0.6)],
+        [("산책", "calm", 0.3)],
+    ):
+        journal = journal_repo.add_journal(test_user.id, "t", "c", {"happy": 2})
+        journal_repo.add_keywords_emotion_associations(
+            journal.id,
+            [
+                KeywordEmotionAssociationItem(
+                    keyword=keyword, emotion=emotion, summary="s", weight=weight
+                )
+                for keyword, emotion, weight in keywords
+            ],
+        )
+    db_session.commit()
+    day = journal.created_at.date().isoformat()
+
+    # Act
+    response = client.get(
+        "/api/v1/statistics/keywords",
+        headers=auth_headers,
+        params={"start_date": day, "end_date": day, "limit": 1},
+    )
+
+    # Assert
+    assert response.status_code == 200
+    keywords = response.json()["keywords"]
+    assert len(keywords) == 1
+    assert keywords[0]["keyword"] == "산책"
+    assert keywords[0]["count"] == 2
+    assert [
+        (e["emotion"], e["count"], e["percentage"]) for e in keywords[0]["emotions"]
+    ] == [("happy", 1, 75.0), ("calm", 1, 25.0)]
+
+
+def test_get_keyword_stats_unauthorized(client):
+    params = {"start_date": "2025-01-01", "end_date": "2025-01-31"}
+    response = client.get("/api/v1/statistics/keywords", params=params)
+    assert response.status_code == 403
@@ -424,6 +424,22 @@ def test_update_me_success(client: TestClient, db_session: Session, test_user: U
     assert test_user.birthdate == new_birthdate
 
 
+def test_me_reflects_update_through_user_cache(
+    client: TestClient, db_session: Session, test_user: User
+):
+    """Cached authenticated user is invalidated by PATCH /user/me."""
+    login_data = {"login_id": "test_user", "password": "ValidPass123!"}
+    token = client.post("/api/v1/auth/login", json=login_data).json()["access"]
+    headers = {"Authorization": f"Bearer {token}"}
+    client.get("/api/v1/user/me", headers=headers)  # 캐시 채우기
+
+    client.patch("/api/v1/user/me", json={"username": "Renamed"}, headers=headers)
+    response = client.get("/api/v1/user/me", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["username"] == "Renamed"
+
+
 def test_update_me_invalid_data(
     client: TestClient, db_session: Session, test_user: User
 ):
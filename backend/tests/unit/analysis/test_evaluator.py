@@ -1,6 +1,12 @@
+import json
+from pathlib import Path
+
 import pytest
 
-from app.features.analysis.comprehensive_analysis.evaluator import evaluate
+from app.features.analysis.comprehensive_analysis.evaluator import (
+    evaluate,
+    score_batch,
+)
 
 
 # -------------------------------
@@ -62,3 +68,60 @@ def test_evaluate_flag_true(sample_responses):
     # flag=True일 때는 tuple 반환
     assert isinstance(result, tuple)
     assert len(result) == 10  # (SEP, SEFP, SAP, SAFP, SCP, SCFP, SOP, SOFP, SNP, SNFP)
+
+
+# -------------------------------
+# 4️⃣ 벡터화 채점 (score_batch) 골든 테스트
+# -------------------------------
+# 기존 스칼라 evaluate 구현으로 생성한 결과 (경계 나이, 1/99 구간 포함)
+GOLDEN_PATH = Path(__file__).parent / "data" / "neo_pi_golden.json"
+
+
+@pytest.fixture(scope="module")
+def golden_cases():
+    return json.loads(GOLDEN_PATH.read_text())
+
+
+def test_score_batch_matches_golden_set(golden_cases):
+    scores = score_batch(
+        [case["answers"] for case in golden_cases],
+        [case["sex"] for case in golden_cases],
+        [case["age"] for case in golden_cases],
+    )
+
+    assert len(scores) == len(golden_cases)
+    for index, case in enumerate(golden_cases):
+        assert scores.to_dict(index) == case["expected"]
+
+
+def test_evaluate_matches_golden_set(golden_cases):
+    for case in golden_cases:
+        result = evaluate(case["answers"], case["sex"], case["age"])
+        assert result == case["expected"]
+        # DB(JSON)에 그대로 저장할 수 있도록 numpy 타입이 아닌 int
+        assert all(type(value) is int for value in result.values())
+
+
+def test_evaluate_flag_true_layout(golden_cases):
+    case = golden_cases[0]
+    expected = case["expected"]
+
+    SEP, SEFP, *_, SNP, SNFP = evaluate(  # noqa: N806
+        case["answers"], case["sex"], case["age"], flag=True
+    )
+
+    assert SEP == expected["EXTRAVERSION"]
+    assert SNP == expected["NEUROTICISM"]
+    assert len(SEFP) == 31
+    assert SEFP[1] == expected["Friendliness"]
+    assert SNFP[6] == expected["Vulnerability"]
+    assert SNFP[0] == 0 and SNFP[7:] == [0] * 24
+
+
+def test_score_batch_rejects_invalid_rows(sample_responses):
+    with pytest.raises(ValueError):
+        score_batch([sample_responses[:120]], ["Male"], [25])
+    with pytest.raises(Exception, match="sex"):
+        score_batch([sample_responses] * 2, ["Male", "Other"], [25, 25])
+    with pytest.raises(Exception, match="age"):
+        score_batch([sample_responses] * 2, ["Male", "Female"], [25, 9])
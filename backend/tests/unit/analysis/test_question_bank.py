@@ -0,0 +1,103 @@
+import shutil
+
+import pytest
+
+from app.features.analysis.comprehensive_analysis import question_bank
+from app.features.analysis.comprehensive_analysis.question_bank import (
+    LANGUAGES,
+    build_artifacts,
+    load_question_bank,
+    parse_questions,
+    question_prompts,
+)
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    # 패키지 data 디렉터리를 복사해서 artifact를 만들어도 원본이 바뀌지 않게 합니다.
+    copied = tmp_path / "data"
+    for language in LANGUAGES:
+        (copied / language).mkdir(parents=True)
+        shutil.copy(question_bank.source_path(language), copied / language)
+    monkeypatch.setattr(question_bank, "DATA_DIR", copied)
+    load_question_bank.cache_clear()
+    question_prompts.cache_clear()
+    yield copied
+    load_question_bank.cache_clear()
+    question_prompts.cache_clear()
+
+
+@pytest.mark.parametrize("language", LANGUAGES)
+def test_load_question_bank_parses_every_question(language):
+    questions = load_question_bank(language)
+
+    assert len(questions) == 120
+    for domain in "NEOAC":
+        assert sum(q.domain == domain for q in questions) == 24
+    assert {q.keyed for q in questions} == {"plus", "minus"}
+
+
+def test_ko_and_en_banks_share_question_ids():
+    ko = load_question_bank("ko")
+    en = load_question_bank("en")
+
+    assert [q.id for q in ko] == [q.id for q in en]
+
+
+def test_parse_questions_keeps_apostrophes_in_double_quoted_text():
+    source = """
+    { id: 'a', text: "Feel others' emotions", keyed: 'plus', domain: 'O', facet: 3 },
+    """
+
+    (question,) = parse_questions(source)
+
+    assert question.text == "Feel others' emotions"
+    assert question.prompt_line() == "Feel others' emotions (keyed: plus)"
+
+
+def test_parse_questions_rejects_unparsed_entries():
+    source = "{ id: 'a', text: 'ok', keyed: 'plus' }"
+
+    with pytest.raises(ValueError):
+        parse_questions(source)
+
+
+def test_question_prompts_are_cached():
+    assert question_prompts("ko") is question_prompts("ko")
+    assert question_prompts("ko")[0] == "나는 걱정이 많은 편이다. (keyed: plus)"
+
+
+def test_unknown_language_raises():
+    with pytest.raises(ValueError):
+        load_question_bank("jp")
+
+
+def test_prebuilt_artifact_is_used_instead_of_parsing(data_dir, mocker):
+    # Given
+    build_artifacts(("ko",))
+    parse = mocker.spy(question_bank, "parse_questions")
+
+    # When
+    questions = load_question_bank("ko")
+
+    # Then
+    assert len(questions) == 120
+    parse.assert_not_called()
+
+
+def test_stale_artifact_falls_back_to_source(data_dir, mocker):
+    # Given: artifact를 만든 뒤 questions.ts가 바뀜
+    build_artifacts(("ko",))
+    source = data_dir / "ko" / "questions.ts"
+    source.write_text(
+        source.read_text(encoding="utf-8").replace("걱정이 많은", "근심이 많은"),
+        encoding="utf-8",
+    )
+    parse = mocker.spy(question_bank, "parse_questions")
+
+    # When
+    questions = load_question_bank("ko")
+
+    # Then
+    parse.assert_called_once()
+    assert questions[0].text == "나는 근심이 많은 편이다."
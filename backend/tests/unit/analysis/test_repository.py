@@ -1,9 +1,10 @@
-from datetime import datetime
+from datetime import date, datetime
 
 import pytest
 
 from app.features.analysis.models import Analysis
 from app.features.analysis.repository import AnalysisRepository
+from app.features.user.models import User
 
 
 @pytest.fixture
@@ -76,3 +77,58 @@ def test_update_analysis_multiple_fields(repo, db_session):
 def test_update_analysis_not_found(repo):
     with pytest.raises(Exception):  # noqa: B017
         repo.update_analysis(user_id=999, user_type="도전형")
+
+
+def make_user(db_session, login_id, gender="Female"):
+    user = User(
+        login_id=login_id,
+        hashed_password="pwd",
+        username=login_id,
+        gender=gender,
+        birthdate=date(2000, 1, 1),
+    )
+    db_session.add(user)
+    db_session.flush()
+    return user
+
+
+def test_list_neo_pi_answers_pages_by_id(repo, db_session):
+    # Given: 응답 벡터가 저장된 analysis 2개, 저장되지 않은 analysis 1개
+    for index, answers in enumerate([[0] + [3] * 120, None, [0] + [5] * 120]):
+        user = make_user(db_session, f"user{index}")
+        repo.create_analysis(user_id=user.id).neo_pi_answers = answers
+    db_session.commit()
+
+    # When
+    first_page = repo.list_neo_pi_answers(after_id=0, limit=1)
+    second_page = repo.list_neo_pi_answers(after_id=first_page[-1].id, limit=1)
+    last_page = repo.list_neo_pi_answers(after_id=second_page[-1].id, limit=1)
+
+    # Then
+    assert repo.count_neo_pi_answers() == 2
+    assert first_page[0].neo_pi_answers[1] == 3
+    assert first_page[0].gender == "Female"
+    assert first_page[0].birthdate == date(2000, 1, 1)
+    assert second_page[0].neo_pi_answers[1] == 5
+    assert last_page == []
+
+
+def test_bulk_update_scores(repo, db_session):
+    first = repo.create_analysis(user_id=1)
+    second = repo.create_analysis(user_id=2)
+    db_session.commit()
+
+    repo.bulk_update_scores(
+        [
+            {"id": first.id, "neo_pi_score": {"OPENNESS": 1}, "user_type": "Balanced"},
+            {
+                "id": second.id,
+                "neo_pi_score": {"OPENNESS": 99},
+                "user_type": "Explorer",
+            },
+        ]
+    )
+    db_session.expire_all()
+
+    assert repo.get_analysis_by_user_id(1).neo_pi_score == {"OPENNESS": 1}
+    assert repo.get_analysis_by_user_id(2).user_type == "Explorer"
@@ -0,0 +1,43 @@
+from benchmarks.scoring import find_regressions, run, synthetic_answers
+
+
+def make_results(normalized):
+    return {
+        "score_batch": {"ops_per_sec": 1.0, "per_core": 1.0, "normalized": normalized}
+    }
+
+
+def test_find_regressions_flags_slowdown_beyond_threshold():
+    # Given
+    baseline = {"results": make_results(100.0)}
+
+    # When / Then: 20% 감소는 허용, 30% 감소는 회귀
+    assert find_regressions(make_results(80.0), baseline, threshold=0.25) == []
+    regressions = find_regressions(make_results(70.0), baseline, threshold=0.25)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("score_batch: -30.0%")
+
+
+def test_find_regressions_ignores_benchmarks_not_run():
+    baseline = {"results": make_results(100.0)}
+
+    assert find_regressions({}, baseline, threshold=0.25) == []
+
+
+def test_synthetic_answers_match_evaluate_input_shape():
+    answers = synthetic_answers(3)
+
+    assert len(answers) == 3
+    assert all(len(row) == 121 and row[0] == 0 for row in answers)
+    assert all(1 <= value <= 5 for row in answers for value in row[1:])
+
+
+def test_run_reports_per_core_and_normalized_throughput():
+    # When: 아주 짧게 한 번만 측정
+    results = run(["evaluate", "score_batch"], batch_size=10, min_time=0.001, repeats=1)
+
+    # Then
+    for result in results.values():
+        assert result["ops_per_sec"] > 0
+        assert result["per_core"] == result["ops_per_sec"]
+        assert result["normalized"] > 0
@@ -1,7 +1,18 @@
 # backend/tests/unit/analysis/test_service.py
+import threading
+from datetime import date
+from types import SimpleNamespace
+
 import pytest
 
-from app.features.analysis.service import AnalysisService
+from app.features.analysis.comprehensive_analysis.evaluator import evaluate
+from app.features.analysis.comprehensive_analysis.question_bank import question_prompts
+from app.features.analysis.comprehensive_analysis.score import NeoPiAnswers
+from app.features.analysis.service import (
+    BIG_5_EXPLANATIONS,
+    AnalysisService,
+    classify_user_type,
+)
 
 
 # ------------------------------
@@ -58,6 +69,53 @@ def test_extract_neo_pi_from_answer(service, mocker, mock_answer_repo):
     assert len(responses) > 0
 
 
+def test_extract_neo_pi_runs_chunks_concurrently_and_retries_bad_chunks(
+    service, mocker
+):
+    # Given: 1차 호출에서 청크 1은 개수가 틀리고 청크 4는 예외 → 두 청크만 재요청
+    chain = mocker.Mock()
+    first = [NeoPiAnswers(answers=[i + 1] * 20) for i in range(6)]
+    first[1] = NeoPiAnswers(answers=[2] * 19)
+    first[4] = RuntimeError("timeout")
+    retry = [NeoPiAnswers(answers=[2] * 20), NeoPiAnswers(answers=[5] * 20)]
+    chain.batch.side_effect = [first, retry]
+    mocker.patch.object(service, "_neo_pi_chain", return_value=chain)
+
+    # When
+    responses = service.extract_neo_pi_from_answer(user_id=1)
+
+    # Then: 순서 유지, 121개 (0번 자리 + 120문항)
+    assert responses == [0] + [v for v in range(1, 7) for _ in range(20)]
+    assert chain.batch.call_count == 2
+    first_inputs = chain.batch.call_args_list[0].args[0]
+    retry_inputs = chain.batch.call_args_list[1].args[0]
+    assert len(first_inputs) == 6
+    assert retry_inputs == [first_inputs[1], first_inputs[4]]
+    assert chain.batch.call_args_list[0].kwargs["config"]["max_concurrency"] > 1
+
+
+def test_extract_neo_pi_raises_after_retries_exhausted(service, mocker):
+    # Given: 첫 번째 청크(문항 1~20)만 계속 19개를 반환
+    def fake_batch(inputs, **kwargs):
+        return [
+            NeoPiAnswers(
+                answers=[3] * (19 if item["questions"][0] == first_question else 20)
+            )
+            for item in inputs
+        ]
+
+    first_question = question_prompts("ko")[0]
+    chain = mocker.Mock()
+    chain.batch.side_effect = fake_batch
+    mocker.patch.object(service, "_neo_pi_chain", return_value=chain)
+
+    # When / Then
+    with pytest.raises(ValueError, match=r"failed chunks: \[0\]"):
+        service.extract_neo_pi_from_answer(user_id=1)
+    assert chain.batch.call_count == 3
+    assert all(len(call.args[0]) == 1 for call in chain.batch.call_args_list[1:])
+
+
 def test_evaluate_big_5_score(service, mocker):
     mocker.patch.object(service, "extract_neo_pi_from_answer", return_value=[1] * 121)
     mock_evaluate = mocker.patch(
@@ -68,6 +126,63 @@ def test_evaluate_big_5_score(service, mocker):
     assert result == {"O": 60}
 
 
+def test_update_neo_pi_score_stores_answer_vector(service, mocker, mock_analysis_repo):
+    # Given
+    neo_pi = [0] + [4] * 120
+    mocker.patch.object(service, "extract_neo_pi_from_answer", return_value=neo_pi)
+
+    # When
+    service.update_neo_pi_score(user_id=1, age=30, gender="Female")
+
+    # Then: 재채점을 위해 응답 벡터도 함께 저장
+    mock_analysis_repo.update_analysis.assert_called_once_with(
+        user_id=1,
+        neo_pi_score=evaluate(neo_pi, "Female", 30),
+        neo_pi_answers=neo_pi,
+    )
+
+
+def test_rescore_all_scores_in_chunks(service, mock_analysis_repo, mocker):
+    # Given: 2명 + 1명 두 번의 chunk
+    today = date.today()
+    rows = [
+        SimpleNamespace(
+            id=index + 1,
+            neo_pi_answers=[0] + [fill] * 120,
+            gender=gender,
+            birthdate=date(today.year - 30, 1, 1),
+        )
+        for index, (fill, gender) in enumerate(
+            [(1, "Male"), (5, "Female"), (3, "Male")]
+        )
+    ]
+    mock_analysis_repo.list_neo_pi_answers.side_effect = [rows[:2], rows[2:], []]
+    on_progress = mocker.Mock()
+
+    # When
+    processed = service.rescore_all(chunk_size=2, on_progress=on_progress)
+
+    # Then
+    assert processed == 3
+    assert [
+        call.kwargs["after_id"]
+        for call in mock_analysis_repo.list_neo_pi_answers.call_args_list
+    ] == [0, 2, 3]
+    assert [call.args[0] for call in on_progress.call_args_list] == [2, 3]
+    updates = [
+        row
+        for call in mock_analysis_repo.bulk_update_scores.call_args_list
+        for row in call.args[0]
+    ]
+    for row, update in zip(rows, updates, strict=True):
+        expected = evaluate(row.neo_pi_answers, row.gender, 30)
+        assert update == {
+            "id": row.id,
+            "neo_pi_score": expected,
+            "user_type": classify_user_type(expected),
+        }
+
+
 def test_get_comment_from_big_5_score(service, mocker):
     response = service.get_comment_from_big_5_score(user_id=1, age=23, gender="Male")
     assert isinstance(response[0], str)
@@ -77,6 +192,71 @@ def test_get_comment_from_big_5_score(service, mocker):
     assert isinstance(response[4], str)
 
 
+def test_get_comment_from_big_5_score_returns_partial_results(service, mocker):
+    # Given: 외향성은 예외, 개방성은 timeout 안에 끝나지 않음
+    release = threading.Event()
+
+    def fake_invoke(inputs):
+        explanations = inputs["big_5_explanations"]
+        if explanations == BIG_5_EXPLANATIONS["extraversion"]:
+            raise RuntimeError("rate limited")
+        if explanations == BIG_5_EXPLANATIONS["openness"]:
+            release.wait(5)
+        return "comment"
+
+    chain = mocker.Mock()
+    chain.invoke.side_effect = fake_invoke
+    mocker.patch.object(service, "_big_5_chain", return_value=chain)
+
+    # When
+    try:
+        response = service.get_comment_from_big_5_score(
+            user_id=1, age=23, gender="Male", timeout=0.5
+        )
+    finally:
+        release.set()
+
+    # Then: (A, C, E, N, O)
+    assert response == ("comment", "comment", None, "comment", None)
+    assert chain.invoke.call_count == 5
+
+
+def test_update_comprehensive_analysis_persists_partial_results(
+    service, mocker, mock_analysis_repo
+):
+    # Given
+    mocker.patch.object(
+        service,
+        "get_comment_from_big_5_score",
+        return_value=("a", "c", None, "n", "o"),
+    )
+
+    # When
+    service.update_comprehensive_analysis(user_id=1)
+
+    # Then: 실패한 영역(None)은 update_analysis에서 건너뜀
+    mock_analysis_repo.update_analysis.assert_called_once_with(
+        user_id=1,
+        conscientiousness="c",
+        neuroticism="n",
+        extraversion=None,
+        openness="o",
+        agreeableness="a",
+    )
+
+
+def test_update_comprehensive_analysis_raises_when_all_failed(
+    service, mocker, mock_analysis_repo
+):
+    mocker.patch.object(
+        service, "get_comment_from_big_5_score", return_value=(None,) * 5
+    )
+
+    with pytest.raises(ValueError):
+        service.update_comprehensive_analysis(user_id=1)
+    mock_analysis_repo.update_analysis.assert_not_called()
+
+
 def test_extract_personalized_advice(service, mocker, mock_analysis_repo):
     response = service.extract_personalized_advice(user_id=1, age=23, gender="Male")
     assert response.theory in ["CBT", "ACT", "EQ"]
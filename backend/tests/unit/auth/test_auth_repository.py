@@ -1,7 +1,8 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from sqlalchemy.orm import Session
 
+from app.features.auth.blocklist import blocked_token_index
 from app.features.auth.models import BlockedToken
 from app.features.auth.repository import BlockedTokenRepository
 
@@ -38,3 +39,45 @@ def test_is_token_blocked(db_session: Session):
     # Assert
     assert is_blocked is True
     assert is_not_blocked is False
+
+
+def test_is_token_blocked_skips_db_when_index_misses(
+    db_session: Session, query_counter: list[str]
+):
+    # Arrange: 인덱스가 warm 된 상태
+    repo = BlockedTokenRepository(db_session)
+    repo.add_blocked_token("blocked_id", datetime.now())
+    db_session.commit()
+    blocked_token_index.rebuild(["blocked_id"], datetime.now())
+    query_counter.clear()
+
+    # Act
+    is_not_blocked = repo.is_token_blocked("clean_id")
+    queries_for_miss = len(query_counter)
+    is_blocked = repo.is_token_blocked("blocked_id")
+
+    # Assert
+    assert is_not_blocked is False
+    assert queries_for_miss == 0
+    assert is_blocked is True
+
+
+def test_delete_expired_tokens_in_batches(db_session: Session):
+    # Arrange
+    repo = BlockedTokenRepository(db_session)
+    now = datetime(2025, 6, 1)
+    for i in range(5):
+        repo.add_blocked_token(f"expired_{i}", now - timedelta(days=1))
+    repo.add_blocked_token("alive", now + timedelta(days=1))
+    db_session.commit()
+
+    # Act
+    first = repo.delete_expired_tokens(now, limit=3)
+    second = repo.delete_expired_tokens(now, limit=3)
+    third = repo.delete_expired_tokens(now, limit=3)
+    db_session.commit()
+
+    # Assert
+    assert (first, second, third) == (3, 2, 0)
+    remaining = [token_id for token_id, _ in repo.list_blocked_tokens()]
+    assert remaining == ["alive"]
@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.features.auth import tasks
+from app.features.auth.blocklist import BlockedTokenIndex, BloomFilter
+from app.features.auth.repository import BlockedTokenRepository
+
+
+def test_bloom_filter_has_no_false_negatives():
+    # Given
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    keys = [f"token_{i}" for i in range(1000)]
+
+    # When
+    for key in keys:
+        bloom.add(key)
+
+    # Then: 추가한 키는 항상 포함, 오탐률은 설정값 근처
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f"other_{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def test_index_falls_back_to_db_until_warmed():
+    # Given
+    index = BlockedTokenIndex(capacity=100, error_rate=0.01)
+
+    # Then: warm 전에는 모든 토큰을 DB에서 확인
+    assert index.might_contain("anything") is True
+
+    # When
+    index.rebuild(["blocked"], datetime.now())
+
+    # Then
+    assert index.might_contain("blocked") is True
+    assert index.might_contain("clean") is False
+    assert index.stats()["skipped_lookups"] == 1
+
+
+def test_index_keeps_local_adds_across_rebuild():
+    # Given: rebuild 직전에 이 프로세스에서 차단한 토큰 (DB 목록에는 아직 없음)
+    index = BlockedTokenIndex(capacity=100, error_rate=0.01)
+    index.rebuild([], datetime.now())
+    index.add("just_blocked")
+
+    # When
+    index.rebuild(["old"], datetime.now())
+
+    # Then
+    assert index.might_contain("just_blocked") is True
+    assert index.might_contain("old") is True
+
+
+def test_sweep_and_sync_blocked_tokens(db_session: Session, monkeypatch):
+    # Given
+    monkeypatch.setattr(tasks, "SessionLocal", sessionmaker(bind=db_session.get_bind()))
+    index = BlockedTokenIndex(capacity=100, error_rate=0.01)
+    monkeypatch.setattr(tasks, "blocked_token_index", index)
+    repo = BlockedTokenRepository(db_session)
+    now = tasks.utc_now()
+    for i in range(3):
+        repo.add_blocked_token(f"expired_{i}", now - timedelta(minutes=1))
+    repo.add_blocked_token("alive", now + timedelta(days=1))
+    db_session.commit()
+
+    # When: 만료 토큰 삭제 후 warm, 다른 worker가 새 토큰을 차단한 뒤 sync
+    deleted = tasks.sweep_expired_blocked_tokens(batch_size=2)
+    warmed = tasks.warm_blocked_token_index()
+    repo.add_blocked_token("from_other_worker", now + timedelta(days=1))
+    db_session.commit()
+    synced = tasks.sync_blocked_token_index()
+
+    # Then
+    assert (deleted, warmed) == (3, 1)
+    assert synced >= 1
+    assert index.might_contain("alive") is True
+    assert index.might_contain("from_other_worker") is True
@@ -0,0 +1,42 @@
+from benchmarks.import_time import (
+    ImportRecord,
+    find_violations,
+    measure_imports,
+    parse_importtime,
+)
+
+STDERR = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     app.core.config
+import time:       300 |        420 |   app.database.session
+import time:       800 |       1220 | app.main
+"""
+
+
+def test_parse_importtime_reads_records_and_depth():
+    records = parse_importtime(STDERR)
+
+    assert records == [
+        ImportRecord("app.core.config", 120, 120, 2),
+        ImportRecord("app.database.session", 300, 420, 1),
+        ImportRecord("app.main", 800, 1220, 0),
+    ]
+
+
+def test_find_violations_reports_budget_and_forbidden_modules():
+    records = parse_importtime(STDERR)
+
+    assert find_violations(records, budget_ms=2, forbidden=("boto3",)) == []
+    assert find_violations(records, budget_ms=1, forbidden=("app.main",)) == [
+        "import time 1.2ms exceeds budget 1ms",
+        "app.main is imported eagerly",
+    ]
+
+
+def test_app_import_does_not_load_heavy_clients():
+    # Given/When: 새 프로세스에서 app.main import
+    loaded = {record.module for record in measure_imports("app.main")}
+
+    # Then: OpenAI/boto3는 처음 사용할 때 import
+    assert "app.main" in loaded
+    assert not loaded & {"langchain_openai", "openai", "boto3"}
@@ -0,0 +1,170 @@
+from datetime import datetime, timedelta
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.load import dumps
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration
+from langchain_core.prompts import PromptTemplate
+from pydantic import BaseModel
+
+from app.common import llm_cache as llm_cache_module
+from app.common.llm_cache import (
+    DatabaseCacheTier,
+    LLMCacheStats,
+    LLMResultCache,
+    _build_database_tier,
+    deserialize_generations,
+    llm_cache,
+    serialize_generations,
+)
+from app.common.ttl_cache import InMemoryTTLCache
+from app.core.config import settings
+
+
+class Parsed(BaseModel):
+    answers: list[int]
+
+
+def make_cache(db_session=None, ttl_seconds=60, accept=None):
+    database = DatabaseCacheTier(db_session.get_bind()) if db_session else None
+    return LLMResultCache(
+        "test",
+        ttl_seconds,
+        InMemoryTTLCache(max_size=10),
+        database,
+        LLMCacheStats(),
+        accept,
+    )
+
+
+def test_llm_cache_memory_hit_skips_model_call():
+    # Given: 호출할 때마다 다음 응답을 돌려주는 fake model
+    cache = make_cache()
+    llm = FakeListChatModel(responses=["first", "second"], cache=cache)
+
+    # When
+    first = llm.invoke("hello")
+    second = llm.invoke("hello")
+    other = llm.invoke("bye")
+
+    # Then
+    assert first.content == "first"
+    assert second.content == "first"
+    assert other.content == "second"
+    stats = cache.stats.snapshot()["test"]
+    assert stats["memory_hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["writes"] == 2
+    assert stats["hit_rate"] == round(1 / 3, 4)
+
+
+def test_llm_cache_falls_back_to_database_tier(db_session):
+    # Given: DB tier까지 저장한 뒤 메모리 tier만 비움 (재시작 상황)
+    cache = make_cache(db_session)
+    llm = FakeListChatModel(responses=["stored", "fresh"], cache=cache)
+    llm.invoke("hello")
+    cache.memory.clear()
+
+    # When
+    response = llm.invoke("hello")
+
+    # Then
+    assert response.content == "stored"
+    assert cache.stats.snapshot()["test"]["db_hits"] == 1
+
+
+def test_llm_cache_entry_expires(mocker, db_session):
+    # Given
+    cache = make_cache(db_session, ttl_seconds=60)
+    llm = FakeListChatModel(responses=["stale", "fresh"], cache=cache)
+    llm.invoke("hello")
+    # 메모리/DB tier 모두 만료 시각 이후로 시간을 이동
+    mocker.patch("app.common.ttl_cache.time.monotonic", return_value=10**9)
+    mocker.patch(
+        "app.common.llm_cache.utcnow", return_value=datetime.now() + timedelta(days=1)
+    )
+
+    # When
+    response = llm.invoke("hello")
+
+    # Then
+    assert response.content == "fresh"
+
+
+def test_llm_cache_skips_rejected_results():
+    # Given: accept가 False를 반환하면 저장하지 않음
+    cache = make_cache(accept=lambda generations: False)
+    llm = FakeListChatModel(responses=["bad", "good"], cache=cache)
+
+    # When
+    llm.invoke("hello")
+    response = llm.invoke("hello")
+
+    # Then
+    assert response.content == "good"
+    assert cache.stats.snapshot()["test"]["writes"] == 0
+
+
+def test_serialize_generations_stores_parsed_output_as_dict():
+    # Given: with_structured_output 결과처럼 parsed에 pydantic 객체가 들어있는 응답
+    message = AIMessage(content="", additional_kwargs={"parsed": Parsed(answers=[1])})
+    generation = ChatGeneration(message=message)
+
+    # When
+    restored = deserialize_generations(serialize_generations([generation]))
+
+    # Then
+    assert restored[0].message.additional_kwargs["parsed"] == {"answers": [1]}
+    assert isinstance(message.additional_kwargs["parsed"], Parsed)
+
+
+def test_deserialize_generations_rejects_other_objects():
+    # DB 행은 다른 프로세스도 쓸 수 있으므로 허용한 클래스 외에는 복원하지 않음
+    with pytest.raises(ValueError):
+        deserialize_generations(dumps([PromptTemplate.from_template("{x}")]))
+
+
+def test_llm_cache_disabled_namespace_returns_none(monkeypatch):
+    monkeypatch.setitem(settings.LLM_CACHE_TTL_SECONDS, "question_generation", 0)
+
+    assert llm_cache("question_generation") is None
+    assert llm_cache("unknown_chain") is None
+    assert llm_cache("opposite_value") is not None
+
+
+def test_build_database_tier_uses_given_engine(monkeypatch, db_session):
+    # Given: 테스트 엔진 (db_session fixture가 llm_cache 테이블까지 생성)
+    monkeypatch.setattr(settings, "LLM_CACHE_DB_ENABLED", True)
+    monkeypatch.setattr(settings, "LLM_CACHE_DATABASE_URL", None)
+    tier = _build_database_tier(db_session.get_bind())
+
+    # When
+    tier.set("key", "test", "value", ttl_seconds=60)
+
+    # Then
+    assert tier.get("key") == "value"
+    tier.clear("test")
+    assert tier.get("key") is None
+
+
+def test_build_database_tier_disabled(monkeypatch, db_session):
+    monkeypatch.setattr(settings, "LLM_CACHE_DB_ENABLED", False)
+
+    assert _build_database_tier(db_session.get_bind()) is None
+
+
+def test_llm_cache_builds_database_tier_on_first_lookup(mocker):
+    # Given
+    build = mocker.patch.object(
+        llm_cache_module, "_build_database_tier", return_value=None
+    )
+    cache = llm_cache("opposite_value")
+    assert build.call_count == 0
+
+    # When
+    cache.lookup("prompt", "llm")
+    cache.lookup("prompt", "llm")
+
+    # Then: import/llm_cache() 시점이 아니라 첫 조회 때 한 번만 생성
+    assert build.call_count == 1
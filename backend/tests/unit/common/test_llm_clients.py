@@ -0,0 +1,162 @@
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+from langchain_openai import ChatOpenAI
+
+from app.common.llm import LLMClients
+from app.common.llm_cache import llm_cache
+from app.common.llm_clients import (
+    DEFAULT_MODEL_KEY,
+    LLMClientRegistry,
+    ModelConcurrencyLimiter,
+    request_model,
+)
+
+COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-5-nano",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "ok"},
+            "finish_reason": "stop",
+        }
+    ],
+}
+
+
+class PeakCounter:
+    """동시에 처리 중인 요청 수의 최댓값을 기록하는 가짜 OpenAI 서버"""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def _enter(self) -> None:
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def _exit(self) -> None:
+        with self.lock:
+            self.current -= 1
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self._enter()
+        time.sleep(self.delay)
+        self._exit()
+        return httpx.Response(200, json=COMPLETION)
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        self._enter()
+        await asyncio.sleep(self.delay)
+        self._exit()
+        return httpx.Response(200, json=COMPLETION)
+
+
+def make_registry(server: PeakCounter, limits: dict[str, int]) -> LLMClientRegistry:
+    return LLMClientRegistry(
+        ModelConcurrencyLimiter(limits, default_limit=8),
+        max_connections=10,
+        max_keepalive_connections=5,
+        transport=httpx.MockTransport(server.handler),
+        async_transport=httpx.MockTransport(server.async_handler),
+    )
+
+
+def test_request_model_reads_model_from_json_body():
+    chat = httpx.Request("POST", "https://x/v1/chat", json={"model": "gpt-5-nano"})
+    upload = httpx.Request("POST", "https://x/v1/files", content=b"\x00binary")
+
+    assert request_model(chat) == "gpt-5-nano"
+    assert request_model(upload) == DEFAULT_MODEL_KEY
+
+
+def test_chat_model_is_shared_per_model_and_namespace():
+    registry = make_registry(PeakCounter(), {})
+
+    first = registry.chat_model("gpt-5-nano", cache=llm_cache("big_5_comment"))
+    second = registry.chat_model("gpt-5-nano", cache=llm_cache("big_5_comment"))
+    other = registry.chat_model("gpt-5-nano", cache=llm_cache("neo_pi"))
+    mini = registry.chat_model("gpt-5-mini", max_retries=1)
+
+    assert first is second
+    assert first is not other
+    assert mini.max_retries == 1
+    # 모든 모델이 같은 연결 풀을 사용
+    assert mini.http_client is first.http_client is registry.http_client
+    assert registry.stats()["chat_models"] == 3
+
+
+def test_chat_model_keeps_llm_cache_key_of_default_client():
+    # 공유 클라이언트로 바꿔도 기존 llm_cache 항목을 그대로 사용할 수 있어야 함
+    registry = make_registry(PeakCounter(), {})
+
+    shared = registry.chat_model("gpt-5-nano")
+
+    assert shared._get_llm_string() == ChatOpenAI(model="gpt-5-nano")._get_llm_string()
+
+
+def test_sync_requests_respect_model_concurrency_limit():
+    # Given: gpt-5-nano는 동시에 2개까지
+    server = PeakCounter()
+    registry = make_registry(server, {"gpt-5-nano": 2})
+    llm = registry.chat_model("gpt-5-nano")
+
+    # When: 6개를 동시에 요청
+    responses = llm.batch(["hi"] * 6, config={"max_concurrency": 6})
+
+    # Then
+    assert [r.content for r in responses] == ["ok"] * 6
+    assert server.peak == 2
+    assert registry.stats()["models"] == {"gpt-5-nano": {"limit": 2, "in_flight": 0}}
+
+
+@pytest.mark.asyncio
+async def test_async_requests_respect_model_concurrency_limit():
+    # Given
+    server = PeakCounter()
+    registry = make_registry(server, {"gpt-5-mini": 3})
+    client = registry.async_openai()
+
+    # When
+    await asyncio.gather(
+        *[
+            client.chat.completions.create(
+                model="gpt-5-mini", messages=[{"role": "user", "content": "hi"}]
+            )
+            for _ in range(9)
+        ]
+    )
+
+    # Then
+    assert server.peak == 3
+    assert registry.async_openai() is client
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_llm_clients_recreates_registry_after_close(mocker):
+    # Given
+    registry = make_registry(PeakCounter(), {})
+    mocker.patch.object(LLMClientRegistry, "from_settings", return_value=registry)
+    clients = LLMClients()
+    assert clients.stats() == {}
+
+    # When
+    first = clients.get()
+    await clients.aclose()
+
+    # Then: 닫힌 뒤에는 새 registry를 만듦
+    assert first is registry
+    assert registry.http_client.is_closed
+    assert clients.stats() == {}
+    assert json.dumps(clients.get().stats())
@@ -0,0 +1,21 @@
+from app.common.ttl_cache import InMemoryTTLCache
+
+
+def test_full_cache_evicts_expired_entries_before_lru(mocker):
+    """가득 차면 최근 사용 여부와 관계없이 만료된 항목부터 제거"""
+    # Given
+    now = mocker.patch("app.common.ttl_cache.time.monotonic", return_value=0.0)
+    cache = InMemoryTTLCache(max_size=3)
+    cache.set("old", 1, ttl_seconds=1000)
+    cache.set("short", 2, ttl_seconds=10)
+    cache.set("recent", 3, ttl_seconds=1000)
+    cache.get("short")  # LRU 순서상 가장 최근
+
+    # When
+    now.return_value = 20.0
+    cache.set("new", 4, ttl_seconds=1000)
+
+    # Then
+    assert cache.get("old") == 1
+    assert cache.get("short") is None
+    assert len(cache) == 3
@@ -0,0 +1,51 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from app.database.metrics import PoolMetrics, instrumented_pool_class
+
+
+@pytest.fixture
+def metered_engine(tmp_path):
+    metrics = PoolMetrics()
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=instrumented_pool_class(QueuePool, metrics),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    metrics.attach(engine)
+    yield engine, metrics
+    engine.dispose()
+
+
+def test_pool_metrics_counts_checkouts(metered_engine):
+    engine, metrics = metered_engine
+
+    for _ in range(3):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    snapshot = metrics.snapshot(engine.pool)
+    assert snapshot["connects"] == 1
+    assert snapshot["checkouts"] == 3
+    assert snapshot["checkins"] == 3
+    assert snapshot["checkedout"] == 0
+    assert snapshot["size"] == 1
+    assert snapshot["pool_class"] == "InstrumentedQueuePool"
+
+
+def test_pool_metrics_records_wait_timeout(metered_engine):
+    engine, metrics = metered_engine
+
+    with engine.connect():
+        # 풀(size=1, overflow=0)이 가득 찬 상태에서 추가 checkout은 timeout
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+        snapshot = metrics.snapshot(engine.pool)
+
+    assert snapshot["timeouts"] == 1
+    assert snapshot["checkedout"] == 1
+    assert snapshot["max_wait_ms"] >= 50
@@ -0,0 +1,60 @@
+from unittest.mock import Mock
+
+import pytest
+
+from app.features.jobs.errors import JobAccessDeniedError, JobNotFoundError
+from app.features.jobs.models import Job, JobKind
+from app.features.jobs.repository import JobRepository
+from app.features.jobs.service import JobService
+
+
+@pytest.fixture
+def mock_job_repo() -> Mock:
+    return Mock(spec=JobRepository)
+
+
+@pytest.fixture
+def job_service(mock_job_repo: Mock) -> JobService:
+    return JobService(job_repository=mock_job_repo)
+
+
+def test_enqueue_analysis_update_reuses_queued_job(job_service, mock_job_repo):
+    # Given: 같은 사용자의 analysis job이 아직 대기 중
+    queued = Job(id=1, kind=JobKind.ANALYSIS_UPDATE, user_id=7)
+    mock_job_repo.get_queued_job_by_dedup_key.return_value = queued
+
+    # When
+    job = job_service.enqueue_analysis_update(7)
+
+    # Then
+    assert job is queued
+    mock_job_repo.get_queued_job_by_dedup_key.assert_called_once_with(
+        "analysis.update:7"
+    )
+    mock_job_repo.add_job.assert_not_called()
+
+
+def test_enqueue_value_score_extraction_adds_job(job_service, mock_job_repo):
+    # Given
+    mock_job_repo.get_queued_job_by_dedup_key.return_value = None
+
+    # When
+    job_service.enqueue_value_score_extraction(user_id=7, question_id=3, answer_id=5)
+
+    # Then: answer 단위로 dedup
+    kwargs = mock_job_repo.add_job.call_args.kwargs
+    assert kwargs["kind"] == JobKind.VALUE_SCORE_EXTRACTION
+    assert kwargs["payload"] == {"question_id": 3, "answer_id": 5}
+    assert kwargs["dedup_key"] == "selfaware.value_score:5"
+
+
+def test_get_owned_job_errors(job_service, mock_job_repo):
+    # 없는 job
+    mock_job_repo.get_job_by_id.return_value = None
+    with pytest.raises(JobNotFoundError):
+        job_service.get_owned_job(1, user_id=7)
+
+    # 다른 사용자의 job
+    mock_job_repo.get_job_by_id.return_value = Job(id=1, user_id=8)
+    with pytest.raises(JobAccessDeniedError):
+        job_service.get_owned_job(1, user_id=7)
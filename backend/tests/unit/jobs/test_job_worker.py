@@ -0,0 +1,147 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.features.jobs.models import Job, JobStatus, utcnow
+from app.features.jobs.repository import JobRepository
+from app.features.jobs.worker import JobWorker
+from app.features.user.models import User
+
+
+@pytest.fixture
+def job_repo(db_session: Session) -> JobRepository:
+    return JobRepository(db_session)
+
+
+def make_worker(db_session: Session, handlers: dict) -> JobWorker:
+    # worker는 job 상태/handler마다 새 세션을 엽니다. (테스트 엔진 공유)
+    return JobWorker(
+        handlers=handlers,
+        session_factory=sessionmaker(bind=db_session.get_bind()),
+        worker_id="test-worker",
+    )
+
+
+def reload(db_session: Session, job_id: int) -> Job:
+    db_session.expire_all()
+    return db_session.get(Job, job_id)
+
+
+def test_worker_runs_job_and_marks_succeeded(
+    db_session: Session, test_user: User, job_repo: JobRepository
+):
+    # Given
+    calls = []
+    job = job_repo.add_job("test.kind", test_user.id, {"n": 1}, None, max_attempts=3)
+    db_session.commit()
+    worker = make_worker(
+        db_session, {"test.kind": lambda s, user_id, p: calls.append((user_id, p))}
+    )
+
+    # When
+    processed = worker.run_until_empty()
+
+    # Then
+    assert processed == 1
+    assert calls == [(test_user.id, {"n": 1})]
+    job = reload(db_session, job.id)
+    assert job.status == JobStatus.SUCCEEDED
+    assert job.attempts == 1
+    assert job.finished_at is not None
+
+
+def test_worker_retries_with_backoff_then_fails(
+    db_session: Session, test_user: User, job_repo: JobRepository
+):
+    # Given: 항상 실패하는 handler, 최대 2회 시도
+    def failing(session, user_id, payload):
+        raise RuntimeError("LLM timeout")
+
+    job = job_repo.add_job("test.kind", test_user.id, {}, None, max_attempts=2)
+    db_session.commit()
+    worker = make_worker(db_session, {"test.kind": failing})
+
+    # When: 1차 실패 → backoff 동안은 실행되지 않음
+    assert worker.run_once() is True
+    retried = reload(db_session, job.id)
+    assert retried.status == JobStatus.QUEUED
+    assert retried.last_error == "RuntimeError: LLM timeout"
+    assert worker.run_once() is False
+
+    # When: backoff가 지난 뒤 2차 실패
+    job_repo.session.query(Job).filter(Job.id == job.id).update(
+        {"run_after": utcnow() - timedelta(seconds=1)}
+    )
+    db_session.commit()
+    assert worker.run_once() is True
+
+    # Then
+    failed = reload(db_session, job.id)
+    assert failed.status == JobStatus.FAILED
+    assert failed.attempts == 2
+
+
+def test_worker_skips_duplicate_queued_jobs(
+    db_session: Session, test_user: User, job_repo: JobRepository
+):
+    # Given: 같은 dedup_key로 두 개가 쌓인 경우 (동시 요청)
+    calls = []
+    first = job_repo.add_job("test.kind", test_user.id, {}, "k:1", max_attempts=3)
+    second = job_repo.add_job("test.kind", test_user.id, {}, "k:1", max_attempts=3)
+    db_session.commit()
+    worker = make_worker(
+        db_session, {"test.kind": lambda s, user_id, p: calls.append(user_id)}
+    )
+
+    # When
+    processed = worker.run_until_empty()
+
+    # Then: 한 번만 실행
+    assert processed == 1
+    assert calls == [test_user.id]
+    assert reload(db_session, first.id).status == JobStatus.SUCCEEDED
+    assert reload(db_session, second.id).status == JobStatus.SKIPPED
+
+
+def test_requeue_stale_running_jobs(
+    db_session: Session, test_user: User, job_repo: JobRepository
+):
+    # Given: worker가 죽어서 running으로 남은 job 2개 (하나는 시도 횟수 소진)
+    now = utcnow()
+    retryable = job_repo.add_job("test.kind", test_user.id, {}, None, max_attempts=3)
+    exhausted = job_repo.add_job("test.kind", test_user.id, {}, None, max_attempts=1)
+    db_session.commit()
+    for job in (retryable, exhausted):
+        assert job_repo.claim_job(job.id, "dead-worker", now - timedelta(hours=2))
+    db_session.commit()
+
+    # When
+    requeued = job_repo.requeue_stale_jobs(now - timedelta(hours=1), now)
+    db_session.commit()
+
+    # Then
+    assert requeued == 1
+    assert reload(db_session, retryable.id).status == JobStatus.QUEUED
+    assert reload(db_session, exhausted.id).status == JobStatus.FAILED
+
+
+def test_worker_fails_unknown_job_kind(
+    db_session: Session, test_user: User, job_repo: JobRepository
+):
+    job = job_repo.add_job("unknown.kind", test_user.id, {}, None, max_attempts=3)
+    db_session.commit()
+
+    make_worker(db_session, {}).run_until_empty()
+
+    failed = reload(db_session, job.id)
+    assert failed.status == JobStatus.FAILED
+    assert "No handler" in failed.last_error
+
+
+def test_every_job_kind_has_handler():
+    from app.features.jobs.handlers import JOB_HANDLERS
+    from app.features.jobs.models import JobKind
+
+    kinds = {v for k, v in vars(JobKind).items() if not k.startswith("_")}
+    assert kinds == set(JOB_HANDLERS)
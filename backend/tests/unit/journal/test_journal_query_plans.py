@@ -0,0 +1,177 @@
+"""
+JournalRepository 쿼리의 실행 계획 검사 (SQLite EXPLAIN QUERY PLAN).
+
+리포지토리 메서드가 실행한 SELECT를 모두 기록해 EXPLAIN으로 다시 실행하고,
+테이블 full scan("SCAN <table>")이 없는지 확인합니다. 인덱스를 빠뜨리거나
+인덱스를 탈 수 없는 형태로 쿼리를 바꾸면 실패합니다.
+"""
+
+import re
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.features.journal.models import Journal, JournalImage
+from app.features.journal.repository import JournalRepository
+from app.features.journal.schemas.responses import KeywordEmotionAssociationItem
+from app.features.statistics.repository import StatisticsRepository
+from app.features.user.models import User
+
+# anon_N은 테이블이 아니라 limit개로 잘린 subquery 결과(MATERIALIZE)
+FULL_SCAN = re.compile(r"^SCAN (TABLE )?(?!anon_\d+$)(?P<table>\w+)$")
+
+REPOSITORY_QUERIES = {
+    "list_journals_by_user": lambda repo, user, journal: repo.list_journals_by_user(
+        user.id, limit=10
+    ),
+    "list_journals_by_user_cursor": lambda repo, user, journal: (
+        repo.list_journals_by_user(user.id, limit=10, cursor=journal.id + 1)
+    ),
+    "search_journals": lambda repo, user, journal: repo.search_journals(
+        user.id,
+        title="Fixture",
+        start_date=date(2000, 1, 1),
+        end_date=date(2100, 1, 1),
+        cursor=journal.id + 1,
+    ),
+    "get_journals_by_keyword": lambda repo, user, journal: repo.get_journals_by_keyword(
+        user.id, "키워드1", cursor=journal.id + 1
+    ),
+    "full_text_search": lambda repo, user, journal: repo.full_text_search(
+        user.id, ["Fixture", "journal"], cursor=(1.0, journal.id + 1)
+    ),
+    "get_journals_by_keywords_and": lambda repo, user, journal: (
+        repo.get_journals_by_keywords(
+            user.id, ["키워드1", "키워드2"], cursor=journal.id
+        )
+    ),
+    "get_journals_by_keywords_prefix_or": lambda repo, user, journal: (
+        repo.get_journals_by_keywords(
+            user.id, ["키워", "key"], match_all=False, prefix=True
+        )
+    ),
+    "get_top_keywords": lambda repo, user, journal: repo.get_top_keywords(user.id),
+    "get_journal_by_id": lambda repo, user, journal: repo.get_journal_by_id(journal.id),
+    "get_journal_owners": lambda repo, user, journal: repo.get_journal_owners(
+        [journal.id]
+    ),
+    "get_image_by_journal_id": lambda repo, user, journal: repo.get_image_by_journal_id(
+        journal.id
+    ),
+    "add_keywords_emotion_associations": lambda repo, user, journal: (
+        repo.add_keywords_emotion_associations(
+            journal.id,
+            [
+                KeywordEmotionAssociationItem(
+                    keyword="새 키워드", emotion="happy", summary="s", weight=0.5
+                )
+            ],
+        )
+    ),
+    "get_emotion_counts": lambda repo, user, journal: StatisticsRepository(
+        repo.session
+    ).get_emotion_counts(user.id, date(2000, 1, 1), date(2100, 1, 1)),
+    "get_keyword_emotion_stats": lambda repo, user, journal: StatisticsRepository(
+        repo.session
+    ).get_keyword_emotion_stats(user.id, date(2000, 1, 1), date(2100, 1, 1)),
+}
+
+
+@pytest.fixture
+def recorded_selects(db_session: Session):
+    """세션에서 실행된 SELECT 문과 파라미터를 기록합니다."""
+    selects: list[tuple[str, tuple]] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append((statement, parameters))
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield selects
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def query_plan(session: Session, statement: str, parameters: tuple) -> list[str]:
+    rows = session.connection().exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}", parameters
+    )
+    return [row[-1] for row in rows]
+
+
+@pytest.mark.parametrize("method", REPOSITORY_QUERIES)
+def test_repository_queries_use_indexes(
+    method: str,
+    db_session: Session,
+    test_user: User,
+    test_journal: Journal,
+    recorded_selects: list,
+):
+    # Given: 자식 테이블 selectinload 쿼리까지 나오도록 이미지도 추가
+    db_session.add(JournalImage(journal_id=test_journal.id, s3_key="k.jpg"))
+    db_session.commit()
+    db_session.refresh(test_user)
+    db_session.refresh(test_journal)
+    # identity map에서 꺼내지 않고 실제로 조회하도록 비움 (id는 로드된 값 사용)
+    db_session.expunge_all()
+    repo = JournalRepository(db_session)
+    recorded_selects.clear()
+
+    # When
+    REPOSITORY_QUERIES[method](repo, test_user, test_journal)
+    plans = [
+        (statement, query_plan(db_session, statement, parameters))
+        for statement, parameters in recorded_selects
+    ]
+
+    # Then
+    assert plans, f"{method} did not run any SELECT"
+    for statement, plan in plans:
+        full_scans = [detail for detail in plan if FULL_SCAN.match(detail)]
+        assert not full_scans, f"{method}: {full_scans}\n{statement}\n{plan}"
+
+
+@pytest.mark.parametrize(
+    ("method", "index", "page_sorts"),
+    [
+        ("list_journals_by_user_cursor", "ix_journals_user_id_id", 0),
+        # posting PK 순서로 limit개만 읽고, 가져온 페이지만 다시 정렬
+        (
+            "get_journals_by_keyword",
+            "sqlite_autoindex_journal_keyword_postings_1",
+            1,
+        ),
+        (
+            "get_journals_by_keywords_and",
+            "sqlite_autoindex_journal_keyword_postings_1",
+            1,
+        ),
+    ],
+)
+def test_cursor_pages_read_in_index_order(
+    method: str,
+    index: str,
+    page_sorts: int,
+    db_session: Session,
+    test_user: User,
+    test_journal: Journal,
+    recorded_selects: list,
+):
+    """인덱스 순서로 읽어서 페이지 정렬 외에 별도 정렬(TEMP B-TREE)이 없어야 함"""
+    repo = JournalRepository(db_session)
+    recorded_selects.clear()
+
+    REPOSITORY_QUERIES[method](repo, test_user, test_journal)
+    statement, parameters = next(
+        (statement, parameters)
+        for statement, parameters in recorded_selects
+        if "FROM journals" in statement
+    )
+    plan = query_plan(db_session, statement, parameters)
+
+    assert any(index in detail for detail in plan), plan
+    assert sum("TEMP B-TREE" in detail for detail in plan) == page_sorts, plan
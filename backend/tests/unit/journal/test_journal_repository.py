@@ -1,14 +1,37 @@
-from datetime import date
-from unittest.mock import MagicMock, Mock
+import io
+import unicodedata
+from datetime import UTC, date, datetime
+from unittest.mock import MagicMock, Mock, patch
 
+import boto3
 import pytest
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from botocore.stub import Stubber
 from sqlalchemy.orm import Session
 from sqlalchemy.sql.selectable import Select
 
-from app.features.journal.models import Journal, JournalImage, JournalKeyword
-from app.features.journal.repository import JournalRepository, S3Repository
-from app.features.journal.schemas.responses import KeywordEmotionAssociationItem
+from app.core.config import settings
+from app.features.journal.models import (
+    Journal,
+    JournalEmotion,
+    JournalImage,
+    JournalKeyword,
+)
+from app.features.journal.presign import S3Presigner, presigned_get_urls
+from app.features.journal.repository import (
+    AioS3Repository,
+    AsyncJournalRepository,
+    JournalRepository,
+    S3Repository,
+    get_s3_repository,
+)
+from app.features.journal.schemas.responses import (
+    JournalCursorResponse,
+    KeywordEmotionAssociationItem,
+)
+from app.features.journal.storage import S3Clients, s3_clients
+from app.features.user.models import User
 
 
 @pytest.fixture
@@ -153,7 +176,7 @@ def test_list_journals_by_user_no_cursor(
 
     # 3. 검증 (Then)
     mock_session.query.assert_called_once_with(Journal)
-    chain = mock_session.query.return_value
+    chain = mock_session.query.return_value.options.return_value
 
     # filter(user_id)
     chain.filter.assert_called_once()
@@ -182,7 +205,7 @@ def test_list_journals_by_user_with_cursor(
 
     # 3. 검증 (Then)
     mock_session.query.assert_called_once_with(Journal)
-    chain = mock_session.query.return_value
+    chain = mock_session.query.return_value.options.return_value
 
     # 3-1. filter(user_id) 호출
     chain.filter.assert_called_once()
@@ -230,7 +253,7 @@ def test_search_journals_all_params(
     # 3. 검증 (Then)
     mock_session.query.assert_called_once_with(Journal)
 
-    chain = mock_session.query.return_value
+    chain = mock_session.query.return_value.options.return_value
 
     chain.filter.assert_called_once()  # .filter(user_id)
     chain.filter.return_value.filter.assert_called_once()  # .filter(title)
@@ -311,6 +334,319 @@ def test_get_journals_by_keyword(journal_repo: JournalRepository, mock_session:
     mock_session.execute.return_value.scalars.return_value.all.assert_called_once()
 
 
+def _seed_journals_with_children(db_session: Session, user_id: int, count: int):
+    for i in range(count):
+        journal = Journal(user_id=user_id, title=f"title {i}", content="content")
+        journal.emotions = [
+            JournalEmotion(emotion="happy", intensity=3),
+            JournalEmotion(emotion="calm", intensity=2),
+        ]
+        journal.keywords = [
+            JournalKeyword(
+                keyword="keyword", emotion="happy", summary="summary", weight=0.5
+            )
+        ]
+        journal.image = JournalImage(s3_key=f"images/journals/{i}.png")
+        db_session.add(journal)
+    db_session.commit()
+    JournalRepository(session=db_session).rebuild_keyword_index()
+    # identity map을 비워 관계가 실제로 DB에서 로드되도록 함
+    db_session.expunge_all()
+
+
+@pytest.mark.parametrize(
+    "fetch",
+    [
+        lambda repo, user_id: repo.list_journals_by_user(user_id, limit=50),
+        lambda repo, user_id: repo.search_journals(user_id, title="title", limit=50),
+        lambda repo, user_id: repo.get_journals_by_keyword(
+            user_id, keyword="keyword", limit=50
+        ),
+    ],
+    ids=["list", "search", "keyword"],
+)
+def test_journal_listing_query_count_is_constant(
+    db_session: Session, test_user, query_counter: list[str], fetch
+):
+    """
+    [Repository] 목록 조회 N+1 회귀 테스트
+    - 목표: 페이지 크기와 무관하게 본문 1회 + 자식 테이블 3회로 고정되는가?
+    """
+    # 1. 준비 (Given)
+    user_id = test_user.id
+    _seed_journals_with_children(db_session, user_id, count=20)
+    repo = JournalRepository(session=db_session)
+    query_counter.clear()
+
+    # 2. 실행 (When) - 응답 직렬화까지 포함
+    journals = fetch(repo, user_id)
+    response = JournalCursorResponse.from_journals(journals, limit=50)
+
+    # 3. 검증 (Then)
+    assert len(response.items) == 20
+    assert all(item.image_s3_keys for item in response.items)
+    assert len(query_counter) == 4
+
+
+def _add_search_journals(db_session: Session, user_id: int, rows: list[tuple]):
+    journals = [
+        Journal(user_id=user_id, title=title, content=content, gratitude=gratitude)
+        for title, content, gratitude in rows
+    ]
+    db_session.add_all(journals)
+    db_session.commit()
+    return journals
+
+
+def test_full_text_search_ranks_by_relevance(db_session: Session, test_user):
+    """
+    [Repository] full_text_search 관련도 순 정렬
+    - 목표: title/content/gratitude 모두 검색하고, 검색어가 많이 나온 journal이 먼저 오는가?
+    """
+    # 1. 준비 (Given)
+    once, many, gratitude_only, _ = _add_search_journals(
+        db_session,
+        test_user.id,
+        [
+            ("출근", "공원에서 산책을 했다. 날씨가 좋았다.", None),
+            ("산책을 했다", "아침에도 산책을, 저녁에도 산책을", None),
+            ("일기", "특별한 일은 없었다", "같이 산책을 해준 친구"),
+            ("회의", "회의가 길었다", None),
+        ],
+    )
+    repo = JournalRepository(session=db_session)
+
+    # 2. 실행 (When)
+    results = repo.full_text_search(test_user.id, ["산책을"])
+
+    # 3. 검증 (Then)
+    assert [journal.id for journal, _ in results][0] == many.id
+    assert {journal.id for journal, _ in results} == {
+        once.id,
+        many.id,
+        gratitude_only.id,
+    }
+    scores = [score for _, score in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_full_text_search_requires_all_terms(db_session: Session, test_user):
+    """[Repository] full_text_search는 모든 검색어를 포함한 journal만 (짧은 단어 포함)"""
+    # 1. 준비 (Given)
+    both, _, _ = _add_search_journals(
+        db_session,
+        test_user.id,
+        [
+            ("주말", "친구와 커피를 마셨다", None),
+            ("주말", "친구와 영화를 봤다", None),
+            ("주말", "혼자 커피를 마셨다", None),
+        ],
+    )
+    repo = JournalRepository(session=db_session)
+
+    # 2. 실행 (When)
+    results = repo.full_text_search(test_user.id, ["친구와", "커피를"])
+    short_results = repo.full_text_search(test_user.id, ["친구", "커피"])
+
+    # 3. 검증 (Then)
+    assert [journal.id for journal, _ in results] == [both.id]
+    assert [journal.id for journal, _ in short_results] == [both.id]
+
+
+def test_full_text_search_cursor_pages(db_session: Session, test_user):
+    """[Repository] (score, id) 커서로 중복/누락 없이 다음 페이지 조회"""
+    # 1. 준비 (Given) - 점수가 같은 journal이 섞이도록 같은 내용을 반복
+    _add_search_journals(
+        db_session,
+        test_user.id,
+        [("기록", "산책을 " * (i % 3 + 1), None) for i in range(7)],
+    )
+    _add_search_journals(db_session, test_user.id, [("기록", "독서를", None)])
+    repo = JournalRepository(session=db_session)
+    expected = [
+        journal.id
+        for journal, _ in repo.full_text_search(test_user.id, ["산책을"], limit=50)
+    ]
+
+    # 2. 실행 (When)
+    paged, cursor = [], None
+    while True:
+        page = repo.full_text_search(test_user.id, ["산책을"], limit=3, cursor=cursor)
+        paged += [journal.id for journal, _ in page]
+        if len(page) < 3:
+            break
+        journal, score = page[-1]
+        cursor = (score, journal.id)
+
+    # 3. 검증 (Then)
+    assert len(expected) == 7
+    assert paged == expected
+
+
+def test_full_text_search_index_follows_updates(db_session: Session, test_user):
+    """[Repository] 수정/삭제한 journal이 검색 색인에 반영되는가? (다른 사용자 제외)"""
+    # 1. 준비 (Given)
+    journal, deleted = _add_search_journals(
+        db_session,
+        test_user.id,
+        [("기록", "도서관에서 공부", None), ("기록", "도서관에서 독서", None)],
+    )
+    other_user = User(
+        login_id="other_user",
+        hashed_password="x",
+        username="Other-User",
+        gender="Male",
+        birthdate=date(2000, 1, 1),
+    )
+    db_session.add(other_user)
+    db_session.commit()
+    _add_search_journals(db_session, other_user.id, [("기록", "도서관에서", None)])
+    repo = JournalRepository(session=db_session)
+
+    # 2. 실행 (When)
+    repo.update_journal(journal, content="카페에서 공부")
+    repo.delete_journal(deleted)
+    db_session.commit()
+
+    # 3. 검증 (Then)
+    assert repo.full_text_search(test_user.id, ["도서관에서"]) == []
+    assert [j.id for j, _ in repo.full_text_search(test_user.id, ["카페에서"])] == [
+        journal.id
+    ]
+
+
+def _add_keywords(repo: JournalRepository, journal_id: int, keywords: list[str]):
+    repo.add_keywords_emotion_associations(
+        journal_id,
+        [
+            KeywordEmotionAssociationItem(
+                keyword=keyword, emotion="happy", summary="s", weight=0.5
+            )
+            for keyword in keywords
+        ],
+    )
+    repo.session.commit()
+
+
+@pytest.mark.parametrize(
+    ("keywords", "match_all", "prefix", "expected"),
+    [
+        (["산책"], True, False, [2, 0]),
+        (["산책", "친구"], True, False, [0]),
+        (["커피", "산책"], False, False, [2, 1, 0]),
+        (["산"], True, True, [3, 2, 0]),
+        (["산", "친"], True, True, [0]),
+        ([" CAFÉ "], True, False, [3]),
+        (["없는키워드"], True, False, []),
+    ],
+)
+def test_get_journals_by_keywords(
+    db_session: Session, test_user, keywords, match_all, prefix, expected
+):
+    """
+    [Repository] 키워드 역색인 검색 (AND / OR / 접두어, 정규화)
+    """
+    # 1. 준비 (Given) - 인덱스 순서대로 journal 생성
+    repo = JournalRepository(session=db_session)
+    journal_keywords = [
+        ["산책", "친구"],
+        ["커피"],
+        ["산책", "커피"],
+        ["산책로", "café"],
+    ]
+    journals = []
+    for i, keywords_of_journal in enumerate(journal_keywords):
+        journal = repo.add_journal(test_user.id, f"title {i}", "content", {})
+        _add_keywords(repo, journal.id, keywords_of_journal)
+        journals.append(journal)
+
+    # 2. 실행 (When)
+    found = repo.get_journals_by_keywords(
+        test_user.id, keywords, match_all=match_all, prefix=prefix
+    )
+
+    # 3. 검증 (Then) - 최신 순
+    assert [journal.id for journal in found] == [journals[i].id for i in expected]
+
+
+def test_keyword_index_follows_keyword_changes(db_session: Session, test_user):
+    """
+    [Repository] 키워드 교체/journal 삭제가 역색인과 top keywords에 반영되는가?
+    """
+    # 1. 준비 (Given)
+    repo = JournalRepository(session=db_session)
+    first = repo.add_journal(test_user.id, "first", "content", {})
+    second = repo.add_journal(test_user.id, "second", "content", {})
+    _add_keywords(repo, first.id, ["산책", "친구"])
+    _add_keywords(repo, second.id, ["산책"])
+    assert [tuple(row) for row in repo.get_top_keywords(test_user.id)] == [
+        ("산책", 2),
+        ("친구", 1),
+    ]
+
+    # 2. 실행 (When)
+    _add_keywords(repo, first.id, ["커피"])
+    repo.delete_journal(second)
+    db_session.commit()
+
+    # 3. 검증 (Then)
+    assert repo.get_journals_by_keyword(test_user.id, "산책") == []
+    assert [j.id for j in repo.get_journals_by_keyword(test_user.id, "커피")] == [
+        first.id
+    ]
+    assert [tuple(row) for row in repo.get_top_keywords(test_user.id)] == [("커피", 1)]
+
+
+def test_rebuild_keyword_index(db_session: Session, test_journal):
+    """
+    [Repository] rebuild_keyword_index는 journal_keywords로 역색인을 다시 만드는가?
+    """
+    repo = JournalRepository(session=db_session)
+    assert repo.get_journals_by_keyword(test_journal.user_id, "keyword1") == []
+
+    rebuilt = repo.rebuild_keyword_index(batch_size=1)
+
+    assert rebuilt == 2
+    found = repo.get_journals_by_keywords(
+        test_journal.user_id, ["keyword1", "keyword2"]
+    )
+    assert [journal.id for journal in found] == [test_journal.id]
+    assert repo.rebuild_keyword_index() == 2
+
+
+def test_rebuild_keyword_index_normalizes_like_save(db_session: Session, test_journal):
+    """
+    [Repository] rebuild_keyword_index는 저장할 때와 같은 normalize_keyword 키로
+    posting을 만드는가? (NFD 한글, 탭 공백)
+    """
+    db_session.add_all(
+        [
+            JournalKeyword(
+                journal_id=test_journal.id,
+                keyword=unicodedata.normalize("NFD", "커피"),
+                emotion="happy",
+                summary="summary",
+                weight=0.5,
+            ),
+            JournalKeyword(
+                journal_id=test_journal.id,
+                keyword="\tKeyword1 ",
+                emotion="happy",
+                summary="summary",
+                weight=0.5,
+            ),
+        ]
+    )
+    db_session.commit()
+    repo = JournalRepository(session=db_session)
+
+    # "keyword1"과 "\tKeyword1 "은 같은 posting
+    assert repo.rebuild_keyword_index() == 3
+    for keyword in ["커피", "keyword1", "keyword2"]:
+        found = repo.get_journals_by_keyword(test_journal.user_id, keyword)
+        assert [journal.id for journal in found] == [test_journal.id]
+
+
 def test_replace_journal_image_new(journal_repo: JournalRepository, mock_session: Mock):
     """
     [Repository] replace_journal_image (새 이미지) 테스트
@@ -378,46 +714,180 @@ def test_delete_journal_image(journal_repo: JournalRepository, mock_session: Moc
     mock_session.flush.assert_called_once()
 
 
+# --- AsyncJournalRepository 테스트 (aiosqlite) ---
+
+
+@pytest.mark.asyncio
+async def test_async_add_and_list_journals(async_db_session):
+    """
+    [AsyncRepository] add_journal / list_journals_by_user 테스트
+    - 목표: 자식 테이블이 eager load 되어 lazy load 없이 직렬화되는가?
+    """
+    repo = AsyncJournalRepository(session=async_db_session)
+    for i in range(3):
+        await repo.add_journal(
+            user_id=1,
+            title=f"title {i}",
+            content="content",
+            emotions={"happy": 3, "calm": 1},
+            gratitude="감사",
+        )
+    await async_db_session.commit()
+    async_db_session.expunge_all()
+
+    journals = await repo.list_journals_by_user(user_id=1, limit=2)
+    response = JournalCursorResponse.from_journals(journals, limit=2)
+
+    assert [item.title for item in response.items] == ["title 2", "title 1"]
+    assert len(response.items[0].emotions) == 2
+    assert response.next_cursor == response.items[-1].id
+
+
+@pytest.mark.asyncio
+async def test_async_add_keywords_emotion_associations(async_db_session):
+    """
+    [AsyncRepository] add_keywords_emotion_associations 테스트
+    - 목표: 기존 키워드를 삭제하고 새 키워드로 교체하는가?
+    """
+    repo = AsyncJournalRepository(session=async_db_session)
+    journal = await repo.add_journal(1, "title", "content", {"happy": 2})
+    first = [
+        KeywordEmotionAssociationItem(
+            keyword="old", emotion="happy", summary="s", weight=0.1
+        )
+    ]
+    second = [
+        KeywordEmotionAssociationItem(
+            keyword="new", emotion="happy", summary="s", weight=0.9
+        )
+    ]
+
+    await repo.add_keywords_emotion_associations(journal.id, first)
+    result = await repo.add_keywords_emotion_associations(journal.id, second)
+    await async_db_session.commit()
+    async_db_session.expunge_all()
+
+    assert [kw.keyword for kw in result] == ["new"]
+    found = await repo.get_journals_by_keyword(user_id=1, keyword="new")
+    assert [j.id for j in found] == [journal.id]
+    assert await repo.get_journals_by_keyword(user_id=1, keyword="old") == []
+
+
+@pytest.mark.asyncio
+async def test_async_replace_journal_image(async_db_session):
+    """
+    [AsyncRepository] replace_journal_image 테스트
+    """
+    repo = AsyncJournalRepository(session=async_db_session)
+    journal = await repo.add_journal(1, "title", "content", {"happy": 2})
+    await repo.replace_journal_image(journal.id, s3_key="old_key")
+
+    existing = await repo.get_image_by_journal_id(journal.id)
+    new_image = await repo.replace_journal_image(
+        journal.id, existing_image=existing, s3_key="new_key"
+    )
+
+    assert new_image.s3_key == "new_key"
+    fetched = await repo.get_image_by_journal_id(journal.id)
+    assert fetched.s3_key == "new_key"
+
+
 # --- S3Repository 테스트 (boto3 모킹) ---
 
 
 @pytest.fixture
 def s3_repo(mocker):
-    # boto3.client를 모킹하여 실제 AWS 연결 방지
+    # 공유 boto3 client를 모킹하여 실제 AWS 연결 방지
     mock_boto_client = MagicMock()
-    mocker.patch(
-        "app.features.journal.repository.boto3.client", return_value=mock_boto_client
-    )
+    mocker.patch.object(s3_clients, "get", return_value=mock_boto_client)
     return S3Repository()
 
 
 @pytest.mark.asyncio
-async def test_s3_generate_upload_url_success(s3_repo):
-    """[S3Repository] Presigned URL 생성 성공"""
+async def test_s3_generate_upload_url_signs_locally(s3_repo):
+    """[S3Repository] Presigned URL은 boto3 client 없이 로컬에서 서명"""
     # Given
     s3_key = "test.jpg"
     content_type = "image/jpeg"
-    s3_repo.s3_client.generate_presigned_url.return_value = "http://presigned-url"
 
     # When
     result = await s3_repo.generate_upload_url(s3_key, content_type)
 
     # Then
-    assert result["presigned_url"] == "http://presigned-url"
-    assert s3_key in result["file_url"]
+    s3_repo.s3_client.generate_presigned_url.assert_not_called()
+    assert "X-Amz-SignedHeaders=content-type%3Bhost" in result["presigned_url"]
+    assert result["file_url"].endswith(f"/{s3_key}")
+
+
+@pytest.mark.parametrize(
+    ("client_method", "params", "content_type"),
+    [
+        ("put_object", {"ContentType": "image/jpeg"}, "image/jpeg"),
+        ("get_object", {}, None),
+    ],
+)
+def test_s3_presigner_matches_botocore(client_method, params, content_type):
+    """[S3Presigner] 같은 시각에 botocore와 동일한 URL/서명을 생성 (regional host)"""
+    # Given
+    now = datetime(2025, 11, 3, 23, 59, 30, tzinfo=UTC)
+    key = "images/journals/1/일기 사진+1.jpg"
+    client = boto3.client(
+        "s3",
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        region_name=settings.AWS_REGION,
+        config=Config(signature_version="s3v4", s3={"addressing_style": "virtual"}),
+    )
+    presigner = S3Presigner.from_settings()
 
+    # When
+    with patch("botocore.auth.get_current_datetime", return_value=now):
+        expected = client.generate_presigned_url(
+            client_method,
+            Params={"Bucket": settings.AWS_S3_BUCKET_NAME, "Key": key} | params,
+            ExpiresIn=900,
+        )
+    method = "PUT" if content_type else "GET"
+    signed = presigner.presign(method, key, 900, content_type, now=now)
 
-@pytest.mark.asyncio
-async def test_s3_generate_upload_url_failure(s3_repo):
-    """[S3Repository] Presigned URL 생성 실패 (ClientError)"""
+    # Then
+    assert signed == expected
+
+
+def test_s3_download_url_cached_until_margin(s3_repo, mocker, monkeypatch):
+    """[S3Repository] GET URL은 s3_key별로 캐시되고 (만료 - margin) 이후 다시 서명"""
     # Given
-    s3_repo.s3_client.generate_presigned_url.side_effect = ClientError({}, "operation")
+    monkeypatch.setattr(settings, "S3_DOWNLOAD_URL_EXPIRES_IN", 600)
+    monkeypatch.setattr(settings, "S3_DOWNLOAD_URL_CACHE_MARGIN", 60)
+    now = mocker.patch("app.common.ttl_cache.time.monotonic", return_value=100.0)
+    sign = mocker.spy(s3_repo.presigner, "presign")
+    presigned_get_urls.clear()
 
     # When
-    result = await s3_repo.generate_upload_url("k", "t")
+    first = s3_repo.generate_download_url("a.jpg")
+    cached = s3_repo.generate_download_url("a.jpg")
+    other = s3_repo.generate_download_url("b.jpg")
+    now.return_value = 100.0 + 540
+    refreshed = s3_repo.generate_download_url("a.jpg")
 
     # Then
-    assert result is None
+    assert cached == first
+    assert other["url"] != first["url"]
+    assert sign.call_count == 3
+    assert refreshed["expires_at"] >= first["expires_at"]
+    presigned_get_urls.clear()
+
+
+@pytest.mark.asyncio
+async def test_s3_delete_object_invalidates_download_url(s3_repo):
+    """[S3Repository] 객체를 삭제하면 캐시된 GET URL도 제거"""
+    presigned_get_urls.clear()
+    s3_repo.generate_download_url("a.jpg")
+    assert len(presigned_get_urls) == 1
+
+    await s3_repo.delete_object("a.jpg")
+
+    assert len(presigned_get_urls) == 0
 
 
 @pytest.mark.asyncio
@@ -458,3 +928,95 @@ async def test_s3_delete_object(s3_repo):
     # Then
     s3_repo.s3_client.delete_object.assert_called_once()
     assert result is True
+
+
+@pytest.mark.asyncio
+async def test_s3_clients_share_one_pooled_client():
+    """[S3Clients] 요청마다 새로 만들지 않고 하나의 boto3 client를 공유"""
+    # Given
+    clients = S3Clients()
+
+    # When
+    first = clients.get()
+    second = clients.get()
+
+    # Then
+    assert first is second
+    assert first.meta.config.max_pool_connections == settings.S3_MAX_POOL_CONNECTIONS
+    await clients.aclose()
+    assert clients.get() is not first
+
+
+@pytest.mark.asyncio
+async def test_s3_repository_with_stubbed_boto3_client():
+    """[S3Repository] 실제 botocore client + Stubber(네트워크 없음)"""
+    # Given
+    client = S3Clients().get()
+    repo = S3Repository(client)
+    bucket = settings.AWS_S3_BUCKET_NAME
+    with Stubber(client) as stubber:
+        stubber.add_response("head_object", {}, {"Bucket": bucket, "Key": "a.jpg"})
+        stubber.add_client_error(
+            "head_object", service_error_code="404", http_status_code=404
+        )
+        stubber.add_response("delete_object", {}, {"Bucket": bucket, "Key": "a.jpg"})
+
+        # When / Then
+        assert await repo.check_file_exists("a.jpg") is True
+        assert await repo.check_file_exists("b.jpg") is False
+        assert await repo.delete_object("a.jpg") is True
+        stubber.assert_no_pending_responses()
+
+    # presigned URL은 로컬 서명이므로 Stubber 없이 생성됨
+    result = await repo.generate_upload_url("a.jpg", "image/jpeg")
+    assert "X-Amz-Signature" in result["presigned_url"]
+    assert result["file_url"].endswith("/a.jpg")
+
+
+class FakeAioS3Client:
+    """aiobotocore S3 client 대용 (메모리 저장소)"""
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+
+    async def head_object(self, Bucket, Key):  # noqa: N803
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {}
+
+    async def put_object(self, Body, Bucket, Key, ContentType):  # noqa: N803
+        self.objects[Key] = Body
+
+    async def delete_object(self, Bucket, Key):  # noqa: N803
+        self.objects.pop(Key, None)
+
+
+@pytest.mark.asyncio
+async def test_aio_s3_repository_round_trip():
+    """[AioS3Repository] threadpool 없이 async client를 직접 호출"""
+    # Given
+    client = FakeAioS3Client()
+    repo = AioS3Repository(client)
+
+    # When
+    upload_url = await repo.generate_upload_url("images/a.jpg", "image/jpeg")
+    uploaded = await repo.upload_file_object(io.BytesIO(b"jpg"), "images/a.jpg", "x")
+    exists_after_upload = await repo.check_file_exists("images/a.jpg")
+    deleted = await repo.delete_object("images/a.jpg")
+
+    # Then
+    assert "X-Amz-Signature=" in upload_url["presigned_url"]
+    assert uploaded["s3_key"] == "images/a.jpg"
+    assert exists_after_upload is True
+    assert deleted is True
+    assert await repo.check_file_exists("images/a.jpg") is False
+
+
+def test_get_s3_repository_selects_backend(monkeypatch, mocker):
+    mocker.patch.object(s3_clients, "get", return_value=MagicMock())
+
+    monkeypatch.setattr(settings, "S3_BACKEND", "boto3")
+    assert type(get_s3_repository()) is S3Repository
+
+    monkeypatch.setattr(settings, "S3_BACKEND", "aiobotocore")
+    assert isinstance(get_s3_repository(), AioS3Repository)
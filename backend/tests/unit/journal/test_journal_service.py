@@ -3,16 +3,31 @@ from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 
-from app.features.journal.errors import ImageUploadError, JournalNotFoundError
+from app.common.errors import PermissionDeniedError
+from app.features.journal.errors import (
+    ImageUploadError,
+    JournalBadRequestError,
+    JournalImageNotFoundError,
+    JournalNotFoundError,
+)
 from app.features.journal.facade import JournalImageFacade
 from app.features.journal.models import Journal, JournalImage
-from app.features.journal.repository import JournalRepository, S3Repository
+from app.features.journal.repository import (
+    AsyncJournalRepository,
+    JournalRepository,
+    S3Repository,
+)
 from app.features.journal.schemas.requests import (
     ImageCompletionRequest,
     ImageGenerateRequest,
+    ImageUploadBatchItem,
     ImageUploadRequest,
 )
-from app.features.journal.service import JournalOpenAIService, JournalService
+from app.features.journal.service import (
+    AsyncJournalService,
+    JournalOpenAIService,
+    JournalService,
+)
 from app.features.journal.strategies import ImageStyleFactory, ImageStyleStrategy
 from app.features.user.models import User
 
@@ -24,6 +39,12 @@ def mock_journal_repo() -> Mock:
     return Mock(spec=JournalRepository)
 
 
+@pytest.fixture
+def mock_async_journal_repo() -> Mock:
+    # spec의 async 메서드는 자동으로 AsyncMock이 됩니다.
+    return Mock(spec=AsyncJournalRepository)
+
+
 @pytest.fixture
 def mock_s3_repo() -> Mock:
     repo = Mock(spec=S3Repository)
@@ -49,25 +70,32 @@ def mock_style_factory() -> Mock:
 
 
 @pytest.fixture
-def journal_service(mock_journal_repo: Mock, mock_image_facade: Mock) -> JournalService:
+def journal_service(mock_journal_repo: Mock) -> JournalService:
+    return JournalService(journal_repository=mock_journal_repo)
+
+
+@pytest.fixture
+def async_journal_service(
+    mock_async_journal_repo: Mock, mock_image_facade: Mock
+) -> AsyncJournalService:
     """
-    JournalService에는 이제 S3Repo가 아닌 Facade가 주입됩니다.
+    이미지 라우트용 AsyncJournalService에는 S3Repo가 아닌 Facade가 주입됩니다.
     """
-    return JournalService(
-        journal_repository=mock_journal_repo,
+    return AsyncJournalService(
+        journal_repository=mock_async_journal_repo,
         image_facade=mock_image_facade,
     )
 
 
 @pytest.fixture
 def journal_image_facade(
-    mock_journal_repo: Mock, mock_s3_repo: Mock
+    mock_async_journal_repo: Mock, mock_s3_repo: Mock
 ) -> JournalImageFacade:
     """
     실제 로직 테스트를 위해 Facade 인스턴스를 생성합니다. (Facade 테스트용)
     """
     return JournalImageFacade(
-        journal_repository=mock_journal_repo, s3_repository=mock_s3_repo
+        journal_repository=mock_async_journal_repo, s3_repository=mock_s3_repo
     )
 
 
@@ -140,12 +168,61 @@ def test_search_journals_success(
     mock_journal_repo.search_journals.assert_called_once()
 
 
-# --- JournalService 이미지 테스트 (Facade 위임 확인) ---
+def test_full_text_search_passes_terms_and_cursor(
+    journal_service: JournalService, mock_journal_repo: Mock
+):
+    mock_journal_repo.full_text_search.return_value = []
+    journal_service.full_text_search(
+        1, ' 산책을  "비가" 산책을 a ', limit=5, cursor="1.5:42"
+    )
+    mock_journal_repo.full_text_search.assert_called_once_with(
+        user_id=1, terms=["산책을", "비가"], limit=5, cursor=(1.5, 42)
+    )
+
+
+@pytest.mark.parametrize(
+    ("query", "cursor"), [("a   b", None), ("산책을", "oops"), ("산책을", "1.0:x")]
+)
+def test_full_text_search_bad_request(
+    journal_service: JournalService, mock_journal_repo: Mock, query, cursor
+):
+    with pytest.raises(JournalBadRequestError):
+        journal_service.full_text_search(1, query, cursor=cursor)
+    mock_journal_repo.full_text_search.assert_not_called()
+
+
+def test_get_journals_by_keywords_normalizes(
+    journal_service: JournalService, mock_journal_repo: Mock
+):
+    mock_journal_repo.get_journals_by_keywords.return_value = []
+    journal_service.get_journals_by_keywords(
+        1, [" 산책 ", "CAFÉ", "산책", " "], match_all=False, prefix=True
+    )
+    mock_journal_repo.get_journals_by_keywords.assert_called_once_with(
+        user_id=1,
+        keywords=["산책", "café"],
+        match_all=False,
+        prefix=True,
+        limit=10,
+        cursor=None,
+    )
+
+
+@pytest.mark.parametrize("keywords", [[" ", ""], [f"k{i}" for i in range(11)]])
+def test_get_journals_by_keywords_bad_request(
+    journal_service: JournalService, mock_journal_repo: Mock, keywords
+):
+    with pytest.raises(JournalBadRequestError):
+        journal_service.get_journals_by_keywords(1, keywords)
+    mock_journal_repo.get_journals_by_keywords.assert_not_called()
+
+
+# --- AsyncJournalService 이미지 테스트 (Facade 위임 확인) ---
 
 
 @pytest.mark.asyncio
 async def test_service_delegates_create_presigned_url(
-    journal_service: JournalService, mock_image_facade: Mock
+    async_journal_service: AsyncJournalService, mock_image_facade: Mock
 ):
     """
     [Service] create_image_presigned_url이 Facade를 호출하는지 테스트
@@ -155,7 +232,7 @@ async def test_service_delegates_create_presigned_url(
     mock_response = MagicMock()
     mock_image_facade.initiate_image_upload.return_value = mock_response
 
-    result = await journal_service.create_image_presigned_url(journal_id, payload)
+    result = await async_journal_service.create_image_presigned_url(journal_id, payload)
 
     mock_image_facade.initiate_image_upload.assert_awaited_once_with(
         journal_id, payload.filename, payload.content_type
@@ -165,7 +242,7 @@ async def test_service_delegates_create_presigned_url(
 
 @pytest.mark.asyncio
 async def test_service_delegates_complete_upload(
-    journal_service: JournalService, mock_image_facade: Mock
+    async_journal_service: AsyncJournalService, mock_image_facade: Mock
 ):
     """
     [Service] complete_image_upload가 Facade를 호출하는지 테스트
@@ -175,7 +252,7 @@ async def test_service_delegates_complete_upload(
     mock_image = JournalImage(id=1)
     mock_image_facade.finalize_image_upload.return_value = mock_image
 
-    result = await journal_service.complete_image_upload(journal_id, payload)
+    result = await async_journal_service.complete_image_upload(journal_id, payload)
 
     mock_image_facade.finalize_image_upload.assert_awaited_once_with(
         journal_id, payload.s3_key
@@ -189,7 +266,7 @@ async def test_service_delegates_complete_upload(
 @pytest.mark.asyncio
 async def test_facade_initiate_upload_success(
     journal_image_facade: JournalImageFacade,
-    mock_journal_repo: Mock,
+    mock_async_journal_repo: Mock,
     mock_s3_repo: Mock,
 ):
     """
@@ -199,7 +276,7 @@ async def test_facade_initiate_upload_success(
     filename = "test.jpg"
     content_type = "image/jpeg"
 
-    mock_journal_repo.get_journal_by_id.return_value = Journal(id=journal_id)
+    mock_async_journal_repo.get_journal_by_id.return_value = Journal(id=journal_id)
     mock_s3_repo.generate_upload_url.return_value = {
         "presigned_url": "http://pre",
         "file_url": "http://file",
@@ -215,18 +292,98 @@ async def test_facade_initiate_upload_success(
 
 
 @pytest.mark.asyncio
-async def test_facade_initiate_upload_not_found(
-    journal_image_facade: JournalImageFacade, mock_journal_repo: Mock
+async def test_facade_initiate_upload_skips_journal_lookup(
+    journal_image_facade: JournalImageFacade,
+    mock_async_journal_repo: Mock,
+    mock_s3_repo: Mock,
 ):
-    mock_journal_repo.get_journal_by_id.return_value = None
+    """
+    [Facade] 소유권은 라우터에서 확인하므로 initiate에서 journal을 다시 조회하지 않음
+    """
+    mock_s3_repo.generate_upload_url.return_value = {
+        "presigned_url": "http://pre",
+        "file_url": "http://file",
+    }
+
+    await journal_image_facade.initiate_image_upload(1, "t.jpg", "image/jpeg")
+
+    mock_async_journal_repo.get_journal_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_facade_initiate_uploads_batch(
+    journal_image_facade: JournalImageFacade, mock_s3_repo: Mock
+):
+    """
+    [Facade] 여러 업로드의 presigned URL을 한 번에 발급 (journal별 고유 key)
+    """
+    # Given
+    mock_s3_repo.generate_upload_url.side_effect = lambda key, _: {
+        "presigned_url": f"http://pre/{key}",
+        "file_url": f"http://file/{key}",
+    }
+    uploads = [
+        ImageUploadBatchItem(journal_id=1, filename="a.jpg", content_type="image/jpeg"),
+        ImageUploadBatchItem(journal_id=2, filename="b.png", content_type="image/png"),
+    ]
+
+    # When
+    items = await journal_image_facade.initiate_image_uploads(uploads)
+
+    # Then
+    assert [item.journal_id for item in items] == [1, 2]
+    assert items[0].s3_key.startswith("images/journals/1/")
+    assert items[1].s3_key.endswith(".png")
+    assert items[1].presigned_url == f"http://pre/{items[1].s3_key}"
+
+
+@pytest.mark.asyncio
+async def test_service_check_owned_journals(
+    async_journal_service: AsyncJournalService, mock_async_journal_repo: Mock
+):
+    """
+    [Service] 여러 journal의 소유권을 한 번의 조회로 확인
+    """
+    mock_async_journal_repo.get_journal_owners.return_value = {1: 7, 2: 8}
+
+    await async_journal_service.check_owned_journals([1], user_id=7)
+    with pytest.raises(PermissionDeniedError):
+        await async_journal_service.check_owned_journals([1, 2], user_id=7)
     with pytest.raises(JournalNotFoundError):
-        await journal_image_facade.initiate_image_upload(999, "t.jpg", "image/jpeg")
+        await async_journal_service.check_owned_journals([3], user_id=7)
+    assert mock_async_journal_repo.get_journal_owners.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_service_get_owned_journal_async(
+    async_journal_service: AsyncJournalService, mock_async_journal_repo: Mock
+):
+    """
+    [Service] 이미지 라우트의 소유권 확인도 AsyncJournalRepository로 조회
+    """
+    mock_async_journal_repo.get_journal_by_id.return_value = Journal(id=1, user_id=7)
+
+    journal = await async_journal_service.get_owned_journal(1, user_id=7)
+    with pytest.raises(PermissionDeniedError):
+        await async_journal_service.get_owned_journal(1, user_id=8)
+
+    assert journal.id == 1
+    mock_async_journal_repo.get_journal_by_id.assert_awaited_with(1)
+
+
+@pytest.mark.asyncio
+async def test_service_get_image_url_without_image(
+    async_journal_service: AsyncJournalService, mock_async_journal_repo: Mock
+):
+    mock_async_journal_repo.get_image_by_journal_id.return_value = None
+    with pytest.raises(JournalImageNotFoundError):
+        await async_journal_service.get_image_url(Journal(id=1))
 
 
 @pytest.mark.asyncio
 async def test_facade_finalize_upload_success(
     journal_image_facade: JournalImageFacade,
-    mock_journal_repo: Mock,
+    mock_async_journal_repo: Mock,
     mock_s3_repo: Mock,
 ):
     """
@@ -236,16 +393,16 @@ async def test_facade_finalize_upload_success(
     s3_key = "some/key.jpg"
 
     mock_s3_repo.check_file_exists.return_value = True
-    mock_journal_repo.get_journal_by_id.return_value = Journal(id=journal_id)
-    mock_journal_repo.get_image_by_journal_id.return_value = None
+    mock_async_journal_repo.get_journal_by_id.return_value = Journal(id=journal_id)
+    mock_async_journal_repo.get_image_by_journal_id.return_value = None
 
     expected_image = JournalImage(id=10, s3_key=s3_key)
-    mock_journal_repo.replace_journal_image.return_value = expected_image
+    mock_async_journal_repo.replace_journal_image.return_value = expected_image
 
     result = await journal_image_facade.finalize_image_upload(journal_id, s3_key)
 
     mock_s3_repo.check_file_exists.assert_awaited_once_with(s3_key)
-    mock_journal_repo.replace_journal_image.assert_called_once()
+    mock_async_journal_repo.replace_journal_image.assert_awaited_once()
     assert result == expected_image
 
 
@@ -276,9 +433,11 @@ async def test_request_image_generation_with_strategy(
     mock_structured_llm = MagicMock()
     mock_structured_llm.with_structured_output.return_value = mock_chain
     mocker.patch(
-        "app.features.journal.service.ChatOpenAI", return_value=mock_structured_llm
+        "app.features.journal.service.chat_model", return_value=mock_structured_llm
+    )
+    mocker.patch(
+        "app.features.journal.service.async_openai_client", return_value=AsyncMock()
     )
-    mocker.patch("app.features.journal.service.AsyncOpenAI", return_value=AsyncMock())
     mocker.patch(
         "app.features.journal.service._load_prompt", return_value="keyword_prompt"
     )
@@ -159,6 +159,92 @@ def test_get_top_5_value_scores(
     assert len(top_scores) == 5
 
 
+def test_create_value_scores_uses_single_insert(
+    value_score_repo, question_repo, answer_repo, db_session, query_counter
+):
+    q = question_repo.create_question(1, "single", "Q")
+    a = answer_repo.create_answer(1, q.id, "A")
+    db_session.commit()
+    rows = [
+        {
+            "user_id": 1,
+            "question_id": q.id,
+            "answer_id": a.id,
+            "category": "Extraversion",
+            "value": f"v{i}",
+            "confidence": 0.8,
+            "intensity": 0.6,
+            "polarity": 1,
+            "evidence_quotes": ["quote"],
+        }
+        for i in range(3)
+    ]
+    query_counter.clear()
+
+    value_scores = value_score_repo.create_value_scores(rows)
+
+    # executemany INSERT 한 번
+    inserts = [sql for sql in query_counter if sql.startswith("INSERT")]
+    assert len(inserts) == 1
+    assert [score.value for score in value_scores] == ["v0", "v1", "v2"]
+    stored = value_score_repo.get_top_5_value_scores(1)
+    assert len(stored) == 3
+    assert all(score.created_at is not None for score in stored)
+
+
+def test_value_scores_roll_back_with_failed_value_map_fold(
+    value_score_repo, value_map_repo, question_repo, answer_repo, db_session
+):
+    # Given: value_map이 없어서 반영이 실패하는 경우
+    q = question_repo.create_question(1, "single", "Q")
+    a = answer_repo.create_answer(1, q.id, "A")
+    db_session.commit()
+    rows = [
+        {
+            "user_id": 1,
+            "question_id": q.id,
+            "answer_id": a.id,
+            "category": "Extraversion",
+            "value": "v",
+            "confidence": 0.8,
+            "intensity": 0.6,
+            "polarity": 1,
+        }
+    ]
+
+    # When
+    value_scores = value_score_repo.create_value_scores(rows)
+    with pytest.raises(ValueError):
+        value_map_repo.update_by_value_scores(1, value_scores)
+    db_session.rollback()
+
+    # Then: INSERT도 커밋되지 않아 job 재시도 시 중복 저장되지 않음
+    assert value_score_repo.get_top_5_value_scores(1) == []
+
+
+def test_set_opposite_values(value_score_repo, question_repo, answer_repo, db_session):
+    q = question_repo.create_question(1, "single", "Q")
+    db_session.commit()
+    a = answer_repo.create_answer(1, q.id, "A")
+    db_session.commit()
+    score = value_score_repo.create_value_score(
+        user_id=1,
+        question_id=q.id,
+        answer_id=a.id,
+        category="Agreeableness",
+        value="Selfishness",
+        confidence=0.8,
+        intensity=0.6,
+        polarity=-1,
+    )
+    assert score.opposite_value is None
+
+    value_score_repo.set_opposite_values({score.id: "Altruism"})
+    db_session.expire_all()
+
+    assert value_score_repo.get_top_5_value_scores(1)[0].opposite_value == "Altruism"
+
+
 # ============================================================
 #                     ValueMap Repository
 # ============================================================
@@ -197,6 +283,103 @@ def test_update_by_value_score(
     assert updated_map.score_3 > 0
 
 
+def test_update_by_value_scores_folds_batch_in_one_update(
+    value_map_repo, value_score_repo, question_repo, answer_repo, db_session
+):
+    q = question_repo.create_question(1, "single", "Q")
+    a = answer_repo.create_answer(1, q.id, "A")
+    db_session.commit()
+    value_map_repo.create_value_map(1)
+
+    def make_score(category, intensity, polarity):
+        return value_score_repo.create_value_score(
+            user_id=1,
+            question_id=q.id,
+            answer_id=a.id,
+            category=category,
+            value="v",
+            confidence=1.0,
+            intensity=intensity,
+            polarity=polarity,
+        )
+
+    # 먼저 Agreeableness 하나 반영: (0.5 + 1) * 50 = 75
+    value_map_repo.update_by_value_scores(1, [make_score("Agreeableness", 0.5, 1)])
+    scores = [
+        make_score("Agreeableness", 0.2, -1),  # 40
+        make_score("Agreeableness", 0.0, 1),  # 50
+        make_score("Neuroticism", 0.9, 1),  # 95
+    ]
+
+    updated_map = value_map_repo.update_by_value_scores(1, scores)
+
+    # (75 * 1 + 40 + 50) // 3 = 55
+    assert (updated_map.score_3, updated_map.count_3) == (55, 3)
+    assert (updated_map.score_0, updated_map.count_0) == (95, 1)
+    assert updated_map.count_1 == 0
+
+
+def test_update_by_value_scores_skips_unknown_category(
+    value_map_repo, db_session, mocker, caplog
+):
+    value_map_repo.create_value_map(1)
+    known = mocker.Mock(category="Neuroticism", intensity=0.9, polarity=1, confidence=1)
+    unknown = mocker.Mock(category="Honesty", intensity=1, polarity=1, confidence=1)
+
+    updated_map = value_map_repo.update_by_value_scores(1, [unknown, known])
+
+    # rebuild_value_maps와 같이 경고만 남기고 나머지는 반영
+    assert (updated_map.score_0, updated_map.count_0) == (95, 1)
+    assert "Honesty" in caplog.text
+
+
+def test_update_by_value_scores_requires_value_map(value_map_repo, mocker):
+    score = mocker.Mock(category="Agreeableness", intensity=1, polarity=1, confidence=1)
+
+    with pytest.raises(ValueError):
+        value_map_repo.update_by_value_scores(1, [score])
+
+
+def test_rebuild_value_maps(
+    value_map_repo, value_score_repo, question_repo, answer_repo, db_session
+):
+    # Given: user 1은 map이 어긋나 있고, user 2는 map이 없음, user 3은 점수가 없음
+    q = question_repo.create_question(1, "single", "Q")
+    a = answer_repo.create_answer(1, q.id, "A")
+    db_session.commit()
+    stale_map = value_map_repo.create_value_map(1)
+    stale_map.score_4, stale_map.count_4 = 99, 9
+    value_map_repo.create_value_map(3).count_0 = 2
+    db_session.commit()
+    for user_id, category, intensity in [
+        (1, "Openness to Experience", 0.4),  # 70
+        (1, "Openness to Experience", 0.0),  # 50
+        (2, "Extraversion", 0.8),  # 90
+    ]:
+        value_score_repo.create_value_score(
+            user_id=user_id,
+            question_id=q.id,
+            answer_id=a.id,
+            category=category,
+            value="v",
+            confidence=1.0,
+            intensity=intensity,
+            polarity=1,
+        )
+
+    # When
+    rebuilt = value_map_repo.rebuild_value_maps(batch_size=1)
+    db_session.expire_all()
+
+    # Then
+    assert rebuilt == 3
+    first, second, third = (value_map_repo.get_by_user(i) for i in (1, 2, 3))
+    assert (first.score_2, first.count_2) == (60, 2)
+    assert (first.score_4, first.count_4) == (0, 0)
+    assert (second.score_1, second.count_1) == (90, 1)
+    assert third.count_0 == 0
+
+
 def test_generate_comment(value_map_repo, db_session):
     vm = value_map_repo.create_value_map(1)  # noqa: F841
 
@@ -1,5 +1,10 @@
 import pytest
+from langchain_core.runnables import RunnableLambda
 
+from app.features.selfaware.prompt import (
+    MultiValueScoreStructure,
+    ValueScoreStructure,
+)
 from app.features.selfaware.service import (
     AnswerService,
     QuestionService,
@@ -48,7 +53,11 @@ def mock_value_score_repo(mocker):
         mocker.Mock(polarity=1, value="친절", intensity=90, category="Neuroticism"),
         mocker.Mock(polarity=1, value="사교성", intensity=90, category="Extraversion"),
         mocker.Mock(
-            polarity=-1, value="이기성", intensity=85, category="Openness to Experience"
+            polarity=-1,
+            value="이기성",
+            intensity=85,
+            category="Openness to Experience",
+            opposite_value="이타성",
         ),
         mocker.Mock(polarity=1, value="진취성", intensity=80, category="Agreeableness"),
         mocker.Mock(polarity=0, value="공상", intensity=75, category="성실성"),
@@ -143,6 +152,51 @@ def test_extract_value_score_from_answer(value_score_service):
         assert isinstance(result_element.evidence, str)
 
 
+def test_extract_value_score_saves_scores_in_one_batch(
+    value_score_service, mock_value_score_repo, mock_value_map_repo, mocker
+):
+    # Given: LLM이 두 개의 value를 반환 (하나는 polarity -1)
+    detected = [
+        ValueScoreStructure(
+            value="이기성",
+            category_key="Agreeableness",
+            confidence=0.9,
+            intensity=0.7,
+            polarity=-1,
+            evidence="내가 먼저",
+        ),
+        ValueScoreStructure(
+            value="성취",
+            category_key="Conscientiousness",
+            confidence=0.8,
+            intensity=0.6,
+            polarity=1,
+            evidence="증명",
+        ),
+    ]
+    llm = mocker.Mock()
+    llm.with_structured_output.return_value = RunnableLambda(
+        lambda _: MultiValueScoreStructure(detected_values=detected)
+    )
+    mocker.patch("app.features.selfaware.service.chat_model", return_value=llm)
+    mocker.patch.object(
+        value_score_service, "_get_opposite_values", return_value=["이타성"]
+    )
+
+    # When
+    value_score_service.extract_value_score_from_answer(1, 2, 3)
+
+    # Then: INSERT/value map 반영이 한 번씩만 호출
+    mock_value_score_repo.create_value_scores.assert_called_once()
+    rows = mock_value_score_repo.create_value_scores.call_args.args[0]
+    assert [row["opposite_value"] for row in rows] == ["이타성", None]
+    assert rows[0]["answer_id"] == 3
+    mock_value_score_repo.create_value_score.assert_not_called()
+    mock_value_map_repo.update_by_value_scores.assert_called_once_with(
+        1, mock_value_score_repo.create_value_scores.return_value
+    )
+
+
 def test_get_top_value_scores(value_score_service):
     result = value_score_service.get_top_value_scores(1)
     for result_element in result:
@@ -151,6 +205,56 @@ def test_get_top_value_scores(value_score_service):
     assert len(result) == 4
 
 
+def test_get_top_value_scores_reads_stored_opposite_value(
+    value_score_service, mock_value_score_repo, mocker
+):
+    # Given: 저장된 opposite_value가 있으면 LLM을 호출하지 않음
+    get_opposite_values = mocker.patch.object(
+        value_score_service, "_get_opposite_values"
+    )
+
+    # When
+    result = value_score_service.get_top_value_scores(1)
+
+    # Then
+    assert {"value": "이타성", "intensity": 85} in result
+    get_opposite_values.assert_not_called()
+
+
+def test_get_top_value_scores_memoizes_missing_opposite_value(
+    value_score_service, mock_value_score_repo, mocker
+):
+    # Given: 이전 데이터처럼 opposite_value가 비어 있는 항목
+    mock_value_score_repo.get_top_5_value_scores.return_value = [
+        mocker.Mock(
+            id=7,
+            polarity=-1,
+            value="이기성",
+            intensity=85,
+            category="Agreeableness",
+            opposite_value=None,
+        ),
+        mocker.Mock(
+            id=8,
+            polarity=-1,
+            value="게으름",
+            intensity=80,
+            category="Conscientiousness",
+            opposite_value=None,
+        ),
+    ]
+    mocker.patch.object(
+        value_score_service, "_get_opposite_values", return_value=["이타성", None]
+    )
+
+    # When
+    result = value_score_service.get_top_value_scores(1)
+
+    # Then: 얻은 값만 저장하고, 실패한 항목은 제외
+    assert result == [{"value": "이타성", "intensity": 85}]
+    mock_value_score_repo.set_opposite_values.assert_called_once_with({7: "이타성"})
+
+
 def test_generate_comment(value_map_service):
     result = value_map_service.generate_comment(1)
     assert isinstance(result[0], str)
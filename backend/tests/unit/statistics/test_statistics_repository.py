@@ -1,6 +1,16 @@
+import unicodedata
 from datetime import date, datetime, timedelta
 
-from app.features.journal.models import Journal, JournalEmotion
+import pytest
+from sqlalchemy import select
+
+from app.features.journal.models import Journal, JournalEmotion, JournalKeyword
+from app.features.journal.repository import AsyncJournalRepository, JournalRepository
+from app.features.journal.schemas.responses import KeywordEmotionAssociationItem
+from app.features.statistics.models import (
+    EmotionDailyRollup,
+    KeywordEmotionDailyRollup,
+)
 from app.features.statistics.repository import StatisticsRepository
 from app.features.user.models import User
 
@@ -78,6 +88,8 @@ def test_get_emotion_counts(db_session, test_user):
     db_session.add(emotion_other)
 
     db_session.commit()
+    # 리포지토리를 거치지 않고 넣은 데이터이므로 rollup을 backfill
+    repo.rebuild_emotion_rollups()
 
     # Act: 해당 날짜(target_date) 하루 동안의 통계 조회
     results, total_count = repo.get_emotion_counts(
@@ -92,3 +104,282 @@ def test_get_emotion_counts(db_session, test_user):
     assert result_dict["happy"] == 4
     assert result_dict["sad"] == 3
     assert "anxious" not in result_dict
+
+
+def test_emotion_rollups_follow_journal_create_and_delete(db_session, test_user):
+    """journal 생성/삭제 시 rollup이 같은 트랜잭션에서 증분 갱신되는지"""
+    # Given
+    journal_repo = JournalRepository(db_session)
+    repo = StatisticsRepository(db_session)
+    first = journal_repo.add_journal(test_user.id, "t1", "c", {"happy": 4, "sad": 1})
+    journal_repo.add_journal(test_user.id, "t2", "c", {"happy": 2})
+    today = first.created_at.date()
+
+    # When
+    _, total_after_create = repo.get_emotion_counts(test_user.id, today, today)
+    journal_repo.delete_journal(first)
+    db_session.flush()
+    results, total_after_delete = repo.get_emotion_counts(test_user.id, today, today)
+
+    # Then
+    assert total_after_create == 7
+    assert total_after_delete == 2
+    assert {row.emotion: row.count for row in results} == {"happy": 2}
+    rollups = db_session.scalars(select(EmotionDailyRollup)).all()
+    assert [(r.emotion, r.intensity_sum, r.journal_count) for r in rollups] == [
+        ("happy", 2, 1)
+    ]
+
+
+def test_rebuild_emotion_rollups_groups_by_day(db_session, test_user):
+    """backfill은 (user, 날짜, 감정)별 합계와 journal 수를 다시 계산"""
+    # Given
+    for hour, intensity in ((9, 3), (21, 2)):
+        db_session.add(
+            Journal(
+                user_id=test_user.id,
+                title="t",
+                content="c",
+                created_at=datetime(2025, 3, 1, hour),
+                emotions=[JournalEmotion(emotion="calm", intensity=intensity)],
+            )
+        )
+    db_session.add(
+        EmotionDailyRollup(
+            user_id=test_user.id,
+            day=date(2024, 1, 1),
+            emotion="stale",
+            intensity_sum=9,
+            journal_count=1,
+        )
+    )
+    db_session.commit()
+
+    # When
+    rebuilt = StatisticsRepository(db_session).rebuild_emotion_rollups(batch_size=1)
+
+    # Then
+    rollups = db_session.scalars(select(EmotionDailyRollup)).all()
+    assert rebuilt == 1
+    assert [(r.day, r.emotion, r.intensity_sum, r.journal_count) for r in rollups] == [
+        (date(2025, 3, 1), "calm", 5, 2)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_journal_repository_maintains_rollups(async_db_session):
+    # Given
+    journal_repo = AsyncJournalRepository(async_db_session)
+    journal = await journal_repo.add_journal(1, "t", "c", {"anxious": 3})
+    rollups = select(EmotionDailyRollup.emotion, EmotionDailyRollup.intensity_sum)
+
+    # When
+    after_create = (await async_db_session.execute(rollups)).all()
+    await journal_repo.delete_journal(journal)
+    after_delete = (await async_db_session.execute(rollups)).all()
+
+    # Then
+    assert after_create == [("anxious", 3)]
+    assert after_delete == []
+
+
+def _associations(*items: tuple[str, str, float]):
+    return [
+        KeywordEmotionAssociationItem(
+            keyword=keyword, emotion=emotion, summary="s", weight=weight
+        )
+        for keyword, emotion, weight in items
+    ]
+
+
+def _keyword_rollups(db_session) -> list[tuple]:
+    rollups = db_session.scalars(
+        select(KeywordEmotionDailyRollup).order_by(
+            KeywordEmotionDailyRollup.keyword, KeywordEmotionDailyRollup.emotion
+        )
+    ).all()
+    return [
+        (r.keyword, r.emotion, round(r.weight_sum, 6), r.journal_count) for r in rollups
+    ]
+
+
+def test_keyword_rollups_follow_keyword_changes(db_session, test_user):
+    """키워드 저장/교체/journal 삭제 시 키워드 rollup이 증분 갱신되는지"""
+    # Given
+    journal_repo = JournalRepository(db_session)
+    first = journal_repo.add_journal(test_user.id, "t1", "c", {"happy": 3})
+    second = journal_repo.add_journal(test_user.id, "t2", "c", {"happy": 3})
+
+    # When: 저장
+    journal_repo.add_keywords_emotion_associations(
+        first.id, _associations(("산책", "happy", 0.8), ("회사", "anxious", 0.6))
+    )
+    journal_repo.add_keywords_emotion_associations(
+        second.id, _associations(("산책", "calm", 0.5))
+    )
+    after_add = _keyword_rollups(db_session)
+    # When: 첫 journal 키워드 재분석(교체)
+    journal_repo.add_keywords_emotion_associations(
+        first.id, _associations(("산책", "happy", 0.4))
+    )
+    after_replace = _keyword_rollups(db_session)
+    # When: 두 번째 journal 삭제
+    journal_repo.delete_journal(second)
+    db_session.commit()
+
+    # Then
+    assert after_add == [
+        ("산책", "calm", 0.5, 1),
+        ("산책", "happy", 0.8, 1),
+        ("회사", "anxious", 0.6, 1),
+    ]
+    assert after_replace == [("산책", "calm", 0.5, 1), ("산책", "happy", 0.4, 1)]
+    assert _keyword_rollups(db_session) == [("산책", "happy", 0.4, 1)]
+
+
+def test_get_keyword_emotion_stats(db_session, test_user):
+    """기간 내 많이 나온 키워드 limit개를 감정별로 합산 (키워드 빈도 순)"""
+    # Given
+    for day, keyword, emotion, weight, count in (
+        (date(2025, 3, 1), "산책", "happy", 1.5, 2),
+        (date(2025, 3, 2), "산책", "calm", 0.5, 1),
+        (date(2025, 3, 2), "회사", "anxious", 1.8, 2),
+        (date(2025, 3, 2), "커피", "happy", 0.9, 1),
+        (date(2025, 4, 1), "커피", "happy", 5.0, 9),
+    ):
+        db_session.add(
+            KeywordEmotionDailyRollup(
+                user_id=test_user.id,
+                day=day,
+                keyword=keyword,
+                emotion=emotion,
+                weight_sum=weight,
+                journal_count=count,
+            )
+        )
+    db_session.commit()
+
+    # When
+    rows = StatisticsRepository(db_session).get_keyword_emotion_stats(
+        test_user.id, date(2025, 3, 1), date(2025, 3, 31), limit=2
+    )
+
+    # Then
+    assert [(r.keyword, r.emotion, r.count, r.weight) for r in rows] == [
+        ("산책", "happy", 2, 1.5),
+        ("산책", "calm", 1, 0.5),
+        ("회사", "anxious", 2, 1.8),
+    ]
+
+
+def test_rebuild_keyword_rollups_matches_incremental(db_session, test_user):
+    """backfill 결과가 증분으로 갱신한 rollup과 같은지"""
+    # Given
+    journal_repo = JournalRepository(db_session)
+    for keywords in (
+        [("산책", "happy", 0.8), ("회사", "anxious", 0.6)],
+        [("산책", "happy", 0.3)],
+    ):
+        journal = journal_repo.add_journal(test_user.id, "t", "c", {"happy": 1})
+        journal_repo.add_keywords_emotion_associations(
+            journal.id, _associations(*keywords)
+        )
+    db_session.commit()
+    incremental = _keyword_rollups(db_session)
+
+    # When
+    rebuilt = StatisticsRepository(db_session).rebuild_keyword_rollups(batch_size=1)
+
+    # Then
+    assert rebuilt == 2
+    assert (
+        _keyword_rollups(db_session)
+        == incremental
+        == [
+            ("산책", "happy", 1.1, 2),
+            ("회사", "anxious", 0.6, 1),
+        ]
+    )
+
+
+def test_rebuild_keyword_rollups_from_raw_keywords(db_session, test_journal):
+    """rollup 도입 전 journal_keywords도 날짜별로 집계 (fixture는 직접 insert)"""
+    # Given
+    db_session.add(
+        JournalKeyword(
+            journal_id=test_journal.id,
+            keyword=" Keyword1 ",
+            emotion="happy",
+            summary="s",
+            weight=0.1,
+        )
+    )
+    db_session.commit()
+
+    # When
+    StatisticsRepository(db_session).rebuild_keyword_rollups()
+    day = test_journal.created_at.date()
+    rows = StatisticsRepository(db_session).get_keyword_emotion_stats(
+        test_journal.user_id, day, day
+    )
+
+    # Then
+    assert [(r.keyword, r.emotion, r.count, round(r.weight, 6)) for r in rows] == [
+        ("keyword1", "happy", 2, 1.0),
+        ("keyword2", "anxious", 1, 0.5),
+    ]
+
+
+def test_rebuild_keyword_rollups_uses_normalize_keyword(db_session, test_user):
+    """NFD 한글, 탭 공백 키워드도 저장할 때와 같은 키로 집계"""
+    # Given
+    journal_repo = JournalRepository(db_session)
+    journal = journal_repo.add_journal(test_user.id, "t", "c", {"happy": 1})
+    journal_repo.add_keywords_emotion_associations(
+        journal.id,
+        _associations(
+            (unicodedata.normalize("NFD", "산책"), "happy", 0.8),
+            ("\t산책 ", "happy", 0.2),
+        ),
+    )
+    db_session.commit()
+    incremental = _keyword_rollups(db_session)
+
+    # When
+    rebuilt = StatisticsRepository(db_session).rebuild_keyword_rollups()
+
+    # Then
+    assert rebuilt == 1
+    assert _keyword_rollups(db_session) == incremental == [("산책", "happy", 1.0, 2)]
+
+
+@pytest.mark.asyncio
+async def test_async_journal_repository_maintains_keyword_rollups(async_db_session):
+    # Given
+    journal_repo = AsyncJournalRepository(async_db_session)
+    journal = await journal_repo.add_journal(1, "t", "c", {"happy": 3})
+    rollups = select(
+        KeywordEmotionDailyRollup.keyword,
+        KeywordEmotionDailyRollup.emotion,
+        KeywordEmotionDailyRollup.journal_count,
+        KeywordEmotionDailyRollup.weight_sum,
+    )
+
+    # When
+    await journal_repo.add_keywords_emotion_associations(
+        journal.id, _associations(("산책", "happy", 0.7), ("비", "sad", 0.2))
+    )
+    await journal_repo.add_keywords_emotion_associations(
+        journal.id, _associations(("산책", "happy", 0.9))
+    )
+    after_replace = (await async_db_session.execute(rollups)).all()
+    loaded = await journal_repo.get_journal_by_id(journal.id)
+    await journal_repo.delete_journal(loaded)
+    after_delete = (await async_db_session.execute(rollups)).all()
+
+    # Then
+    assert [(r.keyword, r.emotion, r.journal_count) for r in after_replace] == [
+        ("산책", "happy", 1)
+    ]
+    assert after_replace[0].weight_sum == pytest.approx(0.9)
+    assert after_delete == []
@@ -8,6 +8,7 @@ from app.features.statistics.service import StatisticsService
 
 # Repository 결과 모킹을 위한 간단한 namedtuple
 MockRow = namedtuple("MockRow", ["emotion", "count"])
+KeywordRow = namedtuple("KeywordRow", ["keyword", "emotion", "count", "weight"])
 
 
 @pytest.fixture
@@ -64,3 +65,40 @@ def test_get_emotion_rates_empty(stats_service, mock_stats_repo):
     # Assert
     assert response["total_count"] == 0
     assert response["statistics"] == []
+
+
+def test_get_keyword_stats_groups_by_keyword(stats_service, mock_stats_repo):
+    # Arrange: Repository는 키워드 빈도 순, 키워드 안에서는 weight 순으로 반환
+    mock_stats_repo.get_keyword_emotion_stats.return_value = [
+        KeywordRow(keyword="산책", emotion="happy", count=2, weight=1.5),
+        KeywordRow(keyword="산책", emotion="calm", count=1, weight=0.5),
+        KeywordRow(keyword="회사", emotion="anxious", count=1, weight=0.0),
+    ]
+
+    # Act
+    response = stats_service.get_keyword_stats(
+        1, date(2025, 1, 1), date(2025, 1, 31), limit=2
+    )
+
+    # Assert
+    mock_stats_repo.get_keyword_emotion_stats.assert_called_once_with(
+        1, date(2025, 1, 1), date(2025, 1, 31), 2
+    )
+    walk, work = response["keywords"]
+    assert walk["keyword"] == "산책"
+    assert walk["count"] == 3
+    # 감정 비율은 weight 합 기준: 1.5 / 2.0 = 75%
+    assert [(e["emotion"], e["percentage"]) for e in walk["emotions"]] == [
+        ("happy", 75.0),
+        ("calm", 25.0),
+    ]
+    assert work["count"] == 1
+    assert work["emotions"][0]["percentage"] == 0.0
+
+
+def test_get_keyword_stats_empty(stats_service, mock_stats_repo):
+    mock_stats_repo.get_keyword_emotion_stats.return_value = []
+
+    response = stats_service.get_keyword_stats(1, date(2025, 1, 1), date(2025, 1, 31))
+
+    assert response == {"keywords": []}
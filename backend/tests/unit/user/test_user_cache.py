@@ -0,0 +1,82 @@
+from datetime import date
+
+from app.features.user.cache import InMemoryUserCacheBackend, UserCache
+from app.features.user.models import User
+
+
+def make_user(login_id: str) -> User:
+    return User(
+        id=1,
+        login_id=login_id,
+        hashed_password="pwd",
+        username="Cached",
+        gender="Female",
+        birthdate=date(2000, 1, 1),
+        appearance=None,
+    )
+
+
+def test_user_cache_hit_and_miss_counters():
+    # Given
+    cache = UserCache(InMemoryUserCacheBackend(max_size=10), ttl_seconds=60)
+    cache.set(make_user("a"))
+
+    # When
+    hit = cache.get("a")
+    miss = cache.get("b")
+
+    # Then
+    assert hit.login_id == "a"
+    assert hit.birthdate == date(2000, 1, 1)
+    assert miss is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+
+def test_user_cache_does_not_store_hashed_password():
+    # Given
+    backend = InMemoryUserCacheBackend(max_size=10)
+    cache = UserCache(backend, ttl_seconds=60)
+
+    # When
+    cache.set(make_user("a"))
+
+    # Then
+    assert "hashed_password" not in backend.get("a")
+
+
+def test_user_cache_evicts_least_recently_used():
+    # Given: 최대 2개, a를 다시 조회해서 b가 가장 오래된 항목이 됨
+    cache = UserCache(InMemoryUserCacheBackend(max_size=2), ttl_seconds=60)
+    cache.set(make_user("a"))
+    cache.set(make_user("b"))
+    cache.get("a")
+
+    # When
+    cache.set(make_user("c"))
+
+    # Then
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_user_cache_expires_after_ttl(mocker):
+    # Given
+    now = mocker.patch("app.common.ttl_cache.time.monotonic", return_value=100.0)
+    cache = UserCache(InMemoryUserCacheBackend(max_size=10), ttl_seconds=60)
+    cache.set(make_user("a"))
+
+    # When
+    now.return_value = 161.0
+
+    # Then
+    assert cache.get("a") is None
+
+
+def test_user_cache_disabled_with_zero_ttl():
+    cache = UserCache(InMemoryUserCacheBackend(max_size=10), ttl_seconds=0)
+    cache.set(make_user("a"))
+
+    assert cache.get("a") is None
+    assert cache.stats()["enabled"] is False
@@ -1,7 +1,9 @@
 from datetime import date
 
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
+from app.features.user.cache import user_cache
 from app.features.user.models import User
 from app.features.user.repository import UserRepository
 
@@ -83,3 +85,85 @@ def test_update_me_repository(db_session: Session):
     assert user.gender == "Male"  # 변경되지 않음
     assert user.hashed_password != "old_hash"
     assert user.hashed_password != "NewPassword!"
+
+
+def test_get_cached_user_by_login_id_skips_db_on_hit(
+    db_session: Session, query_counter: list[str]
+):
+    # Arrange: 첫 조회로 캐시를 채운 뒤, 새 세션처럼 identity map을 비웁니다.
+    repo = UserRepository(db_session)
+    user = User(
+        login_id="cached_user",
+        hashed_password="pwd",
+        username="Cached",
+        gender="Female",
+        birthdate=date(2001, 1, 1),
+    )
+    db_session.add(user)
+    db_session.commit()
+    user_id = user.id
+    repo.get_cached_user_by_login_id("cached_user")
+    db_session.expunge_all()
+    query_counter.clear()
+    hits_before = user_cache.hits
+
+    # Act
+    found_user = repo.get_cached_user_by_login_id("cached_user")
+
+    # Assert: SELECT 없이 현재 세션에 붙은 User를 반환
+    assert query_counter == []
+    assert found_user.id == user_id
+    assert found_user.birthdate == date(2001, 1, 1)
+    assert found_user in db_session
+    assert user_cache.hits == hits_before + 1
+
+
+def test_update_me_invalidates_user_cache(db_session: Session):
+    # Arrange
+    repo = UserRepository(db_session)
+    user = User(
+        login_id="stale_user",
+        hashed_password="pwd",
+        username="Before",
+        gender="Male",
+        birthdate=date(1990, 1, 1),
+    )
+    db_session.add(user)
+    db_session.commit()
+    cached = repo.get_cached_user_by_login_id("stale_user")
+
+    # Act
+    repo.update_me(user=cached, username="After")
+    db_session.commit()
+    db_session.expunge_all()
+    found_user = repo.get_cached_user_by_login_id("stale_user")
+
+    # Assert
+    assert found_user.username == "After"
+    assert user_cache.get("stale_user").username == "After"
+
+
+def test_get_hashed_password_reads_db_for_cached_user(db_session: Session):
+    # Arrange: 다른 worker가 비밀번호를 바꿔 이 프로세스의 캐시는 비워지지 않은 상황
+    repo = UserRepository(db_session)
+    user = User(
+        login_id="password_user",
+        hashed_password="old_hash",
+        username="Cached",
+        gender="Female",
+        birthdate=date(2001, 1, 1),
+    )
+    db_session.add(user)
+    db_session.commit()
+    repo.get_cached_user_by_login_id("password_user")
+    db_session.execute(
+        update(User).where(User.id == user.id).values(hashed_password="new_hash")
+    )
+    db_session.commit()
+    db_session.expunge_all()
+
+    # Act
+    cached = repo.get_cached_user_by_login_id("password_user")
+
+    # Assert
+    assert repo.get_hashed_password(cached.id) == "new_hash"
@@ -31,6 +31,21 @@ def test_get_user_by_login_id(user_service, mock_user_repository):
     mock_user_repository.get_user_by_login_id.assert_called_once_with(login_id)
 
 
+def test_get_authenticated_user_uses_cached_lookup(user_service, mock_user_repository):
+    # Arrange
+    expected_user = User(login_id="test_user")
+    mock_user_repository.get_cached_user_by_login_id.return_value = expected_user
+
+    # Act
+    result = user_service.get_authenticated_user("test_user")
+
+    # Assert
+    assert result == expected_user
+    mock_user_repository.get_cached_user_by_login_id.assert_called_once_with(
+        "test_user"
+    )
+
+
 def test_update_me_success(user_service, mock_user_repository):
     # Arrange
     user = User(id=1, username="old_name")
@@ -74,9 +89,10 @@ def test_update_me_no_fields(user_service, mock_user_repository):
     mock_user_repository.update_me.assert_not_called()
 
 
-def test_is_my_password_true(user_service, mocker):
+def test_is_my_password_true(user_service, mock_user_repository, mocker):
     # Arrange
-    user = User(hashed_password="hashed_secret")
+    user = User(id=1)
+    mock_user_repository.get_hashed_password.return_value = "hashed_secret"
     current_password = "secret"
     mock_verify = mocker.patch(
         "app.features.user.service.verify_password", return_value=True
@@ -87,12 +103,14 @@ def test_is_my_password_true(user_service, mocker):
 
     # Assert
     assert result is True
-    mock_verify.assert_called_once_with(current_password, user.hashed_password)
+    mock_user_repository.get_hashed_password.assert_called_once_with(1)
+    mock_verify.assert_called_once_with(current_password, "hashed_secret")
 
 
-def test_is_my_password_false(user_service, mocker):
+def test_is_my_password_false(user_service, mock_user_repository, mocker):
     # Arrange
-    user = User(hashed_password="hashed_secret")
+    user = User(id=1)
+    mock_user_repository.get_hashed_password.return_value = "hashed_secret"
     current_password = "wrong_secret"
     mock_verify = mocker.patch(
         "app.features.user.service.verify_password", return_value=False
@@ -102,7 +120,8 @@ def test_is_my_password_false(user_service, mocker):
 
     # Assert
     assert result is False
-    mock_verify.assert_called_once_with(current_password, user.hashed_password)
+    mock_user_repository.get_hashed_password.assert_called_once_with(1)
+    mock_verify.assert_called_once_with(current_password, "hashed_secret")
 
 
 def test_update_password_success(user_service, mock_user_repository):